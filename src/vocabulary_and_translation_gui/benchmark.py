@@ -0,0 +1,459 @@
+"""
+Benchmarks for the spelling, translation and export functions.
+
+The benchmarks run without internet connection: DeepL is replaced by an
+offline translator, which returns the text with the target language after
+an optional delay, and all message boxes are answered automatically. The
+delay is the same for every translation, or the translations take as long
+as the requests recorded in a DeepL cassette, one after the other. The
+phrases and word lists are generated from the dictionaries in the resources
+folder with a fixed seed, so two runs measure the same work.
+
+The results are written to a JSON file. If a baseline file of an earlier
+run is given, every benchmark that got slower by more than the tolerance is
+reported and the command fails.
+
+Usage:
+$ python -m vocabulary_and_translation_gui.benchmark --output new.json
+$ python -m vocabulary_and_translation_gui.benchmark --baseline old.json
+$ python -m vocabulary_and_translation_gui.benchmark --cassette deepl.json
+
+Functions:
+- generate_phrases(dictionary_language, count, length, seed)
+- generate_word_list(count, seed)
+- offline_translator(latency, cassette)
+- run_benchmarks(sizes, repeat, latency, directory, cassette)
+- compare_results(results, baseline, tolerance)
+- write_results(results, path)
+- read_results(path)
+- main(argv)
+"""
+
+import argparse
+import contextlib
+import datetime
+import deepl
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+import tkinter as tk
+from types import SimpleNamespace
+from unittest import mock
+from vocabulary_and_translation_gui import (
+    interface_and_features,
+    save_list,
+    translation_and_spelling
+)
+from vocabulary_and_translation_gui.config import BLD
+from vocabulary_and_translation_gui.deepl_cassette import (
+    recorded_latencies
+)
+from vocabulary_and_translation_gui.dictionary_manager import (
+    read_dictionary_words
+)
+from vocabulary_and_translation_gui.interface_and_features import (
+    handle_add_to_list
+)
+from vocabulary_and_translation_gui.save_list import (
+    save_list_as_apkg,
+    save_list_as_xlsx
+)
+from vocabulary_and_translation_gui.translation_and_spelling import (
+    check_spelling,
+    correct_spelling_mistakes
+)
+from vocabulary_and_translation_gui.translation_prefetch import (
+    clear_translations
+)
+from vocabulary_and_translation_gui.vocabulary_index import clear_index
+from vocabulary_and_translation_gui.vocabulary_view import VocabularyView
+
+# Number of entries of the saved word lists
+SIZES = (10, 1000, 100000, 1000000)
+
+# Number of words of the checked phrases
+PHRASE_LENGTHS = (1, 5, 20)
+
+# Number of words added with handle_add_to_list
+ADDED_WORDS = 100
+
+# Default path of the results
+RESULTS = BLD.joinpath("benchmarks", "results.json")
+
+# Dictionaries and languages of the generated words, English words are used
+# for a language without shipped dictionary
+CORPORA = {"English": "en_GB", "Deutsch": "de_DE", "Türkçe": "tr_TR"}
+
+# Words of each dictionary, read on first use
+_words = {}
+
+
+def generate_phrases(dictionary_language="de_DE", count=100, length=5,
+                     seed=0):
+    """
+    Generate phrases from the words of a shipped dictionary.
+
+    Args:
+    - dictionary_language (str): Abbreviation of the dictionary, e.g. "en_GB".
+    - count (int): Number of phrases.
+    - length (int): Number of words of each phrase.
+    - seed (int): Seed of the random generator.
+
+    Returns:
+    - list: The phrases, the same for the same arguments.
+    """
+    words = _get_words(dictionary_language)
+    generator = random.Random(seed)
+    return [" ".join(generator.choices(words, k=length))
+            for _ in range(count)]
+
+
+def generate_word_list(count=1000, seed=0):
+    """
+    Generate a vocabulary list from the words of the shipped dictionaries.
+
+    The English, German and Turkish words of an entry are random words of
+    the dictionaries. The entries are unique and one minute apart.
+
+    Args:
+    - count (int): Number of entries.
+    - seed (int): Seed of the random generator.
+
+    Returns:
+    - list: The entries with English, German and Turkish words and a
+    timestamp.
+    """
+    generator = random.Random(seed)
+    columns = []
+    for dictionary_language in CORPORA.values():
+        words = list(_get_words(dictionary_language))
+        generator.shuffle(words)
+        columns.append(words)
+
+    start = datetime.datetime(2023, 1, 1)
+    word_list = []
+    for i in range(count):
+        # A number is added once all words of a dictionary are used
+        entry = [words[i % len(words)] if i < len(words)
+                 else f"{words[i % len(words)]} {i // len(words)}"
+                 for words in columns]
+        entry.append(start + datetime.timedelta(minutes=i))
+        word_list.append(entry)
+    return word_list
+
+
+@contextlib.contextmanager
+def offline_translator(latency=0.0, cassette=None):
+    """
+    Replace DeepL and the message boxes while the block runs.
+
+    The translation of a text is the text followed by the target language,
+    e.g. "Haus (EN-GB)". Questions are answered with yes, except the question
+    to add a word to the personal dictionary.
+
+    Args:
+    - latency (float): Seconds each translation takes.
+    - cassette (str): Path of a DeepL cassette. If given, the translations
+    take the recorded times of its requests in turn instead of latency.
+
+    Returns:
+    - contextlib.AbstractContextManager: The context manager.
+    """
+    latencies = itertools.cycle(recorded_latencies(cassette)
+                                if cassette is not None else [latency])
+    lock = threading.Lock()
+
+    class OfflineTranslator:
+        def __init__(self, auth_key="", **kwargs):
+            pass
+
+        def translate_text(self, text, source_lang=None, target_lang=None,
+                           **kwargs):
+            # The translations are requested from several threads
+            with lock:
+                seconds = next(latencies, 0.0)
+            if seconds > 0:
+                time.sleep(seconds)
+            return SimpleNamespace(text=f"{text} ({target_lang})",
+                                   detected_source_lang=source_lang or "DE")
+
+    answers = SimpleNamespace(
+        showinfo=lambda **kwargs: "ok",
+        showwarning=lambda **kwargs: "ok",
+        showerror=lambda **kwargs: "ok",
+        askyesno=lambda title="", **kwargs: not title.startswith("Always"),
+        askyesnocancel=lambda **kwargs: True,
+        askretrycancel=lambda **kwargs: False)
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch.object(deepl, "Translator",
+                                              OfflineTranslator))
+        for module in (translation_and_spelling, save_list,
+                       interface_and_features):
+            stack.enter_context(mock.patch.object(module, "messagebox",
+                                                  answers))
+        yield
+
+
+def run_benchmarks(sizes=SIZES, repeat=3, latency=0.0, directory=None,
+                   cassette=None):
+    """
+    Run all benchmarks offline.
+
+    Each benchmark is run repeat times and the fastest run is kept. Word
+    lists with 100,000 entries or more are only saved once.
+
+    Args:
+    - sizes (list): Numbers of entries of the saved word lists.
+    - repeat (int): Number of runs of each benchmark.
+    - latency (float): Seconds each translation takes.
+    - directory (str): Folder for the saved files. If None, a temporary
+    folder is used.
+    - cassette (str): Path of a DeepL cassette whose recorded times are
+    used instead of latency.
+
+    Returns:
+    - dict: The results with the keys "created", "python", "platform" and
+    "benchmarks". Each benchmark has the keys "seconds" (fastest run),
+    "mean", "runs" and "items", or "skipped" with the reason.
+    """
+    benchmarks = {}
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(offline_translator(latency, cassette))
+        if directory is None:
+            directory = stack.enter_context(tempfile.TemporaryDirectory())
+
+        # Check the spelling of correct phrases and of phrases with one
+        # misspelled word
+        for length in PHRASE_LENGTHS:
+            phrases = generate_phrases("de_DE", 100, length)
+            benchmarks[f"check_spelling/{length}_words"] = _measure(
+                lambda: [check_spelling(phrase, "Deutsch")
+                         for phrase in phrases], repeat, len(phrases))
+            misspelled = [_misspell(phrase, seed)
+                          for seed, phrase in enumerate(phrases)]
+            benchmarks[f"check_spelling/{length}_words_misspelled"] = (
+                _measure(lambda: [check_spelling(phrase, "Deutsch")
+                                  for phrase in misspelled],
+                         repeat, len(misspelled)))
+
+        # Check single words that are spelled correctly and misspelled
+        words = generate_phrases("de_DE", 1000, 1, seed=1)
+        benchmarks["correct_spelling_mistakes/hit"] = _measure(
+            lambda: [correct_spelling_mistakes(word, "Deutsch")
+                     for word in words], repeat, len(words))
+        misspelled = [_misspell(word, seed) for seed, word
+                      in enumerate(words[:100])]
+        benchmarks["correct_spelling_mistakes/miss"] = _measure(
+            lambda: [correct_spelling_mistakes(word, "Deutsch")
+                     for word in misspelled], repeat, len(misspelled))
+
+        # Add new words like the button of the window
+        benchmarks["handle_add_to_list"] = _measure_add_to_list(repeat)
+
+        # Save new files of each size
+        for size in sizes:
+            word_list = generate_word_list(size)
+            runs = repeat if size < 100000 else 1
+            for extension, save in ((".xlsx", save_list_as_xlsx),
+                                    (".apkg", save_list_as_apkg)):
+                path = os.path.join(directory, f"benchmark_{size}{extension}")
+                benchmarks[f"{save.__name__}/{size}"] = _measure(
+                    lambda: save(word_list, path), runs, size,
+                    setup=lambda: os.path.exists(path) and os.remove(path))
+
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": benchmarks
+    }
+
+
+def compare_results(results={}, baseline={}, tolerance=0.2):
+    """
+    Compare the results with the results of an earlier run.
+
+    Args:
+    - results (dict): The results of run_benchmarks.
+    - baseline (dict): The results of the earlier run.
+    - tolerance (float): Share the fastest run may be slower than in the
+    baseline, e.g. 0.2 for 20 %.
+
+    Returns:
+    - list: A dictionary for each benchmark of both runs with the keys
+    "name", "baseline", "seconds", "ratio" and "regression".
+    """
+    comparison = []
+    for name, result in results["benchmarks"].items():
+        old = baseline.get("benchmarks", {}).get(name)
+        if old is None or "seconds" not in old or "seconds" not in result:
+            continue
+        ratio = result["seconds"] / max(old["seconds"], 1e-9)
+        comparison.append({"name": name, "baseline": old["seconds"],
+                           "seconds": result["seconds"], "ratio": ratio,
+                           "regression": ratio > 1 + tolerance})
+    return comparison
+
+
+def write_results(results={}, path=RESULTS):
+    """
+    Write the results to a JSON file.
+
+    Args:
+    - results (dict): The results of run_benchmarks.
+    - path (str): Path of the JSON file.
+
+    Returns:
+    - None
+    """
+    # If the directory for the results not exist, a new directory get
+    # created
+    if not os.path.exists(os.path.dirname(os.path.abspath(path))):
+        os.makedirs(os.path.dirname(os.path.abspath(path)))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def read_results(path=RESULTS):
+    """
+    Read the results of an earlier run.
+
+    Args:
+    - path (str): Path of the JSON file.
+
+    Returns:
+    - dict: The results.
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    """
+    Run the benchmarks and compare them with a baseline.
+
+    Args:
+    - argv (list): The command line arguments. If None, the arguments of
+    the process are used.
+
+    Returns:
+    - None
+    """
+    parser = argparse.ArgumentParser(
+        description="Run the benchmarks of the vocabulary and translation "
+                    "GUI offline.")
+    parser.add_argument("--output", default=str(RESULTS),
+                        help="JSON file for the results")
+    parser.add_argument("--baseline", default=None,
+                        help="JSON file of an earlier run to compare with")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES),
+                        help="numbers of entries of the saved word lists")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs of each benchmark")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds each offline translation takes")
+    parser.add_argument("--cassette", default=None,
+                        help="DeepL cassette whose recorded request times "
+                             "the offline translations take")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed slowdown against the baseline")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.repeat, args.latency,
+                             cassette=args.cassette)
+    write_results(results, args.output)
+    for name, result in results["benchmarks"].items():
+        if "skipped" in result:
+            print(f"{name}: skipped, {result['skipped']}")
+        else:
+            print(f"{name}: {result['seconds'] * 1000:.2f} ms "
+                  f"({result['items']} items)")
+    print(f"Results written to {args.output}.")
+
+    if args.baseline is not None:
+        comparison = compare_results(results, read_results(args.baseline),
+                                     args.tolerance)
+        regressions = [row for row in comparison if row["regression"]]
+        for row in regressions:
+            print(f"Slower: {row['name']} {row['baseline'] * 1000:.2f} ms "
+                  f"-> {row['seconds'] * 1000:.2f} ms "
+                  f"({row['ratio']:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print("No benchmark is slower than the baseline.")
+
+
+def _get_words(dictionary_language):
+    # Read the words of a dictionary once, English if it is not shipped
+    if dictionary_language not in _words:
+        words = read_dictionary_words(dictionary_language)
+        _words[dictionary_language] = (words if len(words) > 0
+                                       else _get_words("en_GB"))
+    return _words[dictionary_language]
+
+
+def _misspell(phrase, seed):
+    # Swap two neighbouring letters of the longest word of the phrase
+    words = phrase.split(" ")
+    longest = max(range(len(words)), key=lambda i: len(words[i]))
+    word = words[longest]
+    if len(word) >= 2:
+        i = random.Random(seed).randrange(len(word) - 1)
+        words[longest] = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return " ".join(words)
+
+
+def _measure(function, repeat, items, setup=None):
+    # Run a function repeat times and keep the fastest and the mean run
+    seconds = []
+    for _ in range(max(1, repeat)):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+    return {"seconds": min(seconds), "mean": sum(seconds) / len(seconds),
+            "runs": len(seconds), "items": items}
+
+
+def _measure_add_to_list(repeat):
+    # Add new words to a vocabulary list shown in the table of a window
+    try:
+        window = tk.Tk()
+    except tk.TclError as error:
+        return {"skipped": f"no window can be created: {error}"}
+
+    window.withdraw()
+    words = generate_phrases("de_DE", ADDED_WORDS, 1, seed=2)
+    enter_field = tk.Entry(window)
+    translation_field = tk.Label(window)
+    word_list = []
+    view = VocabularyView(window, word_list)
+
+    def add_words():
+        for word in words:
+            handle_add_to_list("offline", word, "Deutsch", enter_field,
+                               translation_field, view, word_list)
+
+    def reset():
+        # The words are new in every run
+        word_list.clear()
+        clear_index()
+        clear_translations()
+
+    try:
+        return _measure(add_words, repeat, len(words), setup=reset)
+    finally:
+        reset()
+        window.destroy()
+
+
+if __name__ == '__main__':
+    main()
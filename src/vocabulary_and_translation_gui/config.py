@@ -1,9 +1,106 @@
 """This module contains the general configuration of the project."""
+import os
 from pathlib import Path
 
 
 SRC = Path(__file__).parent.resolve()
 BLD = SRC.joinpath("..", "..", "bld").resolve()
 
+# Folder with the dictionaries that are shipped with the application
+DICTIONARIES = SRC.joinpath("resources", "dictionaries")
 
-__all__ = ["BLD", "SRC"]
+# Folder for the files the application stores for the user
+USER_DATA = Path.home().joinpath(".vocabulary_and_translation_gui")
+
+# Folder with the personal word lists, one file for each dictionary language
+PERSONAL_DICTIONARIES = USER_DATA.joinpath("personal_dictionaries")
+
+# SQLite database in which every added word is stored until it is exported
+VOCABULARY_STORE = USER_DATA.joinpath("vocabulary.sqlite3")
+
+# Folder with the keys of the words in the saved Excel files, so a file is
+# not read again to find the words that are already in it
+FILE_KEYS = USER_DATA.joinpath("file_keys")
+
+# Seconds to wait before saving a file again that is being used by another
+# program, the save fails after the last delay
+SAVE_RETRY_DELAYS = (1, 2, 4, 8, 16)
+
+# Seconds a dictionary may stay unused before it gets released again
+DICTIONARY_IDLE_TIMEOUT = 600
+
+# Upper bound in bytes for the estimated size of all loaded dictionaries
+DICTIONARY_MEMORY_BUDGET = 32 * 1024 * 1024
+
+# Estimated size in bytes of a dictionary whose files are not shipped, e.g.
+# a dictionary of the system
+DICTIONARY_DEFAULT_SIZE = 4 * 1024 * 1024
+
+# Seconds between two checks of the GUI for idle dictionaries
+DICTIONARY_EVICTION_INTERVAL = 60
+
+# Seconds the suggestions of enchant may take before a faster but less exact
+# edit distance lookup is used instead
+SUGGESTION_DEADLINE = 0.5
+
+# Characters that may be translated speculatively in one session, before the
+# user asks for the translations. DeepL counts them against the quota
+PREFETCH_CHARACTER_BUDGET = 20000
+
+# Words of the rapid-entry mode that are checked and translated at the same
+# time
+RAPID_ENTRY_WORKERS = 4
+
+# If the environment variable VOCABULARY_LATENCY_MONITOR is 1, the GUI
+# measures how long it is blocked and shows the latencies in a status bar
+LATENCY_MONITOR = os.environ.get("VOCABULARY_LATENCY_MONITOR", "") == "1"
+
+# Log file for the stalls of the GUI found by the latency monitor
+LATENCY_LOG = USER_DATA.joinpath("latency.log")
+
+# If the environment variable VOCABULARY_PROFILING is 1, every call of the
+# buttons and the savers is profiled with cProfile and tracemalloc
+PROFILING = os.environ.get("VOCABULARY_PROFILING", "") == "1"
+
+# Folder for the profiles and the allocation reports
+DIAGNOSTICS = USER_DATA.joinpath("diagnostics")
+
+# Number of profiled calls whose files are kept in the diagnostics folder
+PROFILE_KEEP = 20
+
+# Folder for the metrics, which are written when the GUI is closed
+METRICS = USER_DATA.joinpath("metrics")
+
+# If the environment variable VOCABULARY_TRACING is "console" or "file", the
+# stages of adding a word are traced and written to the console or the file
+TRACING = os.environ.get("VOCABULARY_TRACING", "")
+
+# File for the traces in the OTLP/JSON format, one trace on each line
+TRACE_FILE = USER_DATA.joinpath("traces.jsonl")
+
+
+__all__ = [
+    "BLD",
+    "DIAGNOSTICS",
+    "DICTIONARIES",
+    "DICTIONARY_DEFAULT_SIZE",
+    "DICTIONARY_EVICTION_INTERVAL",
+    "DICTIONARY_IDLE_TIMEOUT",
+    "DICTIONARY_MEMORY_BUDGET",
+    "FILE_KEYS",
+    "LATENCY_LOG",
+    "LATENCY_MONITOR",
+    "METRICS",
+    "PERSONAL_DICTIONARIES",
+    "PREFETCH_CHARACTER_BUDGET",
+    "PROFILE_KEEP",
+    "PROFILING",
+    "RAPID_ENTRY_WORKERS",
+    "SAVE_RETRY_DELAYS",
+    "SRC",
+    "SUGGESTION_DEADLINE",
+    "TRACE_FILE",
+    "TRACING",
+    "USER_DATA",
+    "VOCABULARY_STORE"
+]
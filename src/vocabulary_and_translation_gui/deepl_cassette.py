@@ -0,0 +1,256 @@
+"""
+All functions for recording the requests to DeepL and replaying them.
+
+A cassette is a JSON file with the translations of DeepL. While a block runs
+under record_cassette, every translation is sent to DeepL and the request,
+the response and the time the request took are written to the cassette. A
+block that runs under replay_cassette sends nothing: the responses are read
+from the cassette, after the recorded time or a given latency. So the tests
+and the benchmarks run without internet connection and without DeepL key,
+always with the same translations and in parallel.
+
+The cassette looks like:
+{"version": 1,
+ "rejected_keys": ["9f86d0..."],
+ "interactions": [
+    {"request": {"text": "Baum", "source_lang": "DE",
+                 "target_lang": "EN-GB"},
+     "response": {"text": "Tree", "detected_source_lang": "DE"},
+     "seconds": 0.182}]}
+
+Keys that DeepL rejected are kept as SHA-256 hash, so a replayed request
+with such a key is rejected too. Valid keys are not written to the cassette.
+
+Functions:
+- record_cassette(path)
+- replay_cassette(path, latency)
+- read_cassette(path)
+- write_cassette(cassette, path)
+- recorded_latencies(path)
+"""
+
+import contextlib
+import deepl
+import hashlib
+import json
+import os
+import threading
+import time
+from unittest import mock
+
+# Version of the format of the cassettes
+CASSETTE_VERSION = 1
+
+# Errors that are raised again when a recorded error is replayed, besides
+# the errors of DeepL
+ERRORS = {"TypeError": TypeError, "ValueError": ValueError}
+
+# Lock for the recorded requests, translations are requested from several
+# threads
+_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def record_cassette(path=""):
+    """
+    Record the translations of DeepL while the block runs.
+
+    The requests of an existing cassette are kept, a request that is sent
+    again is replaced. Failed connections and rate limits are not recorded.
+    The cassette is written when the block ends.
+
+    Args:
+    - path (str): Path of the cassette.
+
+    Returns:
+    - contextlib.AbstractContextManager: The context manager, it returns the
+    cassette as dictionary.
+    """
+    cassette = (read_cassette(path) if os.path.exists(path)
+                else {"version": CASSETTE_VERSION, "rejected_keys": [],
+                      "interactions": []})
+    interactions = {_request_key(item["request"]): item
+                    for item in cassette["interactions"]}
+    rejected_keys = set(cassette["rejected_keys"])
+
+    class RecordingTranslator(deepl.Translator):
+        def __init__(self, auth_key="", **kwargs):
+            super().__init__(auth_key, **kwargs)
+            self.recorded_key = auth_key
+
+        def translate_text(self, text, *, source_lang=None, target_lang=None,
+                           **kwargs):
+            request = {"text": text, "source_lang": source_lang,
+                       "target_lang": target_lang}
+            start = time.perf_counter()
+            try:
+                result = super().translate_text(
+                    text, source_lang=source_lang, target_lang=target_lang,
+                    **kwargs)
+            except deepl.exceptions.AuthorizationException:
+                with _lock:
+                    rejected_keys.add(_hash_key(self.recorded_key))
+                raise
+            except (deepl.exceptions.ConnectionException,
+                    deepl.exceptions.TooManyRequestsException):
+                raise
+            except (deepl.exceptions.DeepLException, TypeError,
+                    ValueError) as error:
+                response = {"error": type(error).__name__,
+                            "message": str(error)}
+                _keep(interactions, request, response, start)
+                raise
+            _keep(interactions, request,
+                  {"text": result.text,
+                   "detected_source_lang": result.detected_source_lang},
+                  start)
+            return result
+
+    try:
+        with mock.patch.object(deepl, "Translator", RecordingTranslator):
+            yield cassette
+    finally:
+        with _lock:
+            cassette.update(
+                version=CASSETTE_VERSION,
+                rejected_keys=sorted(rejected_keys),
+                interactions=[interactions[key]
+                              for key in sorted(interactions)])
+        write_cassette(cassette, path)
+
+
+@contextlib.contextmanager
+def replay_cassette(path="", latency=None):
+    """
+    Answer the translations from a cassette while the block runs.
+
+    Args:
+    - path (str): Path of the cassette.
+    - latency (float): Seconds each response takes. If None, each response
+    takes as long as the recorded request.
+
+    Returns:
+    - contextlib.AbstractContextManager: The context manager, it returns the
+    cassette as dictionary.
+
+    Raises:
+    - LookupError: In the block, if a translation is not in the cassette.
+    """
+    cassette = read_cassette(path)
+    interactions = {_request_key(item["request"]): item
+                    for item in cassette["interactions"]}
+    rejected_keys = set(cassette["rejected_keys"])
+
+    class ReplayingTranslator:
+        def __init__(self, auth_key="", **kwargs):
+            self.auth_key = auth_key
+
+        def translate_text(self, text, *, source_lang=None, target_lang=None,
+                           **kwargs):
+            request = {"text": text, "source_lang": source_lang,
+                       "target_lang": target_lang}
+            if _hash_key(self.auth_key) in rejected_keys:
+                raise deepl.exceptions.AuthorizationException(
+                    "Authorization failure, check auth_key")
+            item = interactions.get(_request_key(request))
+            if item is None:
+                raise LookupError(f"No recorded translation in {path} for "
+                                  f"{json.dumps(request, ensure_ascii=False)}")
+
+            seconds = item["seconds"] if latency is None else latency
+            if seconds > 0:
+                time.sleep(seconds)
+            response = item["response"]
+            if "error" in response:
+                raise _get_error(response["error"])(response["message"])
+            return deepl.TextResult(response["text"],
+                                    response["detected_source_lang"],
+                                    len(text))
+
+    with mock.patch.object(deepl, "Translator", ReplayingTranslator):
+        yield cassette
+
+
+def read_cassette(path=""):
+    """
+    Read a cassette.
+
+    Args:
+    - path (str): Path of the cassette.
+
+    Returns:
+    - dict: The cassette with the keys "version", "rejected_keys" and
+    "interactions".
+
+    Raises:
+    - ValueError: If the cassette has another version.
+    """
+    with open(path, encoding="utf-8") as f:
+        cassette = json.load(f)
+    if cassette.get("version") != CASSETTE_VERSION:
+        raise ValueError(f"Unknown version of the cassette {path}: "
+                         + str(cassette.get("version")))
+    return cassette
+
+
+def write_cassette(cassette, path=""):
+    """
+    Write a cassette, the file is replaced at once.
+
+    Args:
+    - cassette (dict): The cassette.
+    - path (str): Path of the cassette.
+
+    Returns:
+    - None
+    """
+    # If the directory for the cassette not exist, a new directory get
+    # created
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(cassette, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(path + ".tmp", path)
+
+
+def recorded_latencies(path=""):
+    """
+    Return the times the successful requests of a cassette took.
+
+    Args:
+    - path (str): Path of the cassette.
+
+    Returns:
+    - list: The seconds of each request in the order of the cassette.
+    """
+    return [item["seconds"] for item in read_cassette(path)["interactions"]
+            if "error" not in item["response"]]
+
+
+def _keep(interactions, request, response, start):
+    # Keep a recorded request with its response and duration
+    item = {"request": request, "response": response,
+            "seconds": round(time.perf_counter() - start, 3)}
+    with _lock:
+        interactions[_request_key(request)] = item
+
+
+def _request_key(request):
+    # The request as sortable tuple, None and "" are the same language
+    return (request["text"], request["source_lang"] or "",
+            request["target_lang"] or "")
+
+
+def _hash_key(auth_key):
+    # Hash of a key, so the key itself is not written to the cassette
+    return hashlib.sha256(str(auth_key).strip().encode("utf-8")).hexdigest()
+
+
+def _get_error(name):
+    # The class of a recorded error, DeepLException if it is unknown
+    error = getattr(deepl.exceptions, name, None)
+    if isinstance(error, type) and issubclass(error, Exception):
+        return error
+    return ERRORS.get(name, deepl.exceptions.DeepLException)
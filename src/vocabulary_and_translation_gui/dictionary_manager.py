@@ -0,0 +1,351 @@
+"""
+All functions for loading and releasing the enchant dictionaries.
+
+A dictionary is only loaded the first time its language is needed. Each use
+refreshes its timestamp, so dictionaries that were idle for too long or that
+push the loaded dictionaries over the memory budget can be released again.
+The GUI checks for idle dictionaries with a timer, so they are also released
+if no other dictionary is requested. The words of a dictionary that are
+grouped for the edit distance suggestions and the second dictionary for the
+suggestions are released with it.
+
+An enchant dictionary must not be used by two threads at the same time, the
+spelling check and the rapid entry run in worker threads. Each dictionary
+therefore has its own lock, see dictionary_lock. The suggestions use their
+own dictionary, so a slow suggestion never holds up a spelling check.
+
+Functions:
+- get_dictionary(dictionary_language, idle_timeout, memory_budget)
+- evict_dictionaries(idle_timeout, memory_budget, keep)
+- schedule_eviction(widget, interval)
+- get_resident_sizes()
+- estimate_dictionary_size(dictionary_language)
+- read_dictionary_words(dictionary_language)
+- get_word_groups(dictionary_language, wait)
+- get_suggestion_dictionary(dictionary_language)
+- dictionary_lock(dictionary)
+- clear_dictionaries()
+"""
+
+import enchant
+import os
+import threading
+import time
+import weakref
+from vocabulary_and_translation_gui.config import (
+    DICTIONARIES,
+    DICTIONARY_DEFAULT_SIZE,
+    DICTIONARY_EVICTION_INTERVAL,
+    DICTIONARY_IDLE_TIMEOUT,
+    DICTIONARY_MEMORY_BUDGET
+)
+from vocabulary_and_translation_gui.metrics import increment, measure_time
+
+# Loaded dictionaries, e.g. {"en_GB": {"dictionary": enchant.Dict,
+# "last_used": float, "size": int, "word_groups": dict,
+# "suggestion_dictionary": enchant.Dict}}
+_loaded_dictionaries = {}
+
+# Lock for the loaded dictionaries, the spelling check can run in a thread
+_lock = threading.RLock()
+
+# Lock of each enchant dictionary, a released dictionary drops its lock
+_dictionary_locks = weakref.WeakKeyDictionary()
+
+# Languages whose word groups are built in a background thread
+_building = set()
+
+
+def get_dictionary(dictionary_language="",
+                   idle_timeout=DICTIONARY_IDLE_TIMEOUT,
+                   memory_budget=DICTIONARY_MEMORY_BUDGET):
+    """
+    Return the enchant dictionary for a language and load it if needed.
+
+    Before a dictionary gets loaded, all dictionaries which are idle for longer
+    than idle_timeout or exceed the memory_budget are released.
+
+    Args:
+    - dictionary_language (str): Abbreviation of the dictionary, e.g. "en_GB".
+    - idle_timeout (float): Seconds a dictionary may stay unused.
+    - memory_budget (int): Upper bound for the estimated size in bytes of all
+    loaded dictionaries.
+
+    Returns:
+    - enchant.Dict: The dictionary for the language.
+
+    Raises:
+    - enchant.errors.DictNotFoundError: If the dictionary does not exist.
+    """
+    with _lock:
+        entry = _loaded_dictionaries.get(dictionary_language)
+
+        # Load the dictionary if it is not loaded yet
+        if entry is None:
+            with measure_time("dictionary_load_seconds"):
+                entry = {
+                    "dictionary": enchant.Dict(dictionary_language),
+                    "size": estimate_dictionary_size(dictionary_language)
+                }
+            _loaded_dictionaries[dictionary_language] = entry
+            increment("dictionary_loads_total",
+                      labels={"language": dictionary_language})
+
+        # Refresh the timestamp and release dictionaries that are not needed
+        entry["last_used"] = time.monotonic()
+        evict_dictionaries(idle_timeout=idle_timeout,
+                           memory_budget=memory_budget,
+                           keep=dictionary_language)
+
+        return entry["dictionary"]
+
+
+def evict_dictionaries(idle_timeout=None, memory_budget=None, keep=""):
+    """
+    Release idle dictionaries and dictionaries exceeding the memory budget.
+
+    First all dictionaries that were not used for idle_timeout seconds get
+    released. If the remaining dictionaries still exceed the memory_budget, the
+    least recently used ones get released until they fit.
+
+    Args:
+    - idle_timeout (float): Seconds a dictionary may stay unused. If None,
+    the timeout of the configuration is used.
+    - memory_budget (int): Upper bound for the estimated size in bytes of all
+    loaded dictionaries. If None, the budget of the configuration is used.
+    - keep (str): Abbreviation of a dictionary which is never released.
+
+    Returns:
+    - list: The abbreviations of the released dictionaries.
+    """
+    if idle_timeout is None:
+        idle_timeout = DICTIONARY_IDLE_TIMEOUT
+    if memory_budget is None:
+        memory_budget = DICTIONARY_MEMORY_BUDGET
+    released = []
+    with _lock:
+        now = time.monotonic()
+
+        # Sort the dictionaries from the least to the most recently used one
+        by_last_use = sorted(_loaded_dictionaries.items(),
+                             key=lambda item: item[1]["last_used"])
+        total_size = sum(entry["size"] for _, entry in by_last_use)
+
+        for dictionary_language, entry in by_last_use:
+            if dictionary_language == keep:
+                continue
+            is_idle = now - entry["last_used"] > idle_timeout
+            if is_idle or total_size > memory_budget:
+                del _loaded_dictionaries[dictionary_language]
+                total_size -= entry["size"]
+                released.append(dictionary_language)
+
+    return released
+
+
+def schedule_eviction(widget=None, interval=DICTIONARY_EVICTION_INTERVAL):
+    """
+    Release idle dictionaries regularly while a window is running.
+
+    Args:
+    - widget (tk.Widget): A widget of the window, its after() method runs the
+    check.
+    - interval (float): Seconds between two checks.
+
+    Returns:
+    - None
+    """
+    def evict():
+        evict_dictionaries()
+        widget.after(int(interval * 1000), evict)
+
+    widget.after(int(interval * 1000), evict)
+
+
+def get_resident_sizes():
+    """
+    Return the estimated size of each loaded dictionary.
+
+    Args:
+    - None
+
+    Returns:
+    - dict: The estimated size in bytes for each dictionary abbreviation.
+    """
+    with _lock:
+        return {dictionary_language: entry["size"]
+                for dictionary_language, entry
+                in _loaded_dictionaries.items()}
+
+
+def estimate_dictionary_size(dictionary_language=""):
+    """
+    Estimate the memory size of a dictionary from its .dic and .aff files.
+
+    Only the dictionaries shipped in the resources folder can be measured,
+    for all other dictionaries the default size of the configuration is
+    returned, so they count against the memory budget as well.
+
+    Args:
+    - dictionary_language (str): Abbreviation of the dictionary, e.g. "en_GB".
+
+    Returns:
+    - int: The estimated size in bytes.
+    """
+    size = 0
+    for extension in [".dic", ".aff"]:
+        file_path = os.path.join(DICTIONARIES,
+                                 dictionary_language + extension)
+        if os.path.exists(file_path):
+            size += os.path.getsize(file_path)
+    return size if size > 0 else DICTIONARY_DEFAULT_SIZE
+
+
+def read_dictionary_words(dictionary_language=""):
+    """
+    Read the word stems of a dictionary shipped in the resources folder.
+
+    The encoding of the .dic file is taken from the "SET" line of the .aff
+    file. The affix flags after the "/" are removed.
+
+    Args:
+    - dictionary_language (str): Abbreviation of the dictionary, e.g. "en_GB".
+
+    Returns:
+    - list: The word stems, or an empty list if the dictionary is not
+    shipped with the application.
+    """
+    dic_path = os.path.join(DICTIONARIES, dictionary_language + ".dic")
+    aff_path = os.path.join(DICTIONARIES, dictionary_language + ".aff")
+    if not os.path.exists(dic_path):
+        return []
+
+    # Find the encoding of the dictionary in the affix file
+    encoding = "utf-8"
+    if os.path.exists(aff_path):
+        with open(aff_path, encoding="latin-1") as f:
+            for line in f:
+                if line.startswith("SET "):
+                    encoding = line.split()[1]
+                    break
+
+    # The first line holds the number of words, each other line one word
+    with open(dic_path, encoding=encoding, errors="replace") as f:
+        next(f, None)
+        words = [line.split("/")[0].strip() for line in f]
+
+    return [word for word in words if len(word) > 0]
+
+
+def get_word_groups(dictionary_language="", wait=True):
+    """
+    Return the words of a shipped dictionary grouped by their first letter.
+
+    The groups of a loaded dictionary are kept until the dictionary is
+    released.
+
+    Args:
+    - dictionary_language (str): Abbreviation of the dictionary, e.g. "en_GB".
+    - wait (bool): If False and the groups are not built yet, they are built
+    in a background thread and an empty dictionary is returned meanwhile.
+
+    Returns:
+    - dict: The words for each lower case first letter, e.g. {"h": ["house",
+    ...]}, or an empty dictionary if the dictionary is not shipped.
+    """
+    with _lock:
+        entry = _loaded_dictionaries.get(dictionary_language, {})
+        if "word_groups" in entry:
+            return entry["word_groups"]
+        if not wait:
+            if dictionary_language not in _building:
+                _building.add(dictionary_language)
+                threading.Thread(target=_build_word_groups,
+                                 args=(dictionary_language, entry),
+                                 name="word_groups", daemon=True).start()
+            return {}
+
+    return _build_word_groups(dictionary_language, entry)
+
+
+def get_suggestion_dictionary(dictionary_language=""):
+    """
+    Return a second enchant dictionary of a language for the suggestions.
+
+    A suggestion call may still run after its deadline, so it gets its own
+    dictionary and never holds up the spelling checks. The dictionary is
+    kept and released together with the dictionary of get_dictionary.
+
+    Args:
+    - dictionary_language (str): Abbreviation of the dictionary, e.g. "en_GB".
+
+    Returns:
+    - enchant.Dict: The dictionary for the suggestions.
+
+    Raises:
+    - enchant.errors.DictNotFoundError: If the dictionary does not exist.
+    """
+    with _lock:
+        entry = _loaded_dictionaries.get(dictionary_language, {})
+        if "suggestion_dictionary" in entry:
+            return entry["suggestion_dictionary"]
+
+    # The dictionary is loaded without the lock, so the other dictionaries
+    # can be used meanwhile
+    dictionary = enchant.Dict(dictionary_language)
+    with _lock:
+        if (_loaded_dictionaries.get(dictionary_language) is entry
+                and "suggestion_dictionary" not in entry):
+            entry["suggestion_dictionary"] = dictionary
+            entry["size"] += estimate_dictionary_size(dictionary_language)
+        return entry.get("suggestion_dictionary", dictionary)
+
+
+def dictionary_lock(dictionary=None):
+    """
+    Return the lock that serializes the calls of an enchant dictionary.
+
+    Args:
+    - dictionary (enchant.Dict): The dictionary.
+
+    Returns:
+    - threading.Lock: The same lock for each call with the same dictionary.
+    """
+    with _lock:
+        lock = _dictionary_locks.get(dictionary)
+        if lock is None:
+            lock = threading.Lock()
+            _dictionary_locks[dictionary] = lock
+        return lock
+
+
+def _build_word_groups(dictionary_language, entry):
+    # Group the words of a dictionary and keep them with its entry, the
+    # words are read without the lock, so the other dictionaries can be used
+    # meanwhile
+    try:
+        groups = {}
+        for word in read_dictionary_words(dictionary_language):
+            groups.setdefault(word[0].lower(), []).append(word)
+
+        with _lock:
+            if _loaded_dictionaries.get(dictionary_language) is entry:
+                entry.setdefault("word_groups", groups)
+        return groups
+    finally:
+        with _lock:
+            _building.discard(dictionary_language)
+
+
+def clear_dictionaries():
+    """
+    Release all loaded dictionaries.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    with _lock:
+        _loaded_dictionaries.clear()
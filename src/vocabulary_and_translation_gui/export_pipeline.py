@@ -0,0 +1,134 @@
+"""
+All functions for saving one word list to several files at once.
+
+The word list is checked and deduplicated once and the keys of its entries
+are built once. The prepared entries and keys are then handed to one writer
+for each file, so the writers only remove the words that are already in
+their file. The writers run in parallel threads, so exporting to several
+formats takes about as long as the slowest writer, and their metrics and
+profiles are recorded like the ones of a single save. All results are
+collected in one report.
+
+The progress of each file is reported with the events of the save queue,
+e.g. {"path": str, "state": "saved", "count": 3}, see describe_save_event.
+
+Functions:
+- export_all(word_list, paths, on_event, max_workers)
+- describe_export_report(report)
+"""
+
+import concurrent.futures
+import os
+import time
+from vocabulary_and_translation_gui.save_list import (
+    check_word_list,
+    export_file
+)
+from vocabulary_and_translation_gui.vocabulary_index import entry_keys
+
+# Messages for word lists that can't be saved, see check_word_list
+MESSAGES = {
+    "empty": "No words to save were found.",
+    "four": ("There have to be exactly four entries in each entry of "
+             "word_list.")
+}
+
+
+def export_all(word_list=[], paths=[], on_event=None, max_workers=None):
+    """
+    Save a word list to several files in one pass.
+
+    The format of each file is selected by its extension, see export_file.
+    Words that are already in a file are not added again. A path that is
+    given more than once is written once.
+
+    Args:
+    - word_list (list): Entries containing English, German and Turkish words
+    and a timestamp.
+    - paths (list): Paths of the files.
+    - on_event (function): Function called with the progress events.
+    - max_workers (int): Maximum number of files written at the same time.
+    If None, all files are written at the same time.
+
+    Returns:
+    - dict: The report with the number of added words for each "saved"
+    path, the error message for each "failed" path and the "seconds" the
+    export took.
+
+    Raises:
+    - ValueError: If the word list is empty or has entries without exactly
+    four entries.
+    """
+    start = time.perf_counter()
+
+    # Check and deduplicate the word list once for all files
+    problem = check_word_list(word_list)
+    if problem is not None:
+        raise ValueError(MESSAGES[problem])
+    keys = entry_keys(word_list)
+    is_first = ~keys.duplicated()
+    entries = [entry for entry, keep in zip(word_list, is_first) if keep]
+    keys = list(keys[is_first])
+
+    report = {"saved": {}, "failed": {}, "seconds": 0.0}
+    paths = list(dict.fromkeys(os.path.abspath(path) for path in paths))
+    if max_workers is None:
+        max_workers = max(len(paths), 1)
+
+    # The writers spend most of their time in file operations, compression
+    # and pyarrow, which release the GIL, so threads write the files in
+    # parallel and the metrics stay in this process. A single writer runs in
+    # the calling thread, so a profile of the caller also contains it
+    if max_workers <= 1:
+        for path in paths:
+            _send(on_event, path, "saving", count=len(entries))
+            _collect(report, on_event, path,
+                     lambda: export_file(entries, path, keys))
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers, thread_name_prefix="export") as executor:
+            futures = {}
+            for path in paths:
+                _send(on_event, path, "saving", count=len(entries))
+                futures[executor.submit(export_file, entries, path,
+                                        keys)] = path
+
+            for future in concurrent.futures.as_completed(futures):
+                _collect(report, on_event, futures[future], future.result)
+
+    report["seconds"] = time.perf_counter() - start
+    return report
+
+
+def describe_export_report(report={}):
+    """
+    Describe the report of an export in a message for the user.
+
+    Args:
+    - report (dict): The report returned by export_all.
+
+    Returns:
+    - str: One line for each file.
+    """
+    lines = [f"{count} new word(s) saved to {os.path.basename(path)}."
+             for path, count in report["saved"].items()]
+    lines += [f"Saving {os.path.basename(path)} failed: {error}"
+              for path, error in report["failed"].items()]
+    return "\n".join(lines)
+
+
+def _collect(report, on_event, path, write):
+    # Add the result of a writer to the report and send its event
+    try:
+        report["saved"][path] = write()
+    except Exception as error:
+        report["failed"][path] = str(error)
+        _send(on_event, path, "failed", error=str(error))
+    else:
+        _send(on_event, path, "saved", count=report["saved"][path])
+
+
+def _send(on_event, path, state, **details):
+    # Send a progress event of a file if a listener is given
+    if on_event is not None:
+        on_event(dict(path=path, state=state, **details))
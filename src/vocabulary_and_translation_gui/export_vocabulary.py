@@ -0,0 +1,96 @@
+"""
+Exporting the vocabulary store without the user interface.
+
+The format of each file is selected by its extension: Anki (.apkg), Excel
+(.xlsx), CSV (.csv), Parquet (.parquet) or Feather (.feather). Only the
+words that were not yet exported to a file are written to it.
+
+Usage:
+$ python -m vocabulary_and_translation_gui.export_vocabulary a.parquet b.csv
+
+Functions:
+- export_vocabulary(paths, store_path, only_new, on_event)
+- main(argv)
+"""
+
+import argparse
+import os
+import sys
+from vocabulary_and_translation_gui.export_pipeline import (
+    describe_export_report,
+    export_all
+)
+from vocabulary_and_translation_gui.vocabulary_store import (
+    get_entries,
+    get_unexported_entries,
+    mark_exported
+)
+
+
+def export_vocabulary(paths=[], store_path=None, only_new=True,
+                      on_event=None):
+    """
+    Export the entries of the vocabulary store to files.
+
+    All files are written in one pass by export_all.
+
+    Args:
+    - paths (list): Paths of the files, the format is selected by the
+    extension.
+    - store_path (str): Path of the vocabulary store. If None, the path of
+    the configuration is used.
+    - only_new (bool): If True, only the entries that were not yet exported
+    to all files are written and the export watermarks of the saved files
+    are moved.
+    - on_event (function): Function called with the progress events.
+
+    Returns:
+    - dict: The report of export_all.
+    """
+    if only_new:
+        word_list, last_id = get_unexported_entries(paths, store_path)
+    else:
+        word_list = get_entries(store_path)
+
+    # Nothing is written if all files contain all entries
+    if len(word_list) <= 0:
+        return {"saved": {os.path.abspath(path): 0 for path in paths},
+                "failed": {}, "seconds": 0.0}
+
+    report = export_all(word_list, paths, on_event)
+    if only_new:
+        for path in report["saved"]:
+            mark_exported(path, last_id, store_path)
+    return report
+
+
+def main(argv=None):
+    """
+    Export the vocabulary store to the files given on the command line.
+
+    Args:
+    - argv (list): The command line arguments. If None, the arguments of
+    the process are used.
+
+    Returns:
+    - None
+    """
+    parser = argparse.ArgumentParser(
+        description="Export the vocabulary store to Anki, Excel, CSV, "
+                    "Parquet or Feather files.")
+    parser.add_argument("paths", nargs="+", help="files to export to")
+    parser.add_argument("--store", default=None,
+                        help="path of the vocabulary store")
+    parser.add_argument("--all", action="store_true",
+                        help="export all words, not only the new ones")
+    args = parser.parse_args(argv)
+
+    report = export_vocabulary(args.paths, args.store, not args.all)
+    print(describe_export_report(report))
+    print(f"Exported in {report['seconds']:.2f} seconds.")
+    if report["failed"]:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""
+All functions for importing saved vocabulary lists.
+
+Excel files are read row by row with a read-only workbook and Anki files
+are read directly from the SQLite collection of the package, so neither
+workbooks nor notes are created for each word. The imported words are
+normalized into VocabularyEntry objects, deduplicated against the words
+that are already loaded and added to the vocabulary list, the index and the
+vocabulary store in bulk.
+
+Functions:
+- read_xlsx_entries(path, sheet_name)
+- read_apkg_entries(path)
+- read_entries(path)
+- import_list(path, word_list, store_path)
+"""
+
+import datetime
+import openpyxl
+import os
+import shutil
+import sqlite3
+import tempfile
+import zipfile
+from vocabulary_and_translation_gui.vocabulary_entry import VocabularyEntry
+from vocabulary_and_translation_gui.vocabulary_index import (
+    LANGUAGES,
+    drop_duplicate_entries,
+    entry_keys,
+    index_entries
+)
+from vocabulary_and_translation_gui.vocabulary_store import (
+    add_entries,
+    get_entries
+)
+
+# Labels of the fields of the Anki notes, see create_vocabulary_deck
+FIELD_LABELS = {"English: ": 0, "Deutsch: ": 1, "Türkçe: ": 2}
+
+
+def read_xlsx_entries(path="", sheet_name="Vocabulary"):
+    """
+    Read the entries of an Excel file row by row.
+
+    The columns are found by the names in the first row, the layout of
+    save_list_as_xlsx. Rows without any word are skipped.
+
+    Args:
+    - path (str): Path of the Excel file.
+    - sheet_name (str): Name of the sheet with the vocabulary list. If the
+    file has no such sheet, the first sheet is read.
+
+    Yields:
+    - VocabularyEntry: The entry of each row.
+
+    Raises:
+    - ValueError: If the sheet has no English, Deutsch or Türkçe column.
+    """
+    imported_at = datetime.datetime.now()
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet_name in workbook.sheetnames:
+            sheet = workbook[sheet_name]
+        else:
+            sheet = workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+
+        # Find the columns of the words and the timestamp
+        header = [str(cell).strip() if cell is not None else ""
+                  for cell in next(rows, ())]
+        if not all(lang in header for lang in LANGUAGES):
+            raise ValueError("The Excel file " + path + " has no vocabulary "
+                             "list with the columns " + ", ".join(LANGUAGES)
+                             + ".")
+        columns = [header.index(lang) for lang in LANGUAGES]
+        time_column = (header.index("Timestamp") if "Timestamp" in header
+                       else None)
+
+        for row in rows:
+            words = [row[column] if column < len(row) else None
+                     for column in columns]
+            timestamp = (row[time_column] if time_column is not None
+                         and time_column < len(row) else None)
+            entry = _create_entry(words, timestamp, imported_at)
+            if entry is not None:
+                yield entry
+    finally:
+        workbook.close()
+
+
+def read_apkg_entries(path=""):
+    """
+    Read the entries of the notes of an Anki (.apkg) file.
+
+    The collection of the package is queried directly. Only notes with the
+    fields of create_vocabulary_deck, "Deutsch: ...", "English: ..." and
+    "Türkçe: ...", are read, the time of the last change of a note is used
+    as timestamp.
+
+    Args:
+    - path (str): Path of the Anki file.
+
+    Yields:
+    - VocabularyEntry: The entry of each note.
+
+    Raises:
+    - ValueError: If the file has no Anki collection.
+    """
+    handle, db_path = tempfile.mkstemp(suffix=".anki2")
+    os.close(handle)
+    try:
+        # Extract the collection of the package
+        with zipfile.ZipFile(path) as source:
+            names = [name for name in ("collection.anki21",
+                                       "collection.anki2")
+                     if name in source.namelist()]
+            if len(names) <= 0:
+                raise ValueError("The file " + path + " has no Anki "
+                                 "collection.")
+            with source.open(names[0]) as src, open(db_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+
+        connection = sqlite3.connect(db_path)
+        try:
+            for fields, modified in connection.execute(
+                    "SELECT flds, mod FROM notes ORDER BY id"):
+                words = [None, None, None]
+                for field in fields.split("\x1f"):
+                    for label, position in FIELD_LABELS.items():
+                        if field.startswith(label):
+                            words[position] = field[len(label):]
+                if None in words:
+                    continue
+                modified = datetime.datetime.fromtimestamp(modified)
+                entry = _create_entry(words, modified, modified)
+                if entry is not None:
+                    yield entry
+        finally:
+            connection.close()
+    finally:
+        os.remove(db_path)
+
+
+def read_entries(path=""):
+    """
+    Read the entries of a saved vocabulary list.
+
+    Args:
+    - path (str): Path of an Excel (.xlsx) or Anki (.apkg) file.
+
+    Returns:
+    - iterator: The VocabularyEntry of each row or note.
+
+    Raises:
+    - ValueError: If the file has another type.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".xlsx":
+        return read_xlsx_entries(path)
+    if extension == ".apkg":
+        return read_apkg_entries(path)
+    raise ValueError("Unsupported file type: " + extension)
+
+
+def import_list(path="", word_list=[], store_path=None):
+    """
+    Import the words of a saved vocabulary list.
+
+    Words that occur more than once in the file or that are already in the
+    vocabulary list or the vocabulary store are skipped. The new words are
+    appended to word_list, indexed and added to the store.
+
+    Args:
+    - path (str): Path of an Excel (.xlsx) or Anki (.apkg) file.
+    - word_list (list): The vocabulary list, the new entries are appended.
+    - store_path (str): Path of the vocabulary store. If None, the path of
+    the configuration is used.
+
+    Returns:
+    - int: The number of imported words.
+
+    Raises:
+    - ValueError: If the file has another type or no vocabulary list.
+    """
+    entries = list(read_entries(path))
+    if len(entries) <= 0:
+        return 0
+
+    # Compare the normalized words with all loaded words at once
+    known_keys = set(entry_keys(word_list))
+    known_keys.update(entry_keys(get_entries(store_path)))
+    entries = drop_duplicate_entries(entries, known_keys)
+
+    entries = add_entries(entries, store_path)
+    word_list.extend(entries)
+    index_entries(entries)
+    return len(entries)
+
+
+def _create_entry(words, timestamp, default_timestamp):
+    # Create an entry with normalized white space, or None if the entry has
+    # no words. Timestamps that can't be read are replaced by the default
+    words = [" ".join(str(word).split()) if word is not None else ""
+             for word in words]
+    if not any(words):
+        return None
+    try:
+        return VocabularyEntry.from_list(words + [timestamp])
+    except (TypeError, ValueError):
+        return VocabularyEntry.from_list(words + [default_timestamp])
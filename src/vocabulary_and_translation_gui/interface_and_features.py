@@ -2,52 +2,150 @@
 Function for creating an user interface and the functions for the buttons.
 
 Functions:
-- vocabulary_interface(deepl_key)
+- vocabulary_interface(deepl_key, store_path)
 - handle_translate(key, in_text, src_lang, tgt_lang, enter_field,
-                   translation_field)
+                   translation_field, check)
 - handle_add_to_list(key, in_text, src_lang, enter_field, translation_field,
-                  trans_list_field, trans_list)
-- handle_save(vocabulary_list)
+                  trans_list_field, trans_list, check)
+- handle_save(vocabulary_list, use_store, store_path, on_event)
+- handle_import(vocabulary_list, trans_list_field, store_path)
+- handle_rapid_entry(key, in_text, src_lang, enter_field, status_field)
 """
 
 import datetime
+import queue
 import tkinter as tk
 import os
+import zipfile
 from tkinter import (
     filedialog,
     messagebox
 )
-from vocabulary_and_translation_gui.save_list import (
-    save_list_as_apkg,
-    save_list_as_xlsx
+from vocabulary_and_translation_gui.config import LATENCY_MONITOR, TRACING
+from vocabulary_and_translation_gui.dictionary_manager import (
+    schedule_eviction
+)
+from vocabulary_and_translation_gui.export_pipeline import (
+    describe_export_report,
+    export_all
+)
+from vocabulary_and_translation_gui.import_list import import_list
+from vocabulary_and_translation_gui.latency_monitor import (
+    instrument,
+    measure,
+    start_monitor,
+    stop_monitor
+)
+from vocabulary_and_translation_gui.metrics import write_metrics
+from vocabulary_and_translation_gui.profiling import profiled
+from vocabulary_and_translation_gui.rapid_entry import (
+    collect_entries,
+    count_pending_entries,
+    submit_entry
+)
+from vocabulary_and_translation_gui.save_queue import (
+    describe_save_event,
+    submit_save,
+    wait_for_saves
+)
+from vocabulary_and_translation_gui.spelling_review import review_spelling
+from vocabulary_and_translation_gui.tracing import (
+    set_attribute,
+    span,
+    start_tracing,
+    traced
 )
 from vocabulary_and_translation_gui.translation_and_spelling import (
-    translate_string,
     check_spelling
 )
+from vocabulary_and_translation_gui.translation_prefetch import (
+    prefetch_translations,
+    translate_cached
+)
+from vocabulary_and_translation_gui.vocabulary_entry import (
+    VocabularyEntry,
+    to_entries
+)
+from vocabulary_and_translation_gui.vocabulary_index import (
+    LANGUAGES,
+    find_entry,
+    index_entries,
+    index_entries_in_background,
+    remove_entries,
+    search_entries
+)
+from vocabulary_and_translation_gui.vocabulary_store import (
+    add_entry,
+    delete_entry,
+    get_entries,
+    get_unexported_entries,
+    get_unsaved_entries,
+    mark_exported,
+    update_entry
+)
+from vocabulary_and_translation_gui.vocabulary_view import VocabularyView
 
 
-def vocabulary_interface(deepl_key=""):
+def vocabulary_interface(deepl_key="", store_path=None):
     """
     Create a GUI for a vocabulary list application with translation.
 
     Allows users to enter text and translate it between different languages,
     add the translated text to a vocabulary list, and save the vocabulary
-    list to a file.
+    list to a file. Every added word is kept in the vocabulary store, so the
+    words that were not saved to a file yet are restored on the next start.
 
     Args:
     - deepl_key (str): Key for the translation functions with deepl
+    - store_path (str): Path of the vocabulary store. If None, the path of
+    the configuration is used.
 
     Returns:
     - None
     """
-    # Create an empty list to store new vocabularies
-    new_vocabularies = []
+    # Restore the vocabularies that were not saved to a file yet and index
+    # all stored vocabularies, so they are not translated again
+    new_vocabularies = to_entries(get_unsaved_entries(store_path))
+    index_entries_in_background(get_entries(store_path))
 
     # Create a tkinter instance
     user_interface = tk.Tk()
     user_interface.title('Translator & Vocabulary interface')
 
+    # Measure how long the callbacks block the window if it is configured,
+    # the latencies are shown in a status bar
+    if LATENCY_MONITOR:
+        latency_status = tk.Label(user_interface, font=("TkDefaultFont", 8))
+        latency_status.pack(side=tk.BOTTOM)
+        start_monitor(user_interface, latency_status)
+
+    # Trace the stages of adding a word if it is configured
+    if TRACING:
+        start_tracing(TRACING)
+
+    # Add a side panel for the words of the rapid-entry mode that were not
+    # added, a double click puts a word back into the input field
+    failed_panel = tk.Frame(user_interface)
+    failed_panel.pack(side=tk.RIGHT, fill=tk.Y, padx=5)
+    tk.Label(failed_panel, text="Not added:").pack()
+    failed_entries = tk.Listbox(failed_panel, width=40, height=20)
+    failed_entries.pack(fill=tk.Y, expand=True)
+    rapid_status = tk.Label(failed_panel)
+    rapid_status.pack()
+    tk.Button(failed_panel, text="Clear",
+              command=lambda: failed_entries.delete(0, tk.END)).pack()
+
+    def retype_failed(event=None):
+        selection = failed_entries.curselection()
+        if len(selection) > 0:
+            entry_field.delete(0, tk.END)
+            entry_field.insert(0, failed_entries.get(selection[0]).split(
+                " - ")[0])
+            failed_entries.delete(selection[0])
+            entry_field.focus_set()
+
+    failed_entries.bind("<Double-1>", retype_failed)
+
     # Add a label for the user input field
     tk.Label(user_interface, text="Your Expression:").pack()
 
@@ -55,13 +153,52 @@ def vocabulary_interface(deepl_key=""):
     entry_field = tk.Entry(user_interface, width=50)
     entry_field.pack()
 
+    # In the rapid-entry mode the Enter key adds the word in the background
+    # and the next word can be typed at once
+    rapid_mode = tk.BooleanVar(user_interface, value=False)
+    tk.Checkbutton(user_interface, text="Rapid entry (Enter adds the word)",
+                   variable=rapid_mode).pack()
+
     # Add a label for the translation field
     translation_field = tk.Label(user_interface)
     translation_field.pack()
 
-    # Add a label for the vocabulary list
-    vocabularies_overview = tk.Label(user_interface)
+    # Keep the store and the index up to date when an entry of the list is
+    # edited or deleted
+    def entry_edited(old_entry, new_entry):
+        update_entry(old_entry, new_entry, store_path)
+        remove_entries([old_entry])
+        index_entries([new_entry])
+
+    def entry_deleted(entry):
+        delete_entry(entry, store_path)
+        remove_entries([entry])
+
+    # Add a scrollable view of the vocabulary list
+    tk.Label(user_interface, text="Upload list:").pack()
+    vocabularies_overview = VocabularyView(user_interface, new_vocabularies,
+                                           on_edit=entry_edited,
+                                           on_delete=entry_deleted)
     vocabularies_overview.pack()
+    vocabularies_overview.refresh(scroll_to_end=True)
+
+    # Add a search box for the words of all stored vocabularies, the results
+    # are updated with every key
+    tk.Label(user_interface, text="Search:").pack()
+    search_field = tk.Entry(user_interface, width=50)
+    search_field.pack()
+    search_results = tk.Listbox(user_interface, width=80, height=5)
+    search_results.pack()
+
+    def show_search_results(event=None):
+        search_results.delete(0, tk.END)
+        for entry in search_entries(search_field.get()):
+            search_results.insert(
+                tk.END, f"English: {entry[0]}, Deutsch: {entry[1]}, "
+                f"Türkçe: {entry[2]}")
+
+    search_field.bind("<KeyRelease>",
+                      instrument("Search", show_search_results))
 
     # Create a dropdown menu for the source language selection
     source_languages = [
@@ -92,55 +229,142 @@ def vocabulary_interface(deepl_key=""):
                                              *target_languages)
     dropdown_target_language.pack()
 
+    # The last reviewed text and its language, adding it to the list does
+    # not review its spelling again
+    last_reviewed = {"text": None, "lang": None}
+
+    # Functions to continue translating and adding once all spelling
+    # mistakes are reviewed
+    def translate_reviewed(correct_text):
+        handle_translate(deepl_key, correct_text, src_lang_sel.get(),
+                         tgt_lang_sel.get(), entry_field, translation_field,
+                         check=False)
+        last_reviewed.update(text=entry_field.get(), lang=src_lang_sel.get())
+
+    def add_reviewed(correct_text):
+        count = len(new_vocabularies)
+        handle_add_to_list(deepl_key, correct_text, src_lang_sel.get(),
+                           entry_field, translation_field,
+                           vocabularies_overview, new_vocabularies,
+                           check=False)
+        if len(new_vocabularies) > count:
+            add_entry(new_vocabularies[-1], store_path)
+
+    translate_reviewed = instrument("Translate", translate_reviewed)
+    add_reviewed = instrument("Add", add_reviewed)
+
     # Add a button to translate user input
     trans_button = tk.Button(user_interface, text='Translate',
-                             command=lambda: handle_translate(
-                                                deepl_key,
+                             command=lambda: review_spelling(
+                                                user_interface,
                                                 entry_field.get(),
                                                 src_lang_sel.get(),
-                                                tgt_lang_sel.get(),
-                                                entry_field,
-                                                translation_field
+                                                translate_reviewed
                                                 )
                              )
     trans_button.pack(side=tk.LEFT, padx=5, pady=5)
 
+    def add_clicked():
+        if (entry_field.get() == last_reviewed["text"]
+                and src_lang_sel.get() == last_reviewed["lang"]):
+            add_reviewed(entry_field.get())
+        else:
+            review_spelling(user_interface, entry_field.get(),
+                            src_lang_sel.get(), add_reviewed)
+
     # Add a button to add user input to vocabulary list
     add_button = tk.Button(user_interface, text='Add to vocabulary list',
-                           command=lambda: handle_add_to_list(
-                                                deepl_key,
-                                                entry_field.get(),
-                                                src_lang_sel.get(),
-                                                entry_field,
-                                                translation_field,
-                                                vocabularies_overview,
-                                                new_vocabularies
-                                                )
-                           )
+                           command=add_clicked)
     add_button.pack(side=tk.LEFT, padx=5, pady=5)
 
+    # Add a label for the progress of the saves in the background
+    save_status = tk.Label(user_interface)
+    save_status.pack(side=tk.BOTTOM)
+    save_events = queue.Queue()
+
+    def show_save_events():
+        # The events are sent from the writer thread, so they are shown in
+        # the tkinter thread
+        while not save_events.empty():
+            event = save_events.get_nowait()
+            save_status.configure(text=describe_save_event(event))
+            if event["state"] == "saved":
+                messagebox.showinfo(title="Save successful",
+                                    message=describe_save_event(event))
+            elif event["state"] == "failed":
+                messagebox.showerror(title="ERROR",
+                                     message=describe_save_event(event))
+        user_interface.after(100, show_save_events)
+
+    show_save_events()
+
+    # Add the words of the rapid-entry mode in the order they were typed
+    def show_rapid_entries():
+        results = collect_entries(new_vocabularies, store_path)
+        for result in results:
+            if result["state"] == "failed":
+                failed_entries.insert(tk.END, result["text"] + " - "
+                                      + result["error"])
+        if any(result["state"] == "added" for result in results):
+            with measure("rendering"):
+                vocabularies_overview.refresh(scroll_to_end=True)
+        pending = count_pending_entries()
+        rapid_status.configure(text=f"{pending} word(s) waiting"
+                               if pending > 0 else "")
+        user_interface.after(100, show_rapid_entries)
+
+    show_rapid_entries()
+
+    # Release the dictionaries that were not used for a while, also if no
+    # other dictionary is requested
+    schedule_eviction(user_interface)
+
+    entry_field.bind("<Return>", instrument(
+        "Rapid entry", lambda event: handle_rapid_entry(
+            deepl_key, entry_field.get(), src_lang_sel.get(), entry_field,
+            rapid_status) if rapid_mode.get() else None))
+
     # Add a button to save vocabulary list to a file
     save_file_button = tk.Button(user_interface, text='Save vocabulary list',
-                                 command=lambda: handle_save(new_vocabularies))
+                                 command=instrument(
+                                     "Save", lambda: handle_save(
+                                         new_vocabularies, use_store=True,
+                                         store_path=store_path,
+                                         on_event=save_events.put)))
     save_file_button.pack(side=tk.LEFT, padx=5, pady=5)
 
+    # Add a button to import a saved vocabulary list
+    import_button = tk.Button(user_interface, text='Import vocabulary list',
+                              command=instrument("Import",
+                                                 lambda: handle_import(
+                                                     new_vocabularies,
+                                                     vocabularies_overview,
+                                                     store_path)))
+    import_button.pack(side=tk.LEFT, padx=5, pady=5)
+
     # Add a button to quit the program
     end_button = tk.Button(user_interface, text='Quit',
                            command=user_interface.destroy)
     end_button.pack(side=tk.LEFT, padx=5, pady=5)
 
-    # Run the tkinter main loop
+    # Run the tkinter main loop, finish the saves that are still running and
+    # write the metrics of the session
     user_interface.mainloop()
+    stop_monitor()
+    wait_for_saves(timeout=60)
+    write_metrics()
 
 
+@profiled
 def handle_translate(key="", in_text="", src_lang="", tgt_lang="",
-                     enter_field=None, translation_field=None):
+                     enter_field=None, translation_field=None, check=True):
     """
     Translate the input text and displays the result in the translation_field.
 
-    The input text get translated with translate_string from the source
+    The input text get translated with translate_cached from the source
     language to the target language and displays the translation and source
-    language in the translation_field.
+    language in the translation_field. The translations into the other
+    languages are requested in the background.
 
     Args:
     - in_text (str): The input text to be translated.
@@ -149,6 +373,8 @@ def handle_translate(key="", in_text="", src_lang="", tgt_lang="",
     - enter_field (tk.Entry): The input field for entering the text.
     - translation_field (tk.Label): The field for displaying the translation
     and source language.
+    - check (bool): If False, the spelling of in_text was already reviewed
+    and is not checked again.
 
     Returns:
     - None
@@ -203,7 +429,8 @@ def handle_translate(key="", in_text="", src_lang="", tgt_lang="",
 
         # Check spelling of input text
         try:
-            correct_text = check_spelling(in_text, src_lang)
+            correct_text = (check_spelling(in_text, src_lang) if check
+                            else in_text)
         except ValueError:
             # If input text contains unrecognized words empty the
             # display filed and do nothing more
@@ -214,10 +441,11 @@ def handle_translate(key="", in_text="", src_lang="", tgt_lang="",
         enter_field.delete(0, tk.END)
         enter_field.insert(0, correct_text)
 
-        # Translate input text
+        # Translate input text, a kept translation is reused
         try:
-            output = translate_string(key, correct_text,
-                                      src_lang, tgt_lang)
+            with measure("translation"):
+                output = translate_cached(key, correct_text,
+                                          src_lang, tgt_lang)
         except ValueError:
             return
 
@@ -228,19 +456,31 @@ def handle_translate(key="", in_text="", src_lang="", tgt_lang="",
         )
 
         # Display translation and source language
-        translation_field.configure(text=msg)
+        with measure("rendering"):
+            translation_field.configure(text=msg)
+
+        # Request the other translations in the background, they are needed
+        # if the text is added to the vocabulary list
+        prefetch_translations(key, correct_text, src_lang,
+                              [lang for lang in LANGUAGES
+                               if lang != tgt_lang])
 
     # If input text is empty display a info message
     else:
         translation_field.configure(text="No word entered. Please try again.")
 
 
+@profiled
+@traced("add to vocabulary list")
 def handle_add_to_list(key="", in_text="", src_lang="", enter_field=None,
                        translation_field=None, trans_list_field=None,
-                       trans_list=[]):
+                       trans_list=[], check=True):
     """
     Add a word to the translation upload list.
 
+    If the word is already in the vocabulary list, its stored translations
+    are shown and the word is neither translated nor added again.
+
     Args:
         - in_text (str): The word to be added to the upload list.
         - src_lang (str): The source language of the word.
@@ -248,13 +488,18 @@ def handle_add_to_list(key="", in_text="", src_lang="", enter_field=None,
         inputs the word.
         - translation_field (tk.Label): The Tkinter Label widget where feedback
         messages are displayed.
-        - trans_list_field (tk.Label): The Tkinter Label widget where the
-        current upload list is displayed.
+        - trans_list_field (VocabularyView): The view where the current
+        upload list is displayed.
         - trans_list (list): The list where uploaded words are stored.
+        - check (bool): If False, the spelling of in_text was already
+        reviewed and is not checked again.
 
     Returns:
         - list: The updated list of uploaded words.
     """
+    set_attribute("language", src_lang)
+    set_attribute("chars", len(in_text) if isinstance(in_text, str) else 0)
+
     # Create titles and messages for error messages
     titles = {
         "key": "key must be a string",
@@ -276,65 +521,82 @@ def handle_add_to_list(key="", in_text="", src_lang="", enter_field=None,
         "trans_list": "The input variable trans_list must be a list"
     }
     # Check types of function parameters
-    if not isinstance(key, str):
-        messagebox.showerror(title=titles["key"], message=messages["key"])
-        return
-    if not isinstance(in_text, str):
-        messagebox.showerror(title=titles["in_text"],
-                             message=messages["in_text"])
-        return
-    if not isinstance(src_lang, str):
-        messagebox.showerror(title=titles["src_lang"],
-                             message=messages["src_lang"])
-        return
-    if not isinstance(enter_field, tk.Entry):
-        messagebox.showerror(title=titles["enter_field"],
-                             message=messages["enter_field"])
-        return
-    if not isinstance(translation_field, tk.Label):
-        messagebox.showerror(title=titles["translation_field"],
-                             message=messages["translation_field"])
-        return
-    if not isinstance(trans_list, list):
-        messagebox.showerror(title=titles["trans_list"],
-                             message=messages["trans_list"])
-        return
+    with span("validation"):
+        if not isinstance(key, str):
+            messagebox.showerror(title=titles["key"], message=messages["key"])
+            return
+        if not isinstance(in_text, str):
+            messagebox.showerror(title=titles["in_text"],
+                                 message=messages["in_text"])
+            return
+        if not isinstance(src_lang, str):
+            messagebox.showerror(title=titles["src_lang"],
+                                 message=messages["src_lang"])
+            return
+        if not isinstance(enter_field, tk.Entry):
+            messagebox.showerror(title=titles["enter_field"],
+                                 message=messages["enter_field"])
+            return
+        if not isinstance(translation_field, tk.Label):
+            messagebox.showerror(title=titles["translation_field"],
+                                 message=messages["translation_field"])
+            return
+        if not isinstance(trans_list, list):
+            messagebox.showerror(title=titles["trans_list"],
+                                 message=messages["trans_list"])
+            return
 
     # Check if word is entered
     if len(in_text) > 0:
         try:
             # Check spelling of the entered word
-            correct_text = check_spelling(in_text, src_lang)
+            with span("spell-check", {"reviewed": not check}):
+                correct_text = (check_spelling(in_text, src_lang) if check
+                                else in_text)
         except ValueError:
             # If input text contains unrecognized words do nothing
             return
 
+        # Show the stored translations of a word that is already known
+        with span("lookup"):
+            known_entry = find_entry(correct_text, src_lang)
+            set_attribute("known", known_entry is not None)
+        if known_entry is not None:
+            enter_field.delete(0, tk.END)
+            translation_field.configure(
+                text=f"'{correct_text}' is already in the vocabulary list: "
+                f"English: {known_entry[0]}, Deutsch: {known_entry[1]}, "
+                f"Türkçe: {known_entry[2]}")
+            return trans_list
+
         # List of abbreviated languages for translation
         language_list = ["English", "Deutsch", "Türkçe"]
 
-        # Get current upload list and add new word to it
-        translation_list_str = str(trans_list_field.cget("text"))
-        if len(translation_list_str) <= 0:
-            translation_list_str = "Upload list:\n"
-        else:
-            translation_list_str += "\n"
-
         # Translate the entered word to each language in the language_list
-        # and add the translations to the upload list string
         tmp_word_list = []
         for lang in language_list:
             try:
-                output = translate_string(key, correct_text, src_lang, lang)
+                with measure("translation"), span(
+                        "translate", {"language": lang,
+                                      "chars": len(correct_text)}):
+                    output = translate_cached(key, correct_text, src_lang,
+                                              lang)
             except ValueError:
                 return
             tmp_word_list.append(output[0])
-            translation_list_str += f"{lang}: {output[0]}, "
-        translation_list_str = translation_list_str[:-2]
-        trans_list_field.configure(text=translation_list_str)
 
         # Add the translated words and the current datetime to trans_list
-        tmp_word_list.append(str(datetime.datetime.now()))
-        trans_list.append(tmp_word_list)
+        # and show the new entry in the last row of the upload list
+        with span("build entry"):
+            tmp_word_list.append(datetime.datetime.now())
+            entry = VocabularyEntry.from_list(tmp_word_list,
+                                              source=output[1])
+        with span("append", {"entries": len(trans_list) + 1}):
+            trans_list.append(entry)
+            index_entries([entry])
+        if trans_list_field is not None:
+            with measure("rendering"), span("render"):
+                trans_list_field.refresh(scroll_to_end=True)
 
         # Clear the input field
         enter_field.delete(0, tk.END)
@@ -351,13 +613,22 @@ def handle_add_to_list(key="", in_text="", src_lang="", enter_field=None,
         translation_field.configure(text="No word entered. Please try again.")
 
 
-def handle_save(vocabulary_list=[]):
+@profiled
+def handle_save(vocabulary_list=[], use_store=False, store_path=None,
+                on_event=None):
     """
-    Save the vocabulary list as an Anki or Excel file.
+    Save the vocabulary list as an Anki, Excel, CSV, Parquet or Feather file.
 
     Args:
     - vocabulary_list (list): List of tuples containing English, German,
     and Turkish words.
+    - use_store (bool): If True, the entries of the vocabulary store that
+    were not yet exported to the selected file are saved instead of the
+    vocabulary list.
+    - store_path (str): Path of the vocabulary store. If None, the path of
+    the configuration is used.
+    - on_event (function): If given, the file is saved in the background by
+    the save queue and the function is called with its progress events.
 
     Returns:
     - None
@@ -366,22 +637,30 @@ def handle_save(vocabulary_list=[]):
     messages = {
         "info": ("If an existing file is selected, a window will appear "
                  "asking if the file should be replaced. If 'yes' is "
-                 "selected, Anki (.apkg) files will be replaced and Excel "
-                 "(.xlsx) files will be appended."),
-        "filetype": "Please choose .xlsx or .apkg as file type.",
+                 "selected, the new words will be appended to the file. "
+                 "Words that are already in the file are not added again."),
+        "filetype": ("Please choose .apkg, .xlsx, .csv, .parquet or .feather "
+                     "as file type."),
         "path": "No path selected.",
-        "empty": "No words to add were found."
+        "empty": "No words to add were found.",
+        "exported": "All words are already saved in this file.",
+        "success": " new word(s) added to the vocabulary list file.",
+        "error": ("Error: The file is either being opened by another "
+                  "application or this program doesn't have access to it.")
     }
 
     titles = {
         "info": "Information",
         "filetype": "Save the file as an Anki or Excel file",
         "path": "Warning",
-        "empty": "Save not successful"
+        "empty": "Save not successful",
+        "exported": "Nothing to save",
+        "success": "Save successful",
+        "error": "ERROR"
     }
 
     # Check if there are words in the vocabulary list
-    if not vocabulary_list:
+    if not vocabulary_list and not use_store:
         messagebox.showwarning(title=titles["empty"],
                                message=messages["empty"])
         return
@@ -397,6 +676,9 @@ def handle_save(vocabulary_list=[]):
             filetypes=[
                 ("Anki file (.apkg)", "*.apkg"),
                 ("Excel file (.xlsx)", "*.xlsx"),
+                ("CSV file (.csv)", "*.csv"),
+                ("Parquet file (.parquet)", "*.parquet"),
+                ("Feather file (.feather)", "*.feather"),
                 ("All files", "*.*")
             ],
             defaultextension=".apkg",
@@ -413,18 +695,150 @@ def handle_save(vocabulary_list=[]):
 
         # Get the extension of the selected file
         extension = os.path.splitext(file_path)[1].lower()
-
-        if extension == ".apkg":
-            # Call a function to save the vocabulary list as an Anki file
-            save_list_as_apkg(vocabulary_list, file_path)
-            break
-        elif extension == ".xlsx":
-            # Call a function to save the vocabulary list as an Excel file
-            save_list_as_xlsx(vocabulary_list, file_path)
-            break
-        else:
+        if extension not in [".apkg", ".xlsx", ".csv", ".parquet",
+                             ".feather"]:
             # If the extension is unsupported, ask the user to retry or cancel
             if not messagebox.askretrycancel(title=titles["filetype"],
                                              message=messages["filetype"]):
                 break
             continue
+
+        if use_store:
+            # Only save the entries that are not yet in the selected file
+            word_list, last_id = get_unexported_entries(file_path,
+                                                        store_path)
+            if not word_list:
+                messagebox.showinfo(title=titles["exported"],
+                                    message=messages["exported"])
+                break
+        else:
+            word_list = vocabulary_list
+
+        if on_event is not None:
+            # Save the words in the background and move the export
+            # watermark of the file once the words are saved
+            def mark_saved(count):
+                mark_exported(file_path, last_id, store_path)
+
+            submit_save(word_list, file_path, on_event,
+                        mark_saved if use_store else None)
+            break
+
+        # Save the vocabulary list with the export pipeline and ask to retry
+        # if the file can't be written, e.g. because it is being opened by
+        # another application
+        saved = None
+        while True:
+            try:
+                report = export_all(word_list, [file_path])
+            except ValueError as error:
+                messagebox.showwarning(title=titles["empty"],
+                                       message=str(error))
+                break
+            if len(report["failed"]) <= 0:
+                saved = sum(report["saved"].values())
+                break
+            if not messagebox.askretrycancel(
+                    title=titles["error"],
+                    message=(messages["error"] + "\n\n"
+                             + describe_export_report(report))):
+                break
+
+        if saved == 0:
+            messagebox.showinfo(title=titles["exported"],
+                                message=messages["exported"])
+        elif saved is not None:
+            messagebox.showinfo(title=titles["success"],
+                                message=str(saved) + messages["success"])
+
+        # Move the export watermark of the file if the words were saved
+        if use_store and saved is not None:
+            mark_exported(file_path, last_id, store_path)
+        break
+
+
+def handle_import(vocabulary_list=[], trans_list_field=None, store_path=None):
+    """
+    Import the words of an Anki or Excel file into the vocabulary list.
+
+    Words that are already in the vocabulary list or the vocabulary store
+    are not imported again.
+
+    Args:
+    - vocabulary_list (list): The vocabulary list, the imported words are
+    appended.
+    - trans_list_field (VocabularyView): The view where the uploaded words
+    are displayed.
+    - store_path (str): Path of the vocabulary store. If None, the path of
+    the configuration is used.
+
+    Returns:
+    - int: The number of imported words, or None if nothing was imported.
+    """
+    # Define titles and messages for the message boxes
+    messages = {
+        "error": "The file could not be imported: ",
+        "success": " new word(s) imported into the vocabulary list."
+    }
+
+    titles = {
+        "select": "Import an Anki or Excel file",
+        "error": "ERROR",
+        "success": "Import successful"
+    }
+
+    file_path = filedialog.askopenfilename(
+        title=titles["select"],
+        initialdir="./",
+        filetypes=[
+            ("Anki or Excel file", "*.apkg *.xlsx"),
+            ("Anki file (.apkg)", "*.apkg"),
+            ("Excel file (.xlsx)", "*.xlsx")
+        ]
+    )
+    if not file_path:
+        return None
+
+    try:
+        count = import_list(file_path, vocabulary_list, store_path)
+    except (OSError, ValueError, zipfile.BadZipFile) as error:
+        messagebox.showerror(title=titles["error"],
+                             message=messages["error"] + str(error))
+        return None
+
+    # Show the last imported words
+    if count > 0 and trans_list_field is not None:
+        trans_list_field.refresh(scroll_to_end=True)
+    messagebox.showinfo(title=titles["success"],
+                        message=str(count) + messages["success"])
+    return count
+
+
+def handle_rapid_entry(key="", in_text="", src_lang="", enter_field=None,
+                       status_field=None):
+    """
+    Submit the entered word to be added in the background.
+
+    The input field is cleared at once, so the next word can be typed while
+    the word is checked and translated. The word is added to the vocabulary
+    list by collect_entries.
+
+    Args:
+    - key (str): Key for the translation functions with DeepL.
+    - in_text (str): The word to be added to the upload list.
+    - src_lang (str): The source language of the word.
+    - enter_field (tk.Entry): The Tkinter Entry widget where the user
+    inputs the word.
+    - status_field (tk.Label): The label for the number of waiting words.
+
+    Returns:
+    - int: The number of waiting words.
+    """
+    with span("rapid entry", {"language": src_lang,
+                              "chars": len(in_text)}):
+        pending = submit_entry(key, in_text, src_lang)
+    if enter_field is not None:
+        enter_field.delete(0, tk.END)
+    if status_field is not None and pending > 0:
+        status_field.configure(text=f"{pending} word(s) waiting")
+    return pending
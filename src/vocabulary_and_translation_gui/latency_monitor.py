@@ -0,0 +1,295 @@
+"""
+All functions for measuring how long the GUI is blocked.
+
+When the monitor is started, a heartbeat scheduled with after() measures
+how late the event loop runs it, and the callbacks of the buttons and their
+phases, e.g. spell-check, translation and rendering, are timed. A status
+bar shows the median and the 95th percentile of each measurement.
+
+A watchdog thread samples the stack of the tkinter thread while the event
+loop is blocked for longer than the stall threshold. The samples of each
+stall are written to the log file, so the code behind a freeze can be
+found.
+
+Without a started monitor, instrument returns the callbacks unchanged and
+measure does nothing.
+
+Functions:
+- start_monitor(widget, status_label, interval, stall_threshold, log_path)
+- stop_monitor()
+- instrument(name, callback)
+- measure(name)
+- record_duration(name, seconds)
+- get_percentiles(name)
+- describe_latency()
+- clear_measurements()
+"""
+
+import collections
+import contextlib
+import functools
+import logging
+import math
+import os
+import sys
+import threading
+import time
+import traceback
+from vocabulary_and_translation_gui.config import LATENCY_LOG
+
+# Name of the measurement of the heartbeat
+LAG = "event loop lag"
+
+# Number of durations kept for each measurement
+MAX_DURATIONS = 1000
+
+# Seconds between two stack samples of a stall
+SAMPLE_INTERVAL = 0.05
+
+# Logger for the stalls, the handler is added by start_monitor
+logger = logging.getLogger(__name__)
+
+# Last durations of each measurement in seconds, e.g.
+# {"translation": deque([0.31, 0.28])}
+_durations = {}
+
+# State of the running monitor, None if no monitor is running
+_monitor = None
+
+# Does nothing for measure if no monitor is running
+_NOT_MEASURED = contextlib.nullcontext()
+
+# Lock for the durations, the watchdog runs in a thread
+_lock = threading.Lock()
+
+
+def start_monitor(widget=None, status_label=None, interval=100,
+                  stall_threshold=0.25, log_path=None):
+    """
+    Start measuring the event loop of a tkinter window.
+
+    Args:
+    - widget (tk.Tk): The window whose event loop is measured.
+    - status_label (tk.Label): Label for the percentiles, or None.
+    - interval (int): Milliseconds between two heartbeats.
+    - stall_threshold (float): Seconds the event loop has to be blocked
+    before the stack of the tkinter thread is sampled.
+    - log_path (str): Path of the log file for the stalls. If None, the
+    path of the configuration is used.
+
+    Returns:
+    - None
+    """
+    global _monitor
+
+    stop_monitor()
+
+    # If the directory for the log not exist, a new directory get created
+    log_path = str(log_path or LATENCY_LOG)
+    if not os.path.exists(os.path.dirname(log_path)):
+        os.makedirs(os.path.dirname(log_path))
+    handler = logging.FileHandler(log_path, delay=True, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+    now = time.perf_counter()
+    monitor = _monitor = {
+        "widget": widget,
+        "interval": interval / 1000,
+        "last_beat": now,
+        "shown": now,
+        "after_id": None,
+        "handler": handler,
+        "stop": threading.Event(),
+        "thread_id": threading.get_ident()
+    }
+
+    def beat():
+        # The lag is the time the heartbeat runs later than scheduled
+        now = time.perf_counter()
+        record_duration(LAG, max(0.0, now - monitor["last_beat"]
+                                 - monitor["interval"]))
+        monitor["last_beat"] = now
+        if status_label is not None and now - monitor["shown"] >= 1:
+            status_label.configure(text=describe_latency())
+            monitor["shown"] = now
+        monitor["after_id"] = widget.after(interval, beat)
+
+    monitor["after_id"] = widget.after(interval, beat)
+    monitor["watchdog"] = threading.Thread(
+        target=_watch, args=(monitor, stall_threshold), name="watchdog",
+        daemon=True)
+    monitor["watchdog"].start()
+
+
+def stop_monitor():
+    """
+    Stop the running monitor.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    global _monitor
+
+    monitor, _monitor = _monitor, None
+    if monitor is None:
+        return
+    monitor["stop"].set()
+    monitor["watchdog"].join()
+    try:
+        monitor["widget"].after_cancel(monitor["after_id"])
+    except Exception:
+        # The window is already destroyed
+        pass
+    logger.removeHandler(monitor["handler"])
+    monitor["handler"].close()
+
+
+def instrument(name="", callback=None):
+    """
+    Time every call of a callback while the monitor is running.
+
+    Args:
+    - name (str): Name of the measurement, e.g. "Translate".
+    - callback (function): The callback of a button or an event.
+
+    Returns:
+    - function: The timed callback, or the callback itself if no monitor is
+    running.
+    """
+    if _monitor is None:
+        return callback
+
+    @functools.wraps(callback)
+    def timed_callback(*args, **kwargs):
+        with measure(name):
+            return callback(*args, **kwargs)
+
+    return timed_callback
+
+
+def measure(name=""):
+    """
+    Return a context manager that times its block.
+
+    Args:
+    - name (str): Name of the measurement, e.g. "translation".
+
+    Returns:
+    - contextlib.AbstractContextManager: The context manager.
+    """
+    if _monitor is None:
+        return _NOT_MEASURED
+    return _timed(name)
+
+
+def record_duration(name="", seconds=0.0):
+    """
+    Record a duration of a measurement.
+
+    Args:
+    - name (str): Name of the measurement.
+    - seconds (float): The duration.
+
+    Returns:
+    - None
+    """
+    with _lock:
+        if name not in _durations:
+            _durations[name] = collections.deque(maxlen=MAX_DURATIONS)
+        _durations[name].append(seconds)
+
+
+def get_percentiles(name=""):
+    """
+    Return the median and the 95th percentile of a measurement.
+
+    Args:
+    - name (str): Name of the measurement.
+
+    Returns:
+    - tuple: The median and the 95th percentile in seconds, or None if the
+    measurement has no durations.
+    """
+    with _lock:
+        durations = sorted(_durations.get(name, ()))
+    if len(durations) <= 0:
+        return None
+    return tuple(durations[max(0, math.ceil(p * len(durations)) - 1)]
+                 for p in (0.5, 0.95))
+
+
+def describe_latency():
+    """
+    Describe all measurements in one line for the status bar.
+
+    Returns:
+    - str: The median and the 95th percentile of each measurement in
+    milliseconds, the event loop lag first.
+    """
+    with _lock:
+        names = sorted(_durations, key=lambda name: (name != LAG, name))
+    parts = []
+    for name in names:
+        percentiles = get_percentiles(name)
+        if percentiles is not None:
+            parts.append(f"{name} p50 {percentiles[0] * 1000:.0f} ms, "
+                         f"p95 {percentiles[1] * 1000:.0f} ms")
+    return " | ".join(parts)
+
+
+def clear_measurements():
+    """
+    Remove all recorded durations.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    with _lock:
+        _durations.clear()
+
+
+@contextlib.contextmanager
+def _timed(name):
+    # Record the duration of the block, also if it raises an error
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_duration(name, time.perf_counter() - start)
+
+
+def _watch(monitor, stall_threshold):
+    # Sample the stack of the tkinter thread while no heartbeat arrives and
+    # log the samples when the event loop runs again
+    samples = []
+    started = None
+    while not monitor["stop"].wait(SAMPLE_INTERVAL):
+        blocked = (time.perf_counter() - monitor["last_beat"]
+                   - monitor["interval"])
+        if blocked > stall_threshold:
+            if started is None:
+                started = monitor["last_beat"] + monitor["interval"]
+            frame = sys._current_frames().get(monitor["thread_id"])
+            if frame is not None:
+                samples.append("".join(traceback.format_stack(frame)))
+        elif started is not None:
+            _log_stall(monitor["last_beat"] - started, samples)
+            samples = []
+            started = None
+
+
+def _log_stall(seconds, samples):
+    # Write the most frequent stacks of a stall to the log
+    stacks = collections.Counter(samples).most_common(3)
+    logger.warning(
+        "Event loop blocked for %.2f s, %d stack samples.\n%s", seconds,
+        len(samples), "\n".join(f"{count} sample(s):\n{stack}"
+                                for stack, count in stacks))
@@ -0,0 +1,300 @@
+"""
+All functions for counting the requests, characters and durations of the
+application.
+
+Counters and histograms are kept in memory, each value for a combination of
+labels, e.g. the DeepL requests for each pair of languages. When the GUI is
+closed, the metrics are written to the metrics folder as Prometheus text
+file, which can be collected by the textfile collector of the node exporter,
+and as JSON snapshot.
+
+The metrics of the application are:
+- deepl_requests_total and deepl_characters_total (source, target, kind):
+requests and characters sent to DeepL, which are billed by character.
+- deepl_request_seconds (kind): duration of the DeepL requests.
+- translation_cache_total (result): kept translations that were reused
+("hit") or had to be requested ("miss").
+- spell_check_seconds and spell_check_words_total (language, result):
+duration of the spelling checks and the checked words.
+- dictionary_loads_total (language) and dictionary_load_seconds: loaded
+enchant dictionaries.
+- save_seconds and saved_words_total (format): duration of the savers and
+the words written to the files.
+- errors_total (operation, type): errors of the measured operations.
+
+Functions:
+- increment(name, amount, labels)
+- observe(name, value, labels)
+- measure_time(name, labels)
+- timed(name, labels, count)
+- get_metrics()
+- format_prometheus(metrics)
+- write_metrics(directory)
+- clear_metrics()
+"""
+
+import bisect
+import contextlib
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+from vocabulary_and_translation_gui.config import METRICS
+
+# Upper bounds of the histogram buckets in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+           30.0, 60.0)
+
+# Descriptions of the metrics for the Prometheus text file
+DESCRIPTIONS = {
+    "deepl_requests_total": "Requests sent to DeepL.",
+    "deepl_characters_total": "Characters sent to DeepL.",
+    "deepl_request_seconds": "Duration of the DeepL requests.",
+    "translation_cache_total": "Lookups of kept translations.",
+    "spell_check_seconds": "Duration of the spelling checks.",
+    "spell_check_words_total": "Words checked for spelling mistakes.",
+    "dictionary_loads_total": "Loaded enchant dictionaries.",
+    "dictionary_load_seconds": "Duration of loading a dictionary.",
+    "save_seconds": "Duration of saving a word list to a file.",
+    "saved_words_total": "Words written to files.",
+    "errors_total": "Errors of the measured operations."
+}
+
+# Values of the counters for each combination of labels, e.g.
+# {"deepl_requests_total": {(("source", "DE"), ("target", "EN-GB")): 3}}
+_counters = {}
+
+# Bucket counts, sum and count of the histograms for each combination of
+# labels, e.g. {"save_seconds": {(("format", "xlsx"),): {"buckets": [...],
+# "sum": 1.5, "count": 2}}}
+_histograms = {}
+
+# Lock for the metrics, they are recorded from several threads
+_lock = threading.Lock()
+
+
+def increment(name="", amount=1, labels=None):
+    """
+    Add an amount to a counter.
+
+    Args:
+    - name (str): Name of the counter, e.g. "deepl_requests_total".
+    - amount (int): The amount to add.
+    - labels (dict): The labels of the value, e.g. {"target": "EN-GB"}.
+
+    Returns:
+    - None
+    """
+    key = _label_key(labels)
+    with _lock:
+        values = _counters.setdefault(name, {})
+        values[key] = values.get(key, 0) + amount
+
+
+def observe(name="", value=0.0, labels=None):
+    """
+    Add a value to a histogram.
+
+    Args:
+    - name (str): Name of the histogram, e.g. "save_seconds".
+    - value (float): The observed value, e.g. a duration in seconds.
+    - labels (dict): The labels of the value.
+
+    Returns:
+    - None
+    """
+    key = _label_key(labels)
+    with _lock:
+        values = _histograms.setdefault(name, {})
+        histogram = values.get(key)
+        if histogram is None:
+            histogram = values[key] = {"buckets": [0] * (len(BUCKETS) + 1),
+                                       "sum": 0.0, "count": 0}
+        histogram["buckets"][bisect.bisect_left(BUCKETS, value)] += 1
+        histogram["sum"] += value
+        histogram["count"] += 1
+
+
+@contextlib.contextmanager
+def measure_time(name="", labels=None):
+    """
+    Add the duration of a block to a histogram.
+
+    If the block raises an error, the error is counted in errors_total with
+    the name of the histogram as operation and the error is raised again.
+
+    Args:
+    - name (str): Name of the histogram.
+    - labels (dict): The labels of the duration.
+
+    Returns:
+    - contextlib.AbstractContextManager: The context manager.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as error:
+        increment("errors_total", labels={"operation": name,
+                                          "type": type(error).__name__})
+        raise
+    finally:
+        observe(name, time.perf_counter() - start, labels)
+
+
+def timed(name="", labels=None, count=None):
+    """
+    Return a decorator that measures every call of a function.
+
+    Args:
+    - name (str): Name of the histogram for the durations.
+    - labels (dict): The labels of the durations.
+    - count (str): Name of a counter the returned number is added to, e.g.
+    the number of saved words. If None, nothing is counted.
+
+    Returns:
+    - function: The decorator.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def timed_function(*args, **kwargs):
+            with measure_time(name, labels):
+                result = function(*args, **kwargs)
+            if count is not None and isinstance(result, int):
+                increment(count, result, labels)
+            return result
+
+        return timed_function
+
+    return decorator
+
+
+def get_metrics():
+    """
+    Return a snapshot of all metrics.
+
+    Returns:
+    - dict: The "counters" and "histograms", each a list of dictionaries with
+    the "labels" and the "value", or the cumulative "buckets", the "sum" and
+    the "count" of a histogram, for each metric.
+    """
+    with _lock:
+        counters = {
+            name: [{"labels": dict(key), "value": value}
+                   for key, value in sorted(values.items())]
+            for name, values in sorted(_counters.items())
+        }
+        histograms = {}
+        for name, values in sorted(_histograms.items()):
+            histograms[name] = []
+            for key, histogram in sorted(values.items()):
+                cumulative, buckets = 0, {}
+                for bound, bucket in zip(BUCKETS + ("+Inf",),
+                                         histogram["buckets"]):
+                    cumulative += bucket
+                    buckets[str(bound)] = cumulative
+                histograms[name].append({
+                    "labels": dict(key), "buckets": buckets,
+                    "sum": histogram["sum"], "count": histogram["count"]})
+    return {"counters": counters, "histograms": histograms}
+
+
+def format_prometheus(metrics=None):
+    """
+    Format the metrics in the Prometheus text format.
+
+    Args:
+    - metrics (dict): A snapshot of get_metrics. If None, a new snapshot is
+    taken.
+
+    Returns:
+    - str: The text with one line for each value.
+    """
+    metrics = get_metrics() if metrics is None else metrics
+    lines = []
+    for name, values in metrics["counters"].items():
+        lines += _describe(name, "counter")
+        lines += [f"{name}{_format_labels(value['labels'])} {value['value']}"
+                  for value in values]
+    for name, values in metrics["histograms"].items():
+        lines += _describe(name, "histogram")
+        for value in values:
+            for bound, bucket in value["buckets"].items():
+                labels = dict(value["labels"], le=bound)
+                lines.append(f"{name}_bucket{_format_labels(labels)} "
+                             f"{bucket}")
+            labels = _format_labels(value["labels"])
+            lines.append(f"{name}_sum{labels} {value['sum']}")
+            lines.append(f"{name}_count{labels} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(directory=None):
+    """
+    Write the metrics as Prometheus text file and as JSON snapshot.
+
+    The files metrics.prom and metrics.json are replaced at once, so a
+    collector never reads a half written file.
+
+    Args:
+    - directory (str): Folder for the files. If None, the metrics folder of
+    the configuration is used.
+
+    Returns:
+    - None
+    """
+    directory = str(directory or METRICS)
+
+    # If the directory for the metrics not exist, a new directory get created
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    metrics = get_metrics()
+    snapshot = dict(created=datetime.datetime.now().isoformat(
+        timespec="seconds"), **metrics)
+    for name, text in (
+            ("metrics.prom", format_prometheus(metrics)),
+            ("metrics.json", json.dumps(snapshot, indent=2,
+                                        ensure_ascii=False))):
+        path = os.path.join(directory, name)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(path + ".tmp", path)
+
+
+def clear_metrics():
+    """
+    Remove all recorded metrics.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def _label_key(labels):
+    # Labels as sorted tuple, so they can be used as key of a dictionary
+    return tuple(sorted((str(name), str(value))
+                        for name, value in (labels or {}).items()))
+
+
+def _format_labels(labels):
+    # Format labels like {source="DE",target="EN-GB"}
+    if len(labels) <= 0:
+        return ""
+    return "{" + ",".join(
+        f'{name}="' + str(value).replace("\\", "\\\\").replace(
+            '"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in labels.items()) + "}"
+
+
+def _describe(name, kind):
+    # The help and type lines of a metric
+    return [f"# HELP {name} {DESCRIPTIONS.get(name, name)}",
+            f"# TYPE {name} {kind}"]
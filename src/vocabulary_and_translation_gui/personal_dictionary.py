@@ -0,0 +1,122 @@
+"""
+All functions for the personal word lists of the user.
+
+Words the user always wants to accept, e.g. names or technical terms, are
+saved in one text file per dictionary language. The words are loaded once
+into a set, so the spelling check can look them up before asking enchant.
+
+Functions:
+- get_personal_words(dictionary_language, folder)
+- is_personal_word(word, dictionary_language, folder)
+- add_personal_word(word, dictionary_language, folder)
+- clear_personal_words()
+"""
+
+import os
+import threading
+from vocabulary_and_translation_gui.config import PERSONAL_DICTIONARIES
+
+# Loaded personal words, e.g. {(folder, "en_GB"): {"Bonn", "pytask"}}
+_personal_words = {}
+
+# Lock for the loaded words and the files, words can be added from a thread
+_lock = threading.RLock()
+
+
+def get_personal_words(dictionary_language="", folder=None):
+    """
+    Return the personal words of a language and load them if needed.
+
+    Args:
+    - dictionary_language (str): Abbreviation of the dictionary, e.g. "en_GB".
+    - folder (str): Folder of the word list files. If None, the folder of the
+    configuration is used.
+
+    Returns:
+    - set: The personal words of the language.
+    """
+    if folder is None:
+        folder = PERSONAL_DICTIONARIES
+    key = (str(folder), dictionary_language)
+
+    with _lock:
+        if key not in _personal_words:
+            words = set()
+            file_path = os.path.join(folder, dictionary_language + ".txt")
+
+            # Read the word list file if it exists, one word on each line
+            if os.path.exists(file_path):
+                with open(file_path, encoding="utf-8") as f:
+                    words = {line.strip() for line in f if line.strip()}
+            _personal_words[key] = words
+
+        return _personal_words[key]
+
+
+def is_personal_word(word="", dictionary_language="", folder=None):
+    """
+    Check if a word is in the personal word list of a language.
+
+    Args:
+    - word (str): The word to look up.
+    - dictionary_language (str): Abbreviation of the dictionary, e.g. "en_GB".
+    - folder (str): Folder of the word list files. If None, the folder of the
+    configuration is used.
+
+    Returns:
+    - bool: True if the word is in the personal word list.
+    """
+    return word in get_personal_words(dictionary_language, folder)
+
+
+def add_personal_word(word="", dictionary_language="", folder=None):
+    """
+    Add a word to the personal word list of a language.
+
+    The word is added to the loaded set and appended to the word list file.
+
+    Args:
+    - word (str): The word to add.
+    - dictionary_language (str): Abbreviation of the dictionary, e.g. "en_GB".
+    - folder (str): Folder of the word list files. If None, the folder of the
+    configuration is used.
+
+    Returns:
+    - bool: True if the word was added, False if it is empty or already in
+    the word list.
+    """
+    if folder is None:
+        folder = PERSONAL_DICTIONARIES
+    word = word.strip()
+    if len(word) <= 0 or len(dictionary_language) <= 0:
+        return False
+
+    with _lock:
+        words = get_personal_words(dictionary_language, folder)
+        if word in words:
+            return False
+
+        # If the folder for the file not exist, a new folder get created
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        file_path = os.path.join(folder, dictionary_language + ".txt")
+        with open(file_path, "a", encoding="utf-8") as f:
+            f.write(word + "\n")
+        words.add(word)
+
+    return True
+
+
+def clear_personal_words():
+    """
+    Forget the loaded personal words, they are read again on the next use.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    with _lock:
+        _personal_words.clear()
@@ -0,0 +1,167 @@
+"""
+All functions for profiling the buttons of the GUI and the savers.
+
+If the environment variable VOCABULARY_PROFILING is 1, every call of a
+function decorated with profiled runs under cProfile and tracemalloc. Each
+call writes two files to the diagnostics folder: the profile as .prof file,
+which can be opened with pstats or snakeviz, and a text report with the
+functions that took the most time and the lines that allocated the most
+memory. Only the files of the last PROFILE_KEEP calls are kept.
+
+Without the environment variable, profiled returns the functions unchanged,
+so profiling costs nothing.
+
+Functions:
+- profiled(function)
+- profile_call(function, args, kwargs, directory)
+- rotate_diagnostics(directory, keep)
+"""
+
+import cProfile
+import datetime
+import functools
+import io
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from vocabulary_and_translation_gui.config import (
+    DIAGNOSTICS,
+    PROFILE_KEEP,
+    PROFILING
+)
+
+# Number of functions and allocations listed in a report
+TOP_ENTRIES = 25
+
+# Lock for the running profile, a call that starts while another call is
+# profiled is part of that profile
+_lock = threading.Lock()
+
+
+def profiled(function=None):
+    """
+    Profile every call of a function if profiling is configured.
+
+    Args:
+    - function (function): The function to profile.
+
+    Returns:
+    - function: The profiled function, or the function itself if profiling
+    is not configured.
+    """
+    if not PROFILING:
+        return function
+
+    @functools.wraps(function)
+    def profiled_function(*args, **kwargs):
+        return profile_call(function, args, kwargs)
+
+    return profiled_function
+
+
+def profile_call(function=None, args=(), kwargs=None, directory=None):
+    """
+    Call a function under cProfile and tracemalloc and write the results.
+
+    The files are also written if the function raises an error. If another
+    call is profiled at the same time, the function is called without
+    profiling.
+
+    Args:
+    - function (function): The function to call.
+    - args (tuple): The positional arguments of the call.
+    - kwargs (dict): The keyword arguments of the call.
+    - directory (str): Folder for the files. If None, the diagnostics folder
+    of the configuration is used.
+
+    Returns:
+    - object: The return value of the function.
+    """
+    kwargs = {} if kwargs is None else kwargs
+    if not _lock.acquire(blocking=False):
+        return function(*args, **kwargs)
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    # reset_peak exists since Python 3.9, before the peak is the peak since
+    # tracemalloc was started
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    try:
+        profiler.enable()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profiler.disable()
+            seconds = time.perf_counter() - start
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+            _write_diagnostics(function.__name__, profiler, snapshot,
+                               seconds, peak, directory)
+    finally:
+        _lock.release()
+
+
+def rotate_diagnostics(directory=None, keep=None):
+    """
+    Delete the files of all calls except the last ones.
+
+    Args:
+    - directory (str): The diagnostics folder. If None, the folder of the
+    configuration is used.
+    - keep (int): Number of calls whose files are kept. If None, the number
+    of the configuration is used.
+
+    Returns:
+    - int: The number of deleted calls.
+    """
+    directory = str(directory or DIAGNOSTICS)
+    keep = PROFILE_KEEP if keep is None else keep
+    profiles = sorted(name for name in os.listdir(directory)
+                      if name.endswith(".prof"))
+    deleted = profiles[:max(0, len(profiles) - keep)]
+    for name in deleted:
+        stem = os.path.join(directory, name[:-len(".prof")])
+        for path in (stem + ".prof", stem + ".txt"):
+            if os.path.exists(path):
+                os.remove(path)
+    return len(deleted)
+
+
+def _write_diagnostics(name, profiler, snapshot, seconds, peak, directory):
+    # Write the profile and the report of one call and delete old files
+    directory = str(directory or DIAGNOSTICS)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    # The timestamp first, so the files are sorted by time
+    stem = os.path.join(directory, datetime.datetime.now().strftime(
+        "%Y%m%d-%H%M%S-%f") + "_" + re.sub(r"\W", "_", name))
+    profiler.dump_stats(stem + ".prof")
+
+    functions = io.StringIO()
+    pstats.Stats(profiler, stream=functions).sort_stats(
+        "cumulative").print_stats(TOP_ENTRIES)
+    allocations = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__)
+    ]).statistics("lineno")[:TOP_ENTRIES]
+
+    with open(stem + ".txt", "w", encoding="utf-8") as f:
+        f.write(f"{name}: {seconds:.3f} s, peak memory "
+                f"{peak / 1024 / 1024:.1f} MB\n\n")
+        f.write(f"Top {TOP_ENTRIES} allocations:\n")
+        for statistic in allocations:
+            f.write(f"{statistic}\n")
+        f.write(f"\nTop {TOP_ENTRIES} functions by cumulative time:\n")
+        f.write(functions.getvalue())
+
+    rotate_diagnostics(directory)
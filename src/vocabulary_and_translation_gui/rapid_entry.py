@@ -0,0 +1,193 @@
+"""
+All functions for adding words to the vocabulary list while typing.
+
+In the rapid-entry mode, a word is submitted with the Enter key and the
+user can type the next word at once. Background threads check the spelling
+of the submitted words and translate them, several words at the same time.
+The finished words are collected in the order they were submitted, so the
+vocabulary list has the same order as the typed words, no matter which
+translation arrives first.
+
+A word that is misspelled, already in the vocabulary list or can't be
+translated is not added. It is returned as a failed result instead, e.g.
+{"text": "Hasu", "state": "failed", "error": "Misspelled word 'Hasu',
+suggestions: Haus"}, so the window can list it without interrupting the
+user with a message box.
+
+Functions:
+- submit_entry(auth_key, in_text, src_lang)
+- collect_entries(trans_list, store_path)
+- count_pending_entries()
+- clear_pending_entries()
+"""
+
+import collections
+import concurrent.futures
+import datetime
+import threading
+from vocabulary_and_translation_gui.config import RAPID_ENTRY_WORKERS
+from vocabulary_and_translation_gui.tracing import propagate, span
+from vocabulary_and_translation_gui.translation_and_spelling import (
+    find_spelling_mistakes
+)
+from vocabulary_and_translation_gui.translation_prefetch import (
+    request_translation
+)
+from vocabulary_and_translation_gui.vocabulary_entry import VocabularyEntry
+from vocabulary_and_translation_gui.vocabulary_index import (
+    LANGUAGES,
+    find_entry,
+    index_entries
+)
+from vocabulary_and_translation_gui.vocabulary_store import add_entry
+
+# Submitted words in the order they were typed, e.g.
+# deque([("Haus", "Deutsch", Future of VocabularyEntry)])
+_pending = collections.deque()
+
+# Threads for the spelling checks and the translations, created on the
+# first submitted word
+_executor = None
+
+# Lock for the submitted words
+_lock = threading.Lock()
+
+
+def submit_entry(auth_key="", in_text="", src_lang=""):
+    """
+    Submit a word to be checked, translated and added in the background.
+
+    Args:
+    - auth_key (str): Key for the translation functions with DeepL.
+    - in_text (str): The word or expression to be added.
+    - src_lang (str): The source language of the word.
+
+    Returns:
+    - int: The number of submitted words that are not collected yet, or 0 if
+    the text is empty.
+    """
+    global _executor
+
+    in_text = " ".join(in_text.split())
+    if len(in_text) <= 0:
+        return 0
+
+    # The time the word was typed is kept, so the timestamps have the order
+    # of the vocabulary list
+    timestamp = datetime.datetime.now()
+    with _lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                RAPID_ENTRY_WORKERS, thread_name_prefix="rapid_entry")
+        _pending.append((in_text, src_lang, _executor.submit(
+            propagate(_create_entry), auth_key, in_text, src_lang,
+            timestamp)))
+        return len(_pending)
+
+
+def collect_entries(trans_list=[], store_path=None):
+    """
+    Add the finished words to the vocabulary list in the order they were
+    submitted.
+
+    The collection stops at the first word that is not finished yet, so a
+    slow translation holds back the words typed after it. Each added entry
+    is indexed and stored right away.
+
+    Args:
+    - trans_list (list): The vocabulary list, the new entries are appended.
+    - store_path (str): Path of the vocabulary store. If None, the path of
+    the configuration is used.
+
+    Returns:
+    - list: A dictionary for each collected word with the keys "text",
+    "state" ("added" or "failed") and "error", or "entry" for an added word.
+    """
+    results = []
+    while True:
+        with _lock:
+            if len(_pending) <= 0 or not _pending[0][2].done():
+                break
+            in_text, src_lang, future = _pending.popleft()
+
+        try:
+            entry = future.result()
+        except Exception as error:
+            results.append({"text": in_text, "state": "failed",
+                            "error": str(error) or type(error).__name__})
+            continue
+
+        # The same word may have been typed twice before the first one was
+        # added, so the index is checked again like in _create_entry
+        known_entry = find_entry(in_text, src_lang)
+        if known_entry is not None:
+            results.append({"text": in_text, "state": "failed",
+                            "error": _describe_known(known_entry)})
+            continue
+
+        trans_list.append(entry)
+        index_entries([entry])
+        add_entry(entry, store_path)
+        results.append({"text": in_text, "state": "added", "entry": entry})
+    return results
+
+
+def count_pending_entries():
+    """
+    Return the number of submitted words that are not collected yet.
+
+    Returns:
+    - int: The number of words.
+    """
+    with _lock:
+        return len(_pending)
+
+
+def clear_pending_entries():
+    """
+    Forget all submitted words that are not collected yet.
+
+    Words whose translation is already running are finished, but they are
+    not added to the vocabulary list.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    with _lock:
+        for _, _, future in _pending:
+            future.cancel()
+        _pending.clear()
+
+
+def _create_entry(auth_key, in_text, src_lang, timestamp):
+    # Check the spelling without asking the user and translate the word into
+    # all languages of the vocabulary list
+    with span("spell-check"):
+        mistakes = find_spelling_mistakes(in_text, src_lang)
+    if len(mistakes) > 0:
+        raise ValueError("; ".join(
+            f"Misspelled word '{mistake['word']}', suggestions: "
+            + (", ".join(mistake["suggestions"][:3]) or "none")
+            for mistake in mistakes))
+
+    known_entry = find_entry(in_text, src_lang)
+    if known_entry is not None:
+        raise ValueError(_describe_known(known_entry))
+
+    outputs = []
+    for lang in LANGUAGES:
+        with span("translate", {"language": lang, "chars": len(in_text)}):
+            outputs.append(request_translation(auth_key, in_text, src_lang,
+                                               lang))
+    return VocabularyEntry.from_list(
+        [output[0] for output in outputs] + [timestamp],
+        source=outputs[-1][1])
+
+
+def _describe_known(entry):
+    # Describe why a word that is already in the list is not added
+    return (f"Already in the vocabulary list: {entry[0]}, {entry[1]}, "
+            f"{entry[2]}")
@@ -2,28 +2,80 @@
 All functions for saving a word list.
 
 Functions:
-- save_list_as_apkg(word_list, path)
-- save_list_as_xlsx(word_list, path)
+- save_list_as_apkg(word_list, path, deck_name, incremental)
+- export_apkg(word_list, path, deck_name, incremental)
+- export_file(word_list, path, keys)
+- check_word_list(word_list)
+- anki_id_for(name)
+- create_vocabulary_model()
+- create_vocabulary_deck(word_list, deck_name)
+- add_notes_to_apkg(vocabulary_deck, path)
+- write_apkg_stream(entries, path, deck_name)
+- save_list_as_xlsx(word_list, path, skip_existing)
+- export_xlsx(word_list, path, skip_existing, keys)
+- append_rows_to_xlsx(word_list, path, sheet_name)
+- write_xlsx_stream(entries, path, sheet_name)
+- vocabulary_frame(word_list)
+- export_table(word_list, path, keys)
+- export_csv(word_list, path, skip_existing, keys)
+- write_csv_stream(entries, path, append)
 """
 
+import csv
 import genanki
+import genanki.apkg_col
+import genanki.apkg_schema
+import hashlib
+import itertools
+import json
 import os
 import pandas as pd
-import random
+import posixpath
+import re
+import shutil
+import sqlite3
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+import zipfile
 from tkinter import messagebox
+from vocabulary_and_translation_gui.metrics import timed
+from vocabulary_and_translation_gui.profiling import profiled
+from vocabulary_and_translation_gui.vocabulary_entry import (
+    VocabularyEntry,
+    entries_frame
+)
+from vocabulary_and_translation_gui.vocabulary_index import (
+    LANGUAGES,
+    drop_duplicate_entries,
+    entry_keys,
+    read_file_keys,
+    read_xlsx_keys,
+    remember_xlsx_keys
+)
+from xml.sax.saxutils import escape
 
 
-def save_list_as_apkg(word_list=[], path=""):
+@profiled
+def save_list_as_apkg(word_list=[], path="", deck_name="German Vocabulary",
+                      incremental=False):
     """
     Save the given word list as an Anki (.apkg) file at the given path.
 
+    The model and deck IDs are derived from their names and each note gets a
+    GUID from its words, so importing a file again updates the existing deck
+    in Anki instead of creating a duplicate.
+
     Args:
     - word_list (list): A list of tuples containing English, German, and
     Turkish words.
     - path (str): The path to save the Anki (.apkg) file.
+    - deck_name (str): The name of the Anki deck.
+    - incremental (bool): If True and the file exists, only the notes that
+    are not yet in the file are added to it. Otherwise the file is replaced.
 
     Returns:
-        None
+        int: The number of added notes, or None if nothing was saved.
     """
     # Messages and titles for the message boxes shown to the user
     messages = {
@@ -32,8 +84,7 @@ def save_list_as_apkg(word_list=[], path=""):
                  + " word_list."),
         "error": ("Error: This program doesn't have access to this path: "
                   + path),
-        "success": (str(len(word_list)) + " new word(s) added to the "
-                    "vocabulary list Anki file.")
+        "success": " new word(s) added to the vocabulary list Anki file."
     }
 
     titles = {
@@ -43,26 +94,136 @@ def save_list_as_apkg(word_list=[], path=""):
         "success": "Save successful"
     }
 
-    # Check if the word_list is empty
-    if len(word_list) <= 0:
-        messagebox.showwarning(title=titles["empty"],
-                               message=messages["empty"])
+    # Check if the word_list is empty and has exactly 4 entries in each entry
+    problem = check_word_list(word_list)
+    if problem is not None:
+        messagebox.showwarning(title=titles[problem],
+                               message=messages[problem])
+        return
+    # Write the words to the Anki (.apkg) file at the given path
+    try:
+        added = export_apkg(word_list, path, deck_name, incremental)
+    except PermissionError:
+        # Show an error message to the user if there access gets denied
+        messagebox.showerror(title=titles["error"], message=messages["error"])
         return
 
-    # Check if word_list has exactly 4 entries
-    for short_list in word_list:
-        if len(short_list) != 4:
-            messagebox.showwarning(title=titles["four"],
-                                   message=messages["four"])
-            return
+    # Show a success message with the number of words added vocabularies
+    messagebox.showinfo(title=titles["success"],
+                        message=str(added) + messages["success"])
+
+    return added
+
+
+@timed("save_seconds", {"format": "apkg"}, count="saved_words_total")
+def export_apkg(word_list=[], path="", deck_name="German Vocabulary",
+                incremental=False):
+    """
+    Write a word list to an Anki (.apkg) file without showing any messages.
+
+    Args:
+    - word_list (list): Entries containing English, German and Turkish words
+    and a timestamp.
+    - path (str): The path to save the Anki (.apkg) file.
+    - deck_name (str): The name of the Anki deck.
+    - incremental (bool): If True and the file exists, only the notes that
+    are not yet in the file are added to it. Otherwise the file is replaced.
+
+    Returns:
+    - int: The number of added notes.
+
+    Raises:
+    - PermissionError: If the program doesn't have access to the path.
+    """
     # If the directory for the file not exist, a new directory get created
     if not os.path.exists(os.path.dirname(path)):
         os.makedirs(os.path.dirname(path))
 
-    # Create a new Anki model with unique model_id
-    model_id = random.randrange(1 << 30, 1 << 31)
-    vocabulary_model = genanki.Model(
-        model_id,
+    if incremental and os.path.exists(path):
+        vocabulary_deck = create_vocabulary_deck(word_list, deck_name)
+        return add_notes_to_apkg(vocabulary_deck, path)
+    return write_apkg_stream(word_list, path, deck_name)
+
+
+def export_file(word_list=[], path="", keys=None):
+    """
+    Write a word list to a file in the format of its extension.
+
+    Words that are already in the file are not added again. No messages are
+    shown, so the function can be used without a window, e.g. in a thread.
+
+    Args:
+    - word_list (list): Entries containing English, German and Turkish words
+    and a timestamp.
+    - path (str): Path of the Anki (.apkg), Excel (.xlsx), CSV (.csv),
+    Parquet (.parquet) or Feather (.feather) file.
+    - keys (list): The keys of the entries of word_list without duplicates,
+    see entry_keys. If given, the keys are not built again.
+
+    Returns:
+    - int: The number of added words.
+
+    Raises:
+    - ValueError: If the file type is not supported.
+    - PermissionError: If the file is being used by another program.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".apkg":
+        return export_apkg(word_list, path, incremental=True)
+    if extension == ".xlsx":
+        return export_xlsx(word_list, path, skip_existing=True, keys=keys)
+    if extension == ".csv":
+        return export_csv(word_list, path, skip_existing=True, keys=keys)
+    if extension in [".parquet", ".feather"]:
+        return export_table(word_list, path, keys=keys)
+    raise ValueError("Unsupported file type: " + extension)
+
+
+def check_word_list(word_list=[]):
+    """
+    Check that a word list can be saved.
+
+    Args:
+    - word_list (list): Entries containing English, German and Turkish words
+    and a timestamp.
+
+    Returns:
+    - str: "empty" if the word list is empty, "four" if an entry does not
+    have exactly four entries, or None if the word list can be saved.
+    """
+    if len(word_list) <= 0:
+        return "empty"
+    if any(len(short_list) != 4 for short_list in word_list):
+        return "four"
+    return None
+
+
+def anki_id_for(name=""):
+    """
+    Derive a stable Anki model or deck ID from a name.
+
+    Args:
+    - name (str): The name of the model or deck.
+
+    Returns:
+    - int: An ID between 2**30 and 2**31, the same for the same name.
+    """
+    digest = hashlib.sha256(name.encode("utf-8")).digest()
+    return (1 << 30) + int.from_bytes(digest[:8], "big") % (1 << 30)
+
+
+def create_vocabulary_model():
+    """
+    Create the Anki model for the vocabulary notes.
+
+    Args:
+    - None
+
+    Returns:
+    - genanki.Model: The model with a model_id derived from its name.
+    """
+    return genanki.Model(
+        anki_id_for('New Words'),
         'New Words',
         fields=[
             {'name': 'Question'},
@@ -79,48 +240,227 @@ def save_list_as_apkg(word_list=[], path=""):
         ]
     )
 
-    # Create a new Anki deck with unique deck_id
-    deck_id = random.randrange(1 << 30, 1 << 31)
-    vocabulary_deck = genanki.Deck(deck_id, "German Vocabulary")
 
-    # Add each word from the word list as a new note to the deck
+def create_vocabulary_deck(word_list=[], deck_name="German Vocabulary"):
+    """
+    Create an Anki deck with a note for each word of the word list.
+
+    Words that occur more than once in the word list are only added once.
+
+    Args:
+    - word_list (list): A list of tuples containing English, German, and
+    Turkish words.
+    - deck_name (str): The name of the Anki deck.
+
+    Returns:
+    - genanki.Deck: The deck with the notes.
+    """
+    vocabulary_model = create_vocabulary_model()
+
+    # Create the Anki deck with a deck_id derived from its name
+    vocabulary_deck = genanki.Deck(anki_id_for(deck_name), deck_name)
+
+    # Add each word from the word list as a new note to the deck, the GUID
+    # of a note is a hash of its words
+    guids = set()
     for entry in word_list:
+        guid = genanki.guid_for(entry[0], entry[1], entry[2])
+        if guid in guids:
+            continue
+        guids.add(guid)
         new_note = genanki.Note(
             model=vocabulary_model,
             fields=[
                 "Deutsch: " + entry[1],
                 "English: " + entry[0],
                 "Türkçe: " + entry[2]
-            ]
+            ],
+            guid=guid
         )
         vocabulary_deck.add_note(new_note)
 
-    # Write the deck to the Anki (.apkg) file at the given path
+    return vocabulary_deck
+
+
+def add_notes_to_apkg(vocabulary_deck=None, path=""):
+    """
+    Add the notes of a deck to an existing Anki (.apkg) file.
+
+    Only notes whose GUIDs are not yet in the collection of the file are
+    written. The existing notes, cards and media files are copied unchanged.
+
+    Args:
+    - vocabulary_deck (genanki.Deck): The deck with the notes to add.
+    - path (str): The path of the existing Anki (.apkg) file.
+
+    Returns:
+    - int: The number of added notes.
+
+    Raises:
+    - PermissionError: If the file can not be replaced.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, db_path = tempfile.mkstemp(suffix=".anki2")
+    os.close(handle)
     try:
-        genanki.Package(vocabulary_deck).write_to_file(path)
-    except PermissionError:
-        # Show an error message to the user if there access gets denied
-        messagebox.showerror(title=titles["error"], message=messages["error"])
-        return
+        # Extract the collection of the file
+        with zipfile.ZipFile(path) as source:
+            with source.open("collection.anki2") as src, \
+                    open(db_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
 
-    # Show a success message with the number of words added vocabularies
-    messagebox.showinfo(title=titles["success"], message=messages["success"])
+        connection = sqlite3.connect(db_path)
+        try:
+            cursor = connection.cursor()
+
+            # Keep only the notes that are not yet in the collection
+            existing = {guid for guid, in cursor.execute(
+                "SELECT guid FROM notes")}
+            all_notes = vocabulary_deck.notes
+            vocabulary_deck.notes = [note for note in all_notes
+                                     if note.guid not in existing]
+            added = len(vocabulary_deck.notes)
+            if added <= 0:
+                vocabulary_deck.notes = all_notes
+                return 0
 
+            # Write the new notes with IDs after the existing ones
+            timestamp = time.time()
+            last_id, = cursor.execute(
+                "SELECT MAX(id) FROM (SELECT id FROM notes UNION ALL "
+                "SELECT id FROM cards)").fetchone()
+            last_id = last_id or 0
+            id_gen = itertools.count(max(int(timestamp * 1000), last_id + 1))
+            vocabulary_deck.write_to_db(cursor, timestamp, id_gen)
+            vocabulary_deck.notes = all_notes
 
-def save_list_as_xlsx(word_list=[], path=""):
+            # genanki adds the model with an integer key, loading the JSON
+            # removes the duplicated key
+            models, = cursor.execute("SELECT models FROM col").fetchone()
+            cursor.execute("UPDATE col SET models = ?",
+                           (json.dumps(json.loads(models)),))
+            connection.commit()
+        finally:
+            connection.close()
+
+        # Replace the collection and copy all other files of the package
+        handle, tmp_path = tempfile.mkstemp(suffix=".apkg", dir=directory)
+        os.close(handle)
+        try:
+            with zipfile.ZipFile(path) as source, \
+                    zipfile.ZipFile(tmp_path, "w") as target:
+                target.write(db_path, "collection.anki2")
+                for info in source.infolist():
+                    if info.filename != "collection.anki2":
+                        target.writestr(info, source.read(info))
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    finally:
+        os.remove(db_path)
+
+    return added
+
+
+def write_apkg_stream(entries=(), path="", deck_name="German Vocabulary"):
+    """
+    Write vocabulary entries to a new Anki (.apkg) file with constant memory.
+
+    The entries are consumed one by one and inserted into the collection
+    with a prepared statement inside a single transaction, without creating
+    a genanki note for each entry. Duplicated words are skipped by a unique
+    index on the GUIDs, and the cards are created from the notes with a
+    single statement. The notes, model and deck are the same as in
+    create_vocabulary_deck.
+
+    Args:
+    - entries (iterable): Entries containing English, German and Turkish
+    words and a timestamp.
+    - path (str): The path of the Anki (.apkg) file to be created.
+    - deck_name (str): The name of the Anki deck.
+
+    Returns:
+    - int: The number of written notes.
+    """
+    timestamp = time.time()
+    deck_id = anki_id_for(deck_name)
+    vocabulary_model = create_vocabulary_model()
+    vocabulary_deck = genanki.Deck(deck_id, deck_name)
+
+    def note_rows():
+        # Create the row of the notes table for each entry
+        for note_id, entry in enumerate(entries, start=int(timestamp * 1000)):
+            fields = ["Deutsch: " + entry[1], "English: " + entry[0],
+                      "Türkçe: " + entry[2]]
+            yield (note_id, genanki.guid_for(entry[0], entry[1], entry[2]),
+                   vocabulary_model.model_id, int(timestamp), -1, "  ",
+                   "\x1f".join(fields), fields[0], 0, 0, "")
+
+    handle, db_path = tempfile.mkstemp(suffix=".anki2")
+    os.close(handle)
+    try:
+        # The collection is a temporary file, so it does not need a journal
+        connection = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            cursor = connection.cursor()
+            cursor.execute("PRAGMA journal_mode = OFF")
+            cursor.execute("PRAGMA synchronous = OFF")
+            cursor.executescript(genanki.apkg_schema.APKG_SCHEMA)
+            cursor.executescript(genanki.apkg_col.APKG_COL)
+
+            cursor.execute("BEGIN")
+            decks, models = cursor.execute(
+                "SELECT decks, models FROM col").fetchone()
+            decks = json.loads(decks)
+            decks[str(deck_id)] = vocabulary_deck.to_json()
+            models = json.loads(models)
+            models[str(vocabulary_model.model_id)] = vocabulary_model.to_json(
+                timestamp, deck_id)
+            cursor.execute("UPDATE col SET decks = ?, models = ?",
+                           (json.dumps(decks), json.dumps(models)))
+
+            # Insert the notes and create one card for each note
+            cursor.execute("CREATE UNIQUE INDEX ix_notes_guid ON notes (guid)")
+            cursor.executemany("INSERT OR IGNORE INTO notes VALUES "
+                               "(?,?,?,?,?,?,?,?,?,?,?)", note_rows())
+            cursor.execute("INSERT INTO cards SELECT id, id, ?, 0, mod, -1, "
+                           "0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, '' FROM notes",
+                           (deck_id,))
+            cursor.execute("DROP INDEX ix_notes_guid")
+            count, = cursor.execute("SELECT COUNT(*) FROM notes").fetchone()
+            cursor.execute("COMMIT")
+        finally:
+            connection.close()
+
+        # Package the collection without media files
+        with zipfile.ZipFile(path, "w") as f:
+            f.write(db_path, "collection.anki2")
+            f.writestr("media", "{}")
+    finally:
+        os.remove(db_path)
+
+    return count
+
+
+@profiled
+def save_list_as_xlsx(word_list=[], path="", skip_existing=False):
     """
     Save a list of words in an Excel file located in the specified path.
 
     The Excel file will contain a sheet named 'Vocabulary' and will have
-    columns for English, Deutsch, Türkçe, and Timestamp.
+    columns for English, Deutsch, Türkçe, and Timestamp. Words that occur
+    more than once in word_list are only saved once.
 
     Args:
     - word_list (list of tuples): List of tuples containing the words to be
     saved.
     - path (str): Path to the Excel file to be created or updated.
+    - skip_existing (bool): If True, words that are already in the Excel
+    file are not added again.
 
     Returns:
-    - None
+    - int: The number of added rows, or None if nothing was saved.
     """
     # Messages and titles for the message boxes shown to the user
     messages = {
@@ -130,68 +470,540 @@ def save_list_as_xlsx(word_list=[], path=""):
         "error": ("Error: The Excel file in the path:" + path + "is either"
                   "being opened by another application and must be closed,"
                   "or this program doesn't have access to this file."),
-        "success": (str(len(word_list)) + " new word(s) added to the "
-                    "vocabulary list Excel file.")
+        "success": " new word(s) added to the vocabulary list Excel file.",
+        "known": "All words are already in the vocabulary list Excel file."
     }
 
     titles = {
         "empty": "No words found",
         "four": "Not four entries",
         "error": "ERROR",
-        "success": "Save successful"
+        "success": "Save successful",
+        "known": "No new words"
     }
-    # Check if the word_list is empty
-    if len(word_list) <= 0:
-        messagebox.showwarning(title=titles["empty"],
-                               message=messages["empty"])
+    # Check if the word_list is empty and has exactly 4 entries in each entry
+    problem = check_word_list(word_list)
+    if problem is not None:
+        messagebox.showwarning(title=titles[problem],
+                               message=messages[problem])
         return
 
-    # Check if word_list has exactly 4 entries
-    for short_list in word_list:
-        if len(short_list) != 4:
-            messagebox.showwarning(title=titles["four"],
-                                   message=messages["four"])
-            return
+    # Save the words and ask to retry if the file is being used by another
+    # program
+    while True:
+        try:
+            added = export_xlsx(word_list, path, skip_existing)
+        except PermissionError:
+            if messagebox.askretrycancel(title=titles["error"],
+                                         message=messages["error"]) is False:
+                return
+        else:
+            break
+
+    # Show a success message to the user if the file was successfully written
+    if added <= 0:
+        messagebox.showinfo(title=titles["known"], message=messages["known"])
+    else:
+        messagebox.showinfo(title=titles["success"],
+                            message=str(added) + messages["success"])
+    return added
+
+
+@timed("save_seconds", {"format": "xlsx"}, count="saved_words_total")
+def export_xlsx(word_list=[], path="", skip_existing=False, keys=None):
+    """
+    Write a word list to an Excel file without showing any messages.
+
+    Words that occur more than once in word_list are only written once. If
+    the file exists, the words are appended to it.
+
+    Args:
+    - word_list (list): Entries containing English, German and Turkish words
+    and a timestamp.
+    - path (str): Path to the Excel file to be created or updated.
+    - skip_existing (bool): If True, words that are already in the Excel
+    file are not added again.
+    - keys (list): The keys of the entries of word_list without duplicates,
+    see entry_keys. If given, the keys are not built again.
+
+    Returns:
+    - int: The number of added rows.
+
+    Raises:
+    - PermissionError: If the file is being used by another program.
+    """
+    # Remove duplicated words and the words that are already in the file,
+    # the keys of the file are kept after a save, so it is not read again
+    existed = os.path.exists(path)
+    known_keys = read_xlsx_keys(path) if skip_existing else set()
+    if keys is None:
+        word_list = drop_duplicate_entries(word_list)
+        keys = entry_keys(word_list)
+    all_keys = known_keys | set(keys)
+    word_list = drop_duplicate_entries(word_list, known_keys, keys)
+    if len(word_list) <= 0:
+        return 0
 
     # If the directory for the file not exist, a new directory get created
     if not os.path.exists(os.path.dirname(path)):
         os.makedirs(os.path.dirname(path))
 
-    # Create a pandas data frame with the word_list data
-    df = pd.DataFrame(word_list,
-                      columns=['English', 'Deutsch', 'Türkçe', 'Timestamp'])
+    if os.path.exists(path):
+        # Splice the new rows into the sheet without loading the workbook. If
+        # the file has an unexpected layout, open the Excel file in append
+        # mode and write a data frame
+        if not append_rows_to_xlsx(word_list, path):
+            df = pd.DataFrame(word_list, columns=['English', 'Deutsch',
+                                                  'Türkçe', 'Timestamp'])
+            df.set_index('Timestamp', inplace=True, drop=True)
+            with pd.ExcelWriter(path, mode='a', engine="openpyxl",
+                                if_sheet_exists="overlay") as writer:
+                df.to_excel(writer, sheet_name='Vocabulary',
+                            startrow=writer.sheets['Vocabulary'].max_row,
+                            header=False)
+    else:
+        # If the Excel file does not exist, stream the words into a new file
+        write_xlsx_stream(word_list, path, sheet_name='Vocabulary')
+
+    # The keys of all rows are only known if the old rows were read or if
+    # there were none
+    if skip_existing or not existed:
+        remember_xlsx_keys(path, all_keys)
+    return len(word_list)
 
-    # Set the 'Timestamp' column as the index of the data frame
-    df.set_index('Timestamp', inplace=True, drop=True)
 
-    # Check if the Excel file already exists in the specified path
-    if os.path.exists(path):
-        while True:
+def append_rows_to_xlsx(word_list=[], path="", sheet_name="Vocabulary"):
+    """
+    Append words to a sheet of an Excel file without loading the workbook.
+
+    The sheet XML is streamed into a copy of the file and the new rows are
+    inserted before the end of the sheet data, so neither the rows nor the
+    cells of the workbook are parsed. The rows have the same layout as the
+    rows of save_list_as_xlsx: Timestamp, English, Deutsch and Türkçe, with
+    the cell styles of the last existing row.
+
+    Args:
+    - word_list (list of tuples): List of tuples containing English, German
+    and Turkish words and a timestamp.
+    - path (str): Path to the existing Excel file.
+    - sheet_name (str): Name of the sheet to append the words to.
+
+    Returns:
+    - bool: True if the words were appended, False if the file does not have
+    the expected layout and nothing was changed.
+
+    Raises:
+    - PermissionError: If the file can not be replaced.
+    """
+    namespaces = {
+        "main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+        "rel": ("http://schemas.openxmlformats.org/officeDocument/2006/"
+                + "relationships"),
+        "pkg": ("http://schemas.openxmlformats.org/package/2006/"
+                + "relationships")
+    }
+    end_tag = b"</sheetData>"
+    chunk_size = 1024 * 1024
+
+    # The copy is removed if it was not moved in place, e.g. if the file is
+    # open in Excel
+    appended, tmp_path = False, None
+    try:
+        with zipfile.ZipFile(path) as source:
+            # Find the XML file of the sheet with the workbook relationships
             try:
-                # Open the Excel file in append mode and write the data frame
-                with pd.ExcelWriter(path,
-                                    mode='a',
-                                    engine="openpyxl",
-                                    if_sheet_exists="overlay") as writer:
-                    df.to_excel(writer, sheet_name='Vocabulary',
-                                startrow=writer.sheets['Vocabulary'].max_row,
-                                header=False)
-            except PermissionError:
-                # Show an error message to the user if the file is being used
-                # by another program
-                if messagebox.askretrycancel(
-                    title=titles["error"],
-                    message=messages["error"]
-                                            ) is False:
-                    break
+                workbook = ET.fromstring(source.read("xl/workbook.xml"))
+                relations = ET.fromstring(
+                    source.read("xl/_rels/workbook.xml.rels"))
+            except KeyError:
+                return False
+            sheet = workbook.find(
+                f"main:sheets/main:sheet[@name='{sheet_name}']", namespaces)
+            if sheet is None:
+                return False
+            relation_id = sheet.get("{" + namespaces["rel"] + "}id")
+            target = None
+            for relation in relations.findall("pkg:Relationship", namespaces):
+                if relation.get("Id") == relation_id:
+                    target = relation.get("Target")
+            if target is None:
+                return False
+            if target.startswith("/"):
+                sheet_path = target[1:]
             else:
-                # Show a success message to the user if the file was
-                # successfully written
-                messagebox.showinfo(title=titles["success"],
-                                    message=messages["success"])
-                break
-    else:
-        # If the Excel file does not exist, create it and write the data frame
-        df.to_excel(path, sheet_name='Vocabulary')
-        messagebox.showinfo(title=titles["success"],
-                            message=messages["success"])
+                sheet_path = posixpath.normpath(posixpath.join("xl", target))
+
+            # Write the copy next to the file, so it can be moved in place
+            handle, tmp_path = tempfile.mkstemp(
+                suffix=".xlsx", dir=os.path.dirname(os.path.abspath(path)))
+            os.close(handle)
+            with zipfile.ZipFile(tmp_path, "w",
+                                 compression=zipfile.ZIP_DEFLATED) as copy:
+                for info in source.infolist():
+                    with source.open(info) as src, copy.open(
+                            _copy_zip_info(info), "w",
+                            force_zip64=True) as dst:
+                        if info.filename != sheet_path:
+                            shutil.copyfileobj(src, dst, chunk_size)
+                        else:
+                            appended = _splice_rows(src, dst, word_list,
+                                                    end_tag, chunk_size)
+                            if not appended:
+                                break
+
+        # The file is replaced after it was closed
+        if appended:
+            os.replace(tmp_path, path)
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return appended
+
+
+def _copy_zip_info(info):
+    """
+    Copy the name, date and compression of a zip file entry.
+
+    Args:
+    - info (zipfile.ZipInfo): The entry of the source file.
+
+    Returns:
+    - zipfile.ZipInfo: An entry with the same name for the new file.
+    """
+    new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    new_info.compress_type = zipfile.ZIP_DEFLATED
+    new_info.external_attr = info.external_attr
+    return new_info
+
+
+def _splice_rows(src, dst, word_list, end_tag, chunk_size):
+    """
+    Stream a sheet XML and insert new rows before the end of the sheet data.
+
+    Args:
+    - src (file): The sheet XML of the existing file.
+    - dst (file): The sheet XML of the new file.
+    - word_list (list of tuples): The words to append.
+    - end_tag (bytes): The closing tag of the sheet data.
+    - chunk_size (int): Number of bytes read at once.
+
+    Returns:
+    - bool: True if the rows were inserted, False if the sheet data could
+    not be found or does not match the dimension of the sheet.
+    """
+    # The dimension is at the start of the sheet and is updated to the new
+    # number of rows before the first chunk is written
+    buffer = src.read(chunk_size)
+    dimension = re.search(rb'<dimension ref="[A-Z]+\d+:[A-Z]+(\d+)"', buffer)
+    if dimension is not None:
+        dimension_row = int(dimension.group(1))
+        buffer = (buffer[:dimension.start(1)]
+                  + str(dimension_row + len(word_list)).encode()
+                  + buffer[dimension.end(1):])
+
+    # Write the sheet until the end of the sheet data, the end of the buffer
+    # is kept because it holds the last row
+    while True:
+        position = buffer.find(end_tag)
+        if position >= 0:
+            break
+        chunk = src.read(chunk_size)
+        if not chunk:
+            return False
+        keep = max(len(buffer) - 64 * 1024, 0)
+        dst.write(buffer[:keep])
+        buffer = buffer[keep:] + chunk
+
+    # Find the number and the cell styles of the last row
+    head = buffer[:position]
+    rows = list(re.finditer(rb'<row [^>]*?r="(\d+)"', head))
+    if len(rows) <= 0:
+        return False
+    last_row = int(rows[-1].group(1))
+    if dimension is not None and dimension_row != last_row:
+        return False
+    styles = {column.decode(): style.decode() for column, style
+              in re.findall(rb'<c r="([A-Z]+)\d+"[^>]*? s="(\d+)"',
+                            head[rows[-1].start():])}
+
+    # Create the XML of the new rows
+    new_rows = [_create_row_xml(number, [entry[3], entry[0], entry[1],
+                                         entry[2]], styles)
+                for number, entry in enumerate(word_list,
+                                               start=last_row + 1)]
+
+    dst.write(buffer[:position])
+    dst.write("".join(new_rows).encode("utf-8"))
+    dst.write(buffer[position:])
+    shutil.copyfileobj(src, dst, chunk_size)
+    return True
+
+
+def _create_row_xml(number, values, styles={}):
+    """
+    Create the XML of a sheet row with inline string cells.
+
+    Args:
+    - number (int): The number of the row.
+    - values (list): The values of the cells, starting in column A.
+    - styles (dict): The style index for each column letter.
+
+    Returns:
+    - str: The XML of the row.
+    """
+    cells = []
+    for column, value in zip("ABCD", values):
+        style = styles.get(column)
+        style_attr = ' s="' + style + '"' if style else ""
+        cells.append(f'<c r="{column}{number}"{style_attr} t="inlineStr">'
+                     f'<is><t>{escape(str(value))}</t></is></c>')
+    return f'<row r="{number}">' + "".join(cells) + "</row>"
+
+
+def write_xlsx_stream(entries=(), path="", sheet_name="Vocabulary"):
+    """
+    Write vocabulary entries to a new Excel file with constant memory.
+
+    The entries are consumed one by one and written directly as sheet XML
+    into the zip file, so neither a data frame nor a workbook is created and
+    the memory needed does not depend on the number of entries. The file has
+    the layout of save_list_as_xlsx: a sheet with the columns Timestamp,
+    English, Deutsch and Türkçe.
+
+    Args:
+    - entries (iterable): Entries containing English, German and Turkish
+    words and a timestamp.
+    - path (str): Path to the Excel file to be created.
+    - sheet_name (str): Name of the sheet.
+
+    Returns:
+    - int: The number of written entries.
+    """
+    main = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    office = "http://schemas.openxmlformats.org/officeDocument/2006"
+    package = "http://schemas.openxmlformats.org/package/2006"
+    content_type = "application/vnd.openxmlformats-officedocument"
+    parts = {
+        "[Content_Types].xml": (
+            f'<Types xmlns="{package}/content-types">'
+            f'<Default Extension="rels" ContentType="application/'
+            f'vnd.openxmlformats-package.relationships+xml"/>'
+            f'<Default Extension="xml" ContentType="application/xml"/>'
+            f'<Override PartName="/xl/workbook.xml" ContentType='
+            f'"{content_type}.spreadsheetml.sheet.main+xml"/>'
+            f'<Override PartName="/xl/worksheets/sheet1.xml" ContentType='
+            f'"{content_type}.spreadsheetml.worksheet+xml"/>'
+            f'<Override PartName="/xl/styles.xml" ContentType='
+            f'"{content_type}.spreadsheetml.styles+xml"/></Types>'),
+        "_rels/.rels": (
+            f'<Relationships xmlns="{package}/relationships">'
+            f'<Relationship Id="rId1" Type="{office}/relationships/'
+            f'officeDocument" Target="xl/workbook.xml"/></Relationships>'),
+        "xl/workbook.xml": (
+            f'<workbook xmlns="{main}" xmlns:r="{office}/relationships">'
+            f'<sheets><sheet name="{escape(sheet_name)}" sheetId="1" '
+            f'r:id="rId1"/></sheets></workbook>'),
+        "xl/_rels/workbook.xml.rels": (
+            f'<Relationships xmlns="{package}/relationships">'
+            f'<Relationship Id="rId1" Type="{office}/relationships/'
+            f'worksheet" Target="worksheets/sheet1.xml"/>'
+            f'<Relationship Id="rId2" Type="{office}/relationships/styles" '
+            f'Target="styles.xml"/></Relationships>'),
+        "xl/styles.xml": (
+            f'<styleSheet xmlns="{main}"><fonts count="1"><font>'
+            f'<sz val="11"/><name val="Calibri"/></font></fonts>'
+            f'<fills count="1"><fill><patternFill/></fill></fills>'
+            f'<borders count="1"><border/></borders>'
+            f'<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" '
+            f'fillId="0" borderId="0"/></cellStyleXfs>'
+            f'<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" '
+            f'borderId="0" xfId="0"/></cellXfs>'
+            f'<cellStyles count="1"><cellStyle name="Normal" xfId="0" '
+            f'builtinId="0"/></cellStyles></styleSheet>')
+    }
+
+    # If the directory for the file not exist, a new directory get created
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+
+    count = 0
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as f:
+        for name, xml in parts.items():
+            f.writestr(name, xml)
+
+        # The dimension of the sheet is only known in advance for lists
+        dimension = ""
+        if hasattr(entries, "__len__"):
+            dimension = f'<dimension ref="A1:D{len(entries) + 1}"/>'
+
+        # Write the header and then the entries as rows of the sheet, a few
+        # rows are compressed at once
+        with f.open("xl/worksheets/sheet1.xml", "w",
+                    force_zip64=True) as sheet:
+            sheet.write(f'<worksheet xmlns="{main}">{dimension}'
+                        f'<sheetData>'.encode())
+            rows = [_create_row_xml(1, ["Timestamp", "English", "Deutsch",
+                                        "Türkçe"])]
+            for count, entry in enumerate(entries, start=1):
+                rows.append(_create_row_xml(
+                    count + 1, [entry[3], entry[0], entry[1], entry[2]]))
+                if len(rows) >= 1000:
+                    sheet.write("".join(rows).encode("utf-8"))
+                    rows = []
+            rows.append("</sheetData></worksheet>")
+            sheet.write("".join(rows).encode("utf-8"))
+
+    return count
+
+
+def vocabulary_frame(word_list=[]):
+    """
+    Create a data frame of a word list with real timestamps.
+
+    The columns have the order of the Excel file, the timestamps are parsed
+    into datetime values. Timestamps that can't be parsed become NaT.
+
+    Args:
+    - word_list (list): Entries containing English, German and Turkish words
+    and a timestamp, or VocabularyEntry objects.
+
+    Returns:
+    - pd.DataFrame: The columns Timestamp, English, Deutsch and Türkçe.
+    """
+    word_list = list(word_list)
+    if all(isinstance(entry, VocabularyEntry) for entry in word_list):
+        return entries_frame(word_list)
+
+    df = pd.DataFrame(word_list, columns=LANGUAGES + ['Timestamp'])
+    df['Timestamp'] = pd.to_datetime(df['Timestamp'], format="ISO8601",
+                                     errors="coerce")
+    for lang in LANGUAGES:
+        df[lang] = df[lang].astype(str)
+    return df[['Timestamp'] + LANGUAGES]
+
+
+@timed("save_seconds", {"format": "table"}, count="saved_words_total")
+def export_table(word_list=[], path="", keys=None):
+    """
+    Write a word list to a Parquet (.parquet) or Feather (.feather) file.
+
+    The columnar formats are written with pyarrow. If the file exists, the
+    words that are not yet in it are added and the file is replaced in one
+    step.
+
+    Args:
+    - word_list (list): Entries containing English, German and Turkish words
+    and a timestamp.
+    - path (str): Path of the Parquet or Feather file.
+    - keys (list): The keys of the entries of word_list without duplicates,
+    see entry_keys. If given, the keys are not built again.
+
+    Returns:
+    - int: The number of added rows.
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    # Remove duplicated words and the words that are already in the file
+    df = vocabulary_frame(word_list)
+    keys = (entry_keys(df[LANGUAGES]) if keys is None
+            else pd.Series(list(keys), dtype=str))
+    keep = ~keys.duplicated() & ~keys.isin(read_file_keys(path))
+    df = df[keep.to_numpy()].reset_index(drop=True)
+    added = len(df)
+    if added <= 0:
+        return 0
+
+    # If the directory for the file not exist, a new directory get created
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    # Add the new rows to the rows of the existing file
+    if os.path.exists(path):
+        if extension == ".parquet":
+            existing = pd.read_parquet(path)
+        else:
+            existing = pd.read_feather(path)
+        df = pd.concat([existing, df], ignore_index=True)
+
+    # Write a temporary file next to the file and replace it afterwards, so
+    # the file is never left half written
+    handle, temp_path = tempfile.mkstemp(suffix=extension, dir=directory)
+    os.close(handle)
+    try:
+        if extension == ".parquet":
+            df.to_parquet(temp_path, engine="pyarrow", index=False)
+        else:
+            df.reset_index(drop=True).to_feather(temp_path)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return added
+
+
+@timed("save_seconds", {"format": "csv"}, count="saved_words_total")
+def export_csv(word_list=[], path="", skip_existing=False, keys=None):
+    """
+    Write a word list to a CSV (.csv) file.
+
+    Words that occur more than once in word_list are only written once. If
+    the file exists, the words are appended to it.
+
+    Args:
+    - word_list (list): Entries containing English, German and Turkish words
+    and a timestamp.
+    - path (str): Path of the CSV file.
+    - skip_existing (bool): If True, words that are already in the CSV file
+    are not added again.
+    - keys (list): The keys of the entries of word_list without duplicates,
+    see entry_keys. If given, the keys are not built again.
+
+    Returns:
+    - int: The number of added rows.
+    """
+    word_list = drop_duplicate_entries(
+        word_list, read_file_keys(path) if skip_existing else set(), keys)
+    if len(word_list) <= 0:
+        return 0
+
+    # If the directory for the file not exist, a new directory get created
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    return write_csv_stream(word_list, path, append=True)
+
+
+def write_csv_stream(entries=(), path="", append=False):
+    """
+    Write vocabulary entries to a CSV file with constant memory.
+
+    The entries are consumed one by one. The file has the columns of the
+    Excel file, Timestamp, English, Deutsch and Türkçe, and is encoded in
+    UTF-8.
+
+    Args:
+    - entries (iterable): Entries containing English, German and Turkish
+    words and a timestamp.
+    - path (str): Path of the CSV file.
+    - append (bool): If True and the file exists, the entries are appended
+    to it. Otherwise the file is replaced.
+
+    Returns:
+    - int: The number of written rows.
+    """
+    counter = itertools.count()
+    rows = ([entry[3], entry[0], entry[1], entry[2]]
+            for entry, _ in zip(entries, counter))
+
+    write_header = not (append and os.path.exists(path))
+    with open(path, "a" if append else "w", encoding="utf-8",
+              newline="") as f:
+        writer = csv.writer(f)
+        if write_header:
+            writer.writerow(['Timestamp'] + LANGUAGES)
+        writer.writerows(rows)
+
+    return next(counter)
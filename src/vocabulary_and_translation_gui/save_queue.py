@@ -0,0 +1,197 @@
+"""
+All functions for saving word lists in a background thread.
+
+Save requests are written one after the other by a single writer thread, so
+the window stays responsive during large exports. A request for a file that
+is still waiting to be written is merged into the waiting request. If a file
+is being used by another program, it is saved again after a delay from
+SAVE_RETRY_DELAYS instead of asking the user in a loop.
+
+The progress of a request is reported as events, e.g. {"path": str,
+"state": "saved", "count": 3}. The state is one of "queued", "saving",
+"retrying", "saved" or "failed". The events are sent from the writer thread.
+
+Functions:
+- submit_save(word_list, path, on_event, on_done)
+- wait_for_saves(timeout)
+- describe_save_event(event)
+"""
+
+import logging
+import os
+import threading
+import time
+from vocabulary_and_translation_gui.config import SAVE_RETRY_DELAYS
+from vocabulary_and_translation_gui.save_list import export_file
+from vocabulary_and_translation_gui.vocabulary_index import (
+    drop_duplicate_entries
+)
+
+logger = logging.getLogger(__name__)
+
+# Waiting save requests for each path in the order they were submitted
+_jobs = {}
+
+# The writer thread and if it is writing a request at the moment
+_writer = {"thread": None, "busy": False}
+
+# Condition for the waiting requests, the writer sleeps on it
+_condition = threading.Condition()
+
+
+def submit_save(word_list=[], path="", on_event=None, on_done=None):
+    """
+    Submit a word list to be saved in the background.
+
+    If a request for the same file is still waiting, the word lists are
+    merged and the file is written once.
+
+    Args:
+    - word_list (list): Entries containing English, German and Turkish words
+    and a timestamp.
+    - path (str): Path of the Anki (.apkg) or Excel (.xlsx) file.
+    - on_event (function): Function called with each progress event.
+    - on_done (function): Function called with the number of saved words
+    once the file was written.
+
+    Returns:
+    - bool: True for a new request, False if it was merged into a waiting
+    request.
+    """
+    request = {
+        "path": os.path.abspath(path),
+        "word_list": list(word_list),
+        "listeners": [] if on_event is None else [on_event],
+        "done": [] if on_done is None else [on_done],
+        "attempt": 0,
+        "due": 0.0
+    }
+
+    with _condition:
+        waiting = _jobs.get(request["path"])
+        if waiting is None:
+            _jobs[request["path"]] = request
+        else:
+            _merge(waiting, request)
+
+        # Start the writer thread on the first request, or again if it was
+        # stopped by an unexpected error
+        if _writer["thread"] is None or not _writer["thread"].is_alive():
+            _writer["thread"] = threading.Thread(target=_write_jobs,
+                                                 name="save_queue",
+                                                 daemon=True)
+            _writer["thread"].start()
+        _condition.notify_all()
+
+    _send(request, "queued")
+    return waiting is None
+
+
+def wait_for_saves(timeout=None):
+    """
+    Wait until all submitted requests are written.
+
+    Args:
+    - timeout (float): Seconds to wait at most. If None, wait until done.
+
+    Returns:
+    - bool: True if all requests are written, False after the timeout.
+    """
+    with _condition:
+        return _condition.wait_for(
+            lambda: len(_jobs) <= 0 and not _writer["busy"], timeout)
+
+
+def describe_save_event(event={}):
+    """
+    Describe a progress event for the status line of the window.
+
+    Args:
+    - event (dict): The progress event.
+
+    Returns:
+    - str: The description of the event.
+    """
+    name = os.path.basename(event["path"])
+    if event["state"] == "queued":
+        return f"Waiting to save {name} ..."
+    if event["state"] == "saving":
+        return f"Saving {event['count']} word(s) to {name} ..."
+    if event["state"] == "retrying":
+        return (f"{name} is being used by another program, trying again in "
+                f"{event['delay']} second(s) ...")
+    if event["state"] == "saved":
+        return f"{event['count']} new word(s) saved to {name}."
+    return f"Saving {name} failed: {event['error']}"
+
+
+def _merge(request, other):
+    # Add the words and callbacks of other to request
+    request["word_list"] = drop_duplicate_entries(request["word_list"]
+                                                  + other["word_list"])
+    request["listeners"] += other["listeners"]
+    request["done"] += other["done"]
+
+
+def _send(request, state, **details):
+    # Send a progress event to all listeners of a request
+    event = dict(path=request["path"], state=state, **details)
+    for listener in list(request["listeners"]):
+        _call(listener, event)
+
+
+def _call(callback, argument):
+    # Call a listener or callback, its errors must not stop the writer
+    try:
+        callback(argument)
+    except Exception:
+        logger.exception("Callback %r of the save queue failed", callback)
+
+
+def _next_job():
+    # Wait for the oldest request which is due and take it from the queue
+    with _condition:
+        while True:
+            now = time.monotonic()
+            for path, request in _jobs.items():
+                if request["due"] <= now:
+                    del _jobs[path]
+                    _writer["busy"] = True
+                    return request
+            delays = [request["due"] - now for request in _jobs.values()]
+            _condition.wait(min(delays) if delays else None)
+
+
+def _write_jobs():
+    # Write the requests one after the other, forever
+    while True:
+        request = _next_job()
+        try:
+            _send(request, "saving", count=len(request["word_list"]))
+            count = export_file(request["word_list"], request["path"])
+        except PermissionError:
+            if request["attempt"] < len(SAVE_RETRY_DELAYS):
+                # Wait before the next attempt, requests that arrive in the
+                # meantime are merged into the retried request
+                delay = SAVE_RETRY_DELAYS[request["attempt"]]
+                request["attempt"] += 1
+                request["due"] = time.monotonic() + delay
+                with _condition:
+                    waiting = _jobs.pop(request["path"], None)
+                    if waiting is not None:
+                        _merge(request, waiting)
+                    _jobs[request["path"]] = request
+                _send(request, "retrying", delay=delay)
+            else:
+                _send(request, "failed", error="The file is being used by "
+                      "another program.")
+        except Exception as error:
+            _send(request, "failed", error=str(error))
+        else:
+            for on_done in request["done"]:
+                _call(on_done, count)
+            _send(request, "saved", count=count)
+        finally:
+            with _condition:
+                _writer["busy"] = False
+                _condition.notify_all()
@@ -0,0 +1,169 @@
+"""
+Functions for reviewing all spelling mistakes of an expression at once.
+
+The spelling check runs in a background thread. Afterwards one non-modal
+window lists every misspelled word with its suggestions, so all corrections
+can be accepted or rejected in one step. If enchant fails, the error is shown
+in the tkinter thread and the text is used without corrections. Other errors
+are shown too and end the review like a cancel.
+
+Functions:
+- review_spelling(parent, in_text, lang, on_done, poll_interval, on_cancel)
+- create_review_panel(parent, in_text, lang, mistakes, on_done, on_cancel)
+"""
+
+import enchant
+import queue
+import threading
+import tkinter as tk
+from tkinter import messagebox, ttk
+from vocabulary_and_translation_gui.personal_dictionary import (
+    add_personal_word
+)
+from vocabulary_and_translation_gui.translation_and_spelling import (
+    apply_corrections,
+    convert_language_name,
+    find_spelling_mistakes
+)
+
+
+def review_spelling(parent=None, in_text="", lang="", on_done=None,
+                    poll_interval=50, on_cancel=None):
+    """
+    Check the spelling of a text in the background and review the mistakes.
+
+    If no mistakes are found, on_done is called with the unchanged text.
+    Otherwise a review panel is opened and on_done is called with the text
+    the user accepted. If the user cancels the review, on_cancel is called
+    instead. If the check fails with an error of enchant, the error is shown
+    and on_done is called with the unchanged text. Other errors are shown
+    and on_cancel is called.
+
+    Args:
+    - parent (tk.Tk): The window the review panel belongs to.
+    - in_text (str): Text to check the spelling of.
+    - lang (str): Language to check the spelling in.
+    - on_done (function): Function called with the accepted text.
+    - poll_interval (int): Milliseconds between two checks for the result.
+    - on_cancel (function): Function called without arguments if the review
+    is cancelled or the check fails.
+
+    Returns:
+    - None
+    """
+    results = queue.Queue()
+
+    def check_in_background():
+        # An error is passed to the tkinter thread, so the window does not
+        # wait for a result forever
+        try:
+            results.put((find_spelling_mistakes(in_text, lang), None))
+        except Exception as error:
+            results.put(([], error))
+
+    threading.Thread(target=check_in_background, daemon=True).start()
+
+    def wait_for_result():
+        # tkinter is not thread-safe, so the result is collected in the
+        # tkinter thread
+        try:
+            mistakes, error = results.get_nowait()
+        except queue.Empty:
+            parent.after(poll_interval, wait_for_result)
+            return
+
+        if isinstance(error, enchant.errors.Error):
+            messagebox.showerror(
+                title="Spelling check failed",
+                message=("The spelling could not be checked:\n" + str(error)
+                         + "\n\nThe expression is used without corrections."))
+            on_done(in_text)
+        elif error is not None:
+            messagebox.showerror(
+                title="Spelling check failed",
+                message=("The spelling could not be checked:\n" + str(error)))
+            if on_cancel is not None:
+                on_cancel()
+        elif len(mistakes) <= 0:
+            on_done(in_text)
+        else:
+            create_review_panel(parent, in_text, lang, mistakes, on_done,
+                                on_cancel)
+
+    parent.after(poll_interval, wait_for_result)
+
+
+def create_review_panel(parent=None, in_text="", lang="", mistakes=[],
+                        on_done=None, on_cancel=None):
+    """
+    Create a non-modal window to review all spelling mistakes of a text.
+
+    Each misspelled word gets a selection of its suggestions and the
+    original word, and a check box to always accept the original word.
+
+    Args:
+    - parent (tk.Tk): The window the review panel belongs to.
+    - in_text (str): The checked text.
+    - lang (str): Language the text was checked in.
+    - mistakes (list): The mistakes found by find_spelling_mistakes.
+    - on_done (function): Function called with the accepted text.
+    - on_cancel (function): Function called without arguments if the review
+    is cancelled.
+
+    Returns:
+    - tk.Toplevel: The review panel.
+    """
+    dictionary_language = convert_language_name(lang, "dic")
+
+    panel = tk.Toplevel(parent)
+    panel.title("Review spelling")
+    tk.Label(panel, text="Your Expression:\n" + in_text).grid(
+        row=0, column=0, columnspan=3, padx=5, pady=5)
+
+    # Add a row with a selection for each misspelled word
+    choices = []
+    for row, mistake in enumerate(mistakes, start=1):
+        options = mistake["suggestions"] + [mistake["word"]]
+        choice = tk.StringVar(panel, value=options[0])
+        always = tk.BooleanVar(panel, value=False)
+
+        tk.Label(panel, text=mistake["word"]).grid(row=row, column=0,
+                                                   sticky=tk.W, padx=5)
+        ttk.Combobox(panel, textvariable=choice, values=options).grid(
+            row=row, column=1, padx=5)
+        tk.Checkbutton(panel, text="Always accept", variable=always).grid(
+            row=row, column=2, padx=5)
+        choices.append((mistake, choice, always))
+
+    def accept():
+        # Keep words that are always accepted and use the selection otherwise
+        corrections = {}
+        for mistake, choice, always in choices:
+            if always.get():
+                add_personal_word(mistake["word"], dictionary_language)
+                corrections[mistake["index"]] = mistake["word"]
+            else:
+                corrections[mistake["index"]] = choice.get()
+        panel.destroy()
+        on_done(apply_corrections(in_text, corrections))
+
+    def keep_original():
+        panel.destroy()
+        on_done(in_text)
+
+    def cancel():
+        panel.destroy()
+        if on_cancel is not None:
+            on_cancel()
+
+    # Add the buttons to accept, reject or cancel the corrections
+    buttons = tk.Frame(panel)
+    buttons.grid(row=len(mistakes) + 1, column=0, columnspan=3, pady=5)
+    tk.Button(buttons, text="Use corrections",
+              command=accept).pack(side=tk.LEFT, padx=5)
+    tk.Button(buttons, text="Keep original",
+              command=keep_original).pack(side=tk.LEFT, padx=5)
+    tk.Button(buttons, text="Cancel",
+              command=cancel).pack(side=tk.LEFT, padx=5)
+
+    return panel
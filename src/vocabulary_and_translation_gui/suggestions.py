@@ -0,0 +1,161 @@
+"""
+All functions for finding spelling suggestions within a time limit.
+
+The suggestions of enchant can take long for long or garbled words. They are
+therefore computed in a worker thread. If they are not ready before the
+deadline, a cheaper edit distance lookup over the words of the shipped
+dictionaries is used instead. The suggestions are asked from a second
+dictionary, so a call that is still running after its deadline does not
+hold up the spelling checks.
+
+Functions:
+- suggest_with_deadline(txt_checker, word, dictionary_language, deadline)
+- edit_distance_suggestions(word, dictionary_language, count, wait)
+- get_suggestion_statistics()
+- reset_suggestion_statistics()
+"""
+
+import concurrent.futures
+import difflib
+import threading
+from vocabulary_and_translation_gui.config import SUGGESTION_DEADLINE
+from vocabulary_and_translation_gui.dictionary_manager import (
+    get_suggestion_dictionary,
+    get_word_groups
+)
+from vocabulary_and_translation_gui.personal_dictionary import (
+    get_personal_words
+)
+
+# Worker threads for the enchant suggestions
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="suggestions")
+
+# The running suggestion call for each dictionary language
+_running = {}
+
+# Number of suggestion calls, how often the deadline was hit and how often
+# an earlier call for the same dictionary was still busy
+_statistics = {"calls": 0, "deadline_hits": 0, "busy": 0}
+
+# Lock for the running calls and the statistics
+_lock = threading.Lock()
+
+
+def suggest_with_deadline(txt_checker=None, word="", dictionary_language="",
+                          deadline=None):
+    """
+    Return the enchant suggestions for a word if they are ready in time.
+
+    If the suggestions are not ready before the deadline, or a suggestion
+    call for the same dictionary is still busy, the edit distance
+    suggestions are returned instead. They are empty for dictionaries that
+    are not shipped with the application, e.g. "tr_TR". A call that misses
+    its deadline keeps running in the background, so at most one call for
+    each dictionary runs at the same time.
+
+    Args:
+    - txt_checker (enchant.Dict): The dictionary to ask for suggestions. If
+    None, the suggestion dictionary of the language is loaded in the worker
+    thread, see dictionary_manager.get_suggestion_dictionary.
+    - word (str): The misspelled word.
+    - dictionary_language (str): Abbreviation of the dictionary, e.g. "en_GB".
+    - deadline (float): Seconds to wait for the enchant suggestions. If None,
+    the deadline of the configuration is used.
+
+    Returns:
+    - list: The suggestions, the most likely one first.
+    """
+    if deadline is None:
+        deadline = SUGGESTION_DEADLINE
+
+    # The words for the edit distance suggestions are grouped in the
+    # background meanwhile
+    get_word_groups(dictionary_language, wait=False)
+
+    with _lock:
+        _statistics["calls"] += 1
+        running = _running.get(dictionary_language)
+        if running is not None and not running.done():
+            _statistics["busy"] += 1
+            future = None
+        else:
+            future = _executor.submit(_suggest, txt_checker, word,
+                                      dictionary_language)
+            _running[dictionary_language] = future
+
+    if future is not None:
+        try:
+            return future.result(timeout=deadline)
+        except concurrent.futures.TimeoutError:
+            with _lock:
+                _statistics["deadline_hits"] += 1
+    return edit_distance_suggestions(word, dictionary_language, wait=False)
+
+
+def edit_distance_suggestions(word="", dictionary_language="", count=5,
+                              wait=True):
+    """
+    Find similar words by edit distance in the words of a dictionary.
+
+    Only words with the same first letter and a similar length are compared,
+    which keeps the lookup fast. The personal words are included as well.
+
+    Args:
+    - word (str): The misspelled word.
+    - dictionary_language (str): Abbreviation of the dictionary, e.g. "en_GB".
+    - count (int): The maximum number of suggestions.
+    - wait (bool): If False and the words of the dictionary are not grouped
+    yet, only the personal words are compared.
+
+    Returns:
+    - list: The suggestions, the most similar one first.
+    """
+    if len(word) <= 0:
+        return []
+
+    group = get_word_groups(dictionary_language, wait).get(word[0].lower(),
+                                                           [])
+
+    candidates = [candidate for candidate
+                  in group + list(get_personal_words(dictionary_language))
+                  if abs(len(candidate) - len(word)) <= 2]
+    return difflib.get_close_matches(word, candidates, n=count, cutoff=0.6)
+
+
+def get_suggestion_statistics():
+    """
+    Return how often suggestions were requested and fell back.
+
+    Args:
+    - None
+
+    Returns:
+    - dict: The number of "calls", "deadline_hits" and "busy" calls.
+    """
+    with _lock:
+        return dict(_statistics)
+
+
+def reset_suggestion_statistics():
+    """
+    Set the suggestion statistics back to zero.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    with _lock:
+        _statistics["calls"] = 0
+        _statistics["deadline_hits"] = 0
+        _statistics["busy"] = 0
+
+
+def _suggest(txt_checker, word, dictionary_language):
+    # Ask the dictionary for suggestions, the spelling checks use another
+    # dictionary, so they are not held up by a slow call
+    if txt_checker is None:
+        txt_checker = get_suggestion_dictionary(dictionary_language)
+    return txt_checker.suggest(word)
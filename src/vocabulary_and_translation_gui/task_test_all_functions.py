@@ -12,20 +12,60 @@ import pytest
 # Path and name of functions that are tested
 function_path = os.path.dirname(__file__)
 function_names = [
+    "benchmark.py",
+    "deepl_cassette.py",
+    "dictionary_manager.py",
+    "export_pipeline.py",
+    "export_vocabulary.py",
+    "import_list.py",
     "interface_and_features.py",
+    "latency_monitor.py",
+    "metrics.py",
+    "personal_dictionary.py",
     "prepare_application.py",
+    "profiling.py",
+    "rapid_entry.py",
     "save_list.py",
-    "translation_and_spelling.py"
+    "save_queue.py",
+    "spelling_review.py",
+    "suggestions.py",
+    "tracing.py",
+    "translation_and_spelling.py",
+    "translation_prefetch.py",
+    "vocabulary_entry.py",
+    "vocabulary_index.py",
+    "vocabulary_store.py",
+    "vocabulary_view.py"
 ]
 
 # Path and name of test functions
 test_path = os.path.join(function_path, "..", "..", "tests")
 test_names = [
+    "test_benchmark.py",
+    "test_deepl_cassette.py",
+    "test_dictionary_manager.py",
+    "test_export_pipeline.py",
+    "test_export_vocabulary.py",
     "test_import.py",
+    "test_import_list.py",
     "test_interface_and_features.py",
+    "test_latency_monitor.py",
+    "test_metrics.py",
+    "test_personal_dictionary.py",
     "test_prepare_application.py",
+    "test_profiling.py",
+    "test_rapid_entry.py",
     "test_save_list.py",
-    "test_translation_and_spelling.py"
+    "test_save_queue.py",
+    "test_spelling_review.py",
+    "test_suggestions.py",
+    "test_tracing.py",
+    "test_translation_and_spelling.py",
+    "test_translation_prefetch.py",
+    "test_vocabulary_entry.py",
+    "test_vocabulary_index.py",
+    "test_vocabulary_store.py",
+    "test_vocabulary_view.py"
 ]
 
 # List of all dependencies
@@ -0,0 +1,324 @@
+"""
+All functions for tracing where the time of a slow action goes.
+
+An action, e.g. adding a word to the vocabulary list, is traced as a tree of
+spans: each stage of the action is a span with a start, an end and
+attributes like the language, the number of characters or if a translation
+was reused. The current span is kept in a context variable, so a span that
+is started inside another span becomes its child. Functions that are run by
+worker threads are wrapped with propagate, so their spans belong to the
+trace of the action that submitted them.
+
+When all spans of a trace are finished, the trace is written to the console
+as waterfall with one line for each span, or appended to a file as one line
+of JSON in the format of the OpenTelemetry protocol (OTLP/JSON), which can
+be read by the OpenTelemetry collector and tools like Jaeger.
+
+Without started tracing, span returns a context manager that does nothing.
+
+Functions:
+- start_tracing(exporter, path)
+- stop_tracing()
+- span(name, attributes)
+- traced(name)
+- set_attribute(key, value)
+- propagate(function)
+- format_waterfall(spans)
+- format_otlp(spans)
+"""
+
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from vocabulary_and_translation_gui.config import TRACE_FILE
+
+# Name of the service in the exported traces
+SERVICE_NAME = "vocabulary_and_translation_gui"
+
+# The span of the running stage, None outside of a trace
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+# Exporter and path of the started tracing, None if tracing is not started
+_tracer = {"exporter": None, "path": None}
+
+# Finished spans and the number of running spans of each trace, e.g.
+# {"4bf92f...": {"running": 1, "spans": [dict]}}
+_traces = {}
+
+# Does nothing for span if tracing is not started
+_NOT_TRACED = contextlib.nullcontext()
+
+# Lock for the traces, spans end in several threads
+_lock = threading.Lock()
+
+
+def start_tracing(exporter="console", path=None):
+    """
+    Start tracing the spans.
+
+    Args:
+    - exporter (str): "console" to print a waterfall of each trace or "file"
+    to append each trace to a file in the OTLP/JSON format.
+    - path (str): Path of the file for the "file" exporter. If None, the
+    path of the configuration is used.
+
+    Returns:
+    - None
+
+    Raises:
+    - ValueError: If the exporter is unknown.
+    """
+    if exporter not in ["console", "file"]:
+        raise ValueError("Unknown exporter: " + str(exporter))
+    with _lock:
+        _traces.clear()
+        _tracer.update(exporter=exporter, path=str(path or TRACE_FILE))
+
+
+def stop_tracing():
+    """
+    Stop tracing, traces with running spans are not written.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    with _lock:
+        _traces.clear()
+        _tracer.update(exporter=None, path=None)
+
+
+def span(name="", attributes=None):
+    """
+    Return a context manager that traces its block as a span.
+
+    The span is a child of the current span. If the block raises an error,
+    the status of the span is set to error and the error is raised again.
+
+    Args:
+    - name (str): Name of the stage, e.g. "translate".
+    - attributes (dict): Attributes of the span, e.g. {"language": "Deutsch"}.
+
+    Returns:
+    - contextlib.AbstractContextManager: The context manager, it returns the
+    span as dictionary.
+    """
+    if _tracer["exporter"] is None:
+        return _NOT_TRACED
+    return _traced_span(name, attributes)
+
+
+def traced(name=""):
+    """
+    Return a decorator that traces every call of a function as a span.
+
+    Args:
+    - name (str): Name of the span.
+
+    Returns:
+    - function: The decorator.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def traced_function(*args, **kwargs):
+            with span(name):
+                return function(*args, **kwargs)
+
+        return traced_function
+
+    return decorator
+
+
+def set_attribute(key="", value=None):
+    """
+    Set an attribute of the current span.
+
+    Args:
+    - key (str): Name of the attribute, e.g. "cache_hit".
+    - value (object): A string, number or bool.
+
+    Returns:
+    - None
+    """
+    current = _current_span.get()
+    if current is not None:
+        current["attributes"][key] = value
+
+
+def propagate(function=None):
+    """
+    Run a function in the trace of the caller, e.g. in a worker thread.
+
+    Args:
+    - function (function): The function that is submitted to a thread.
+
+    Returns:
+    - function: The function in a copy of the current context, or the
+    function itself outside of a trace.
+    """
+    if _current_span.get() is None:
+        return function
+    context = contextvars.copy_context()
+
+    @functools.wraps(function)
+    def propagated_function(*args, **kwargs):
+        return context.run(function, *args, **kwargs)
+
+    return propagated_function
+
+
+def format_waterfall(spans=[]):
+    """
+    Format the spans of a trace as waterfall.
+
+    Each line shows when the span started after the first span, how long it
+    took, its name indented by its depth and its attributes.
+
+    Args:
+    - spans (list): The finished spans of one trace.
+
+    Returns:
+    - str: The waterfall.
+    """
+    if len(spans) <= 0:
+        return ""
+    start = min(item["start"] for item in spans)
+    children = {}
+    for item in sorted(spans, key=lambda item: item["start"]):
+        children.setdefault(item["parent_id"], []).append(item)
+
+    # Spans whose parent is not in the spans, e.g. spans of a worker thread
+    # that ended after the trace was written, are shown as roots
+    span_ids = {item["span_id"] for item in spans}
+    roots = [item for parent_id, items in children.items()
+             if parent_id not in span_ids for item in items]
+
+    lines = [f"Trace {spans[0]['trace_id']}"]
+
+    def add_lines(item, depth):
+        attributes = " ".join(f"{key}={value}" for key, value
+                              in item["attributes"].items())
+        error = " ERROR " + item["error"] if item["error"] else ""
+        lines.append(f"{(item['start'] - start) / 1e6:9.1f} ms "
+                     f"{(item['end'] - item['start']) / 1e6:9.1f} ms  "
+                     f"{'  ' * depth}{item['name']} {attributes}{error}"
+                     .rstrip())
+        for child in children.get(item["span_id"], []):
+            add_lines(child, depth + 1)
+
+    for root in sorted(roots, key=lambda item: item["start"]):
+        add_lines(root, 0)
+    return "\n".join(lines)
+
+
+def format_otlp(spans=[]):
+    """
+    Format spans as export request of the OpenTelemetry protocol.
+
+    Args:
+    - spans (list): The finished spans.
+
+    Returns:
+    - dict: The request with the spans in the OTLP/JSON format.
+    """
+    return {"resourceSpans": [{
+        "resource": {"attributes": _otlp_attributes(
+            {"service.name": SERVICE_NAME})},
+        "scopeSpans": [{
+            "scope": {"name": __name__},
+            "spans": [{
+                "traceId": item["trace_id"],
+                "spanId": item["span_id"],
+                "parentSpanId": item["parent_id"] or "",
+                "name": item["name"],
+                "kind": 1,
+                "startTimeUnixNano": str(item["start"]),
+                "endTimeUnixNano": str(item["end"]),
+                "attributes": _otlp_attributes(item["attributes"]),
+                "status": ({"code": 2, "message": item["error"]}
+                           if item["error"] else {"code": 1})
+            } for item in spans]
+        }]
+    }]}
+
+
+@contextlib.contextmanager
+def _traced_span(name, attributes):
+    # Start a child of the current span or a new trace and finish it after
+    # the block
+    parent = _current_span.get()
+    item = {
+        "trace_id": (secrets.token_hex(16) if parent is None
+                     else parent["trace_id"]),
+        "span_id": secrets.token_hex(8),
+        "parent_id": None if parent is None else parent["span_id"],
+        "name": name,
+        "attributes": dict(attributes or {}),
+        "error": None,
+        "start": time.time_ns()
+    }
+    with _lock:
+        trace = _traces.setdefault(item["trace_id"], {"running": 0,
+                                                      "spans": []})
+        trace["running"] += 1
+
+    token = _current_span.set(item)
+    try:
+        yield item
+    except BaseException as error:
+        item["error"] = f"{type(error).__name__}: {error}"
+        raise
+    finally:
+        _current_span.reset(token)
+        item["end"] = time.time_ns()
+        _finish(item)
+
+
+def _finish(item):
+    # Write the trace once all its spans are finished
+    with _lock:
+        trace = _traces.get(item["trace_id"])
+        if trace is None:
+            # Tracing was stopped or started again
+            return
+        trace["spans"].append(item)
+        trace["running"] -= 1
+        if trace["running"] > 0:
+            return
+        del _traces[item["trace_id"]]
+        exporter, path = _tracer["exporter"], _tracer["path"]
+
+    if exporter == "console":
+        print(format_waterfall(trace["spans"]), file=sys.stderr)
+    elif exporter == "file":
+        # If the directory for the traces not exist, a new directory get
+        # created, several threads may finish a trace at the same time
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        line = json.dumps(format_otlp(trace["spans"]), ensure_ascii=False)
+        with _lock:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+def _otlp_attributes(attributes):
+    # Convert attributes to the key-value list of OTLP/JSON
+    converted = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            converted_value = {"boolValue": value}
+        elif isinstance(value, int):
+            converted_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            converted_value = {"doubleValue": value}
+        else:
+            converted_value = {"stringValue": str(value)}
+        converted.append({"key": key, "value": converted_value})
+    return converted
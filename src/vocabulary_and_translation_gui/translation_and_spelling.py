@@ -6,12 +6,27 @@ Functions:
 - convert_language_name(abbr, style)
 - check_spelling(in_text, lang)
 - correct_spelling_mistakes(in_text, dic_lang)
+- split_expression(in_text)
+- find_spelling_mistakes(in_text, lang)
+- apply_corrections(in_text, corrections)
 """
 
 import deepl
 import enchant
 import re
 from tkinter import messagebox
+from vocabulary_and_translation_gui.dictionary_manager import (
+    dictionary_lock,
+    get_dictionary
+)
+from vocabulary_and_translation_gui.latency_monitor import measure
+from vocabulary_and_translation_gui.metrics import increment, measure_time
+from vocabulary_and_translation_gui.personal_dictionary import (
+    add_personal_word,
+    is_personal_word
+)
+from vocabulary_and_translation_gui.suggestions import suggest_with_deadline
+from vocabulary_and_translation_gui.tracing import span
 
 
 def translate_string(auth_key="", in_text="", src_lang="", tgt_lang=""):
@@ -59,13 +74,21 @@ def translate_string(auth_key="", in_text="", src_lang="", tgt_lang=""):
     # Initialize the translator object with the authentication key
     translator = deepl.Translator(auth_key)
 
+    # Count the request and the billed characters for each language pair
+    labels = {"source": input_lang or "auto", "target": output_lang,
+              "kind": "translate"}
+    increment("deepl_requests_total", labels=labels)
+    increment("deepl_characters_total", len(in_text), labels)
+
     # Call the `translate_text` method of the translator object to translate
     # the input string with the specified source and target languages
     try:
-        result = translator.translate_text(
-            in_text, source_lang=input_lang,
-            target_lang=output_lang
-        )
+        with span("deepl request", labels), measure_time(
+                "deepl_request_seconds", {"kind": "translate"}):
+            result = translator.translate_text(
+                in_text, source_lang=input_lang,
+                target_lang=output_lang
+            )
     except deepl.exceptions.AuthorizationException:
         # If the provided authentication key is invalid or unauthorized,
         # display an error message and raise a ValueError with the message.
@@ -136,6 +159,10 @@ def check_spelling(in_text="", lang=""):
     """
     Check the spelling of a given text in the specified language.
 
+    If the user keeps the original text, the misspelled words are only
+    added to the personal dictionary if the user chooses to always accept
+    them.
+
     Args:
     - in_text (str): Text to check the spelling of.
     - lang (str): Language to check the spelling in.
@@ -155,16 +182,21 @@ def check_spelling(in_text="", lang=""):
 
     # Split the input text into words and punctuation using a regular
     # expression
-    split_text = re.findall(r"[\w']+|[.,!?;: ]", in_text)
+    split_text = split_expression(in_text)
     try:
         # For each word in the split text, replace any incorrect spelling with
         # a corrected version using the specified language
-        correct_text_lst = [correct_spelling_mistakes(word, lang)
-                            for word in split_text]
+        with measure("spell-check"), measure_time("spell_check_seconds",
+                                                  {"language": lang}):
+            correct_text_lst = [correct_spelling_mistakes(word, lang)
+                                for word in split_text]
     except ValueError:
         # If a value error is raised when calling replace_wrong_words, raise
         # a new ValueError with the message "Expression not found"
         raise ValueError("Expression not found")
+    _count_checked_words(split_text, lang, sum(
+        word != correct for word, correct in zip(split_text,
+                                                 correct_text_lst)))
 
     # Join the corrected words and punctuation back into a single string
     correct_text = "".join(correct_text_lst)
@@ -188,7 +220,21 @@ def check_spelling(in_text="", lang=""):
             # If the user selects "Yes", return the corrected text
             return correct_text
         else:
-            # If the user selects "No", return the original text
+            # If the user selects "No", return the original text and offer to
+            # always accept the misspelled words
+            misspelled = list(dict.fromkeys(
+                word for word, correct in zip(split_text, correct_text_lst)
+                if word != correct))
+            always = (
+                "Do you want to add the following expressions to your "
+                + "personal dictionary, so they are always accepted?\n"
+                + ", ".join(misspelled)
+            )
+            if messagebox.askyesno(title="Always accept expression",
+                                   message=always):
+                dictionary_language = convert_language_name(lang, "dic")
+                for word in misspelled:
+                    add_personal_word(word, dictionary_language)
             return in_text
     else:
         # If the corrected text is the same as the original text, return the
@@ -213,7 +259,8 @@ def correct_spelling_mistakes(in_text="", dic_lang=""):
     """
     # Message and titles
     titles = {
-        "expression": "Expression not found"
+        "expression": "Expression not found",
+        "always": "Always accept expression"
     }
 
     messages = {
@@ -221,6 +268,11 @@ def correct_spelling_mistakes(in_text="", dic_lang=""):
                 "Following expression either not exist or is in "
                 + "the wrong language:\n" + in_text
                 + "\n\nDo you want to continue with this expression?"
+                ),
+        "always": (
+                "Do you want to add the following expression to your "
+                + "personal dictionary, so it is always accepted?\n"
+                + in_text
                 )
     }
     # Create a dictionary checker for the specified language, if no dictionary
@@ -230,9 +282,13 @@ def correct_spelling_mistakes(in_text="", dic_lang=""):
     except TypeError:
         return
 
+    # Words in the personal dictionary are accepted without asking enchant
+    if is_personal_word(in_text, dictionary_language):
+        return in_text
+
     # Check if the needed dictionary exist
     try:
-        txt_checker = enchant.Dict(dictionary_language)
+        txt_checker = get_dictionary(dictionary_language)
     except enchant.errors.DictNotFoundError:
         return in_text
 
@@ -241,7 +297,8 @@ def correct_spelling_mistakes(in_text="", dic_lang=""):
 
     # Check if word is spelled correct
     try:
-        word_is_correct = txt_checker.check(in_text)
+        with dictionary_lock(txt_checker):
+            word_is_correct = txt_checker.check(in_text)
     except enchant.errors.Error:
         return in_text
 
@@ -251,7 +308,9 @@ def correct_spelling_mistakes(in_text="", dic_lang=""):
         return in_text
     else:
         # If the word is misspelled, suggest the most likely correct spelling
-        correct = txt_checker.suggest(in_text)
+        # within the time limit for suggestions
+        correct = suggest_with_deadline(
+            word=in_text, dictionary_language=dictionary_language)
 
         # If there is at least one suggestion, return the first one
         if len(correct) > 0:
@@ -259,10 +318,129 @@ def correct_spelling_mistakes(in_text="", dic_lang=""):
         else:
             # If there are no suggestions, prompt the user with a message box
             # to either continue or stop
-            # If the user clicks 'Yes', return the original word, otherwise
-            # raise an error
+            # If the user clicks 'Yes', return the original word and offer to
+            # always accept it, otherwise raise an error
             if messagebox.askyesno(title=titles["expression"],
                                    message=messages["expression"]):
+                if messagebox.askyesno(title=titles["always"],
+                                       message=messages["always"]):
+                    add_personal_word(in_text, dictionary_language)
                 return in_text
             else:
                 raise ValueError(titles["expression"])
+
+
+def split_expression(in_text=""):
+    """
+    Split a text into words, punctuation marks and spaces.
+
+    Args:
+    - in_text (str): Text to split.
+
+    Returns:
+    - list: The words, punctuation marks and spaces of the text.
+    """
+    return re.findall(r"[\w']+|[.,!?;: ]", in_text)
+
+
+def find_spelling_mistakes(in_text="", lang=""):
+    """
+    Find all misspelled words of a text without asking the user.
+
+    Every word of the text is checked before anything is shown to the user,
+    so the check can run outside of the tkinter thread and all mistakes can
+    be reviewed at once.
+
+    Args:
+    - in_text (str): Text to check the spelling of.
+    - lang (str): Language to check the spelling in.
+
+    Returns:
+    - list: A dictionary for each misspelled word with the keys "index" (the
+    position in split_expression(in_text)), "word" and "suggestions".
+    """
+    # Without a known language there is nothing to check
+    if lang not in ["English", "Deutsch", "Türkçe"]:
+        return []
+    dictionary_language = convert_language_name(lang, "dic")
+
+    # Check if the needed dictionary exist
+    try:
+        txt_checker = get_dictionary(dictionary_language)
+    except enchant.errors.DictNotFoundError:
+        return []
+
+    # Create a list of punctuation marks and spaces
+    punctuation_list = [".", ",", "!", "?", ";", ":", " "]
+
+    mistakes = []
+    split_text = split_expression(in_text)
+    with measure("spell-check"), measure_time("spell_check_seconds",
+                                              {"language": lang}):
+        for index, word in enumerate(split_text):
+            # Skip punctuation marks and words of the personal dictionary
+            if (word in punctuation_list
+                    or is_personal_word(word, dictionary_language)):
+                continue
+
+            # Skip correctly spelled words
+            try:
+                with dictionary_lock(txt_checker):
+                    is_correct = txt_checker.check(word)
+                if is_correct:
+                    continue
+            except enchant.errors.Error:
+                continue
+
+            mistakes.append({
+                "index": index,
+                "word": word,
+                "suggestions": suggest_with_deadline(
+                    word=word, dictionary_language=dictionary_language)
+            })
+
+    _count_checked_words(split_text, lang, len(mistakes))
+    return mistakes
+
+
+def apply_corrections(in_text="", corrections={}):
+    """
+    Replace words of a text with the corrections chosen by the user.
+
+    Args:
+    - in_text (str): The original text.
+    - corrections (dict): The replacement for each index in
+    split_expression(in_text).
+
+    Returns:
+    - str: The corrected text.
+    """
+    # Without corrections the text is returned unchanged
+    if len(corrections) <= 0:
+        return in_text
+
+    split_text = split_expression(in_text)
+    for index, replacement in corrections.items():
+        split_text[index] = replacement
+    return "".join(split_text)
+
+
+def _count_checked_words(split_text, lang, misspelled):
+    """
+    Count the checked words without punctuation marks and spaces.
+
+    Args:
+    - split_text (list): The words, punctuation marks and spaces of the
+    checked text, see split_expression.
+    - lang (str): Language the text was checked in.
+    - misspelled (int): The number of misspelled words.
+
+    Returns:
+    - None
+    """
+    words = sum(1 for word in split_text
+                if word not in [".", ",", "!", "?", ";", ":", " "])
+    increment("spell_check_words_total", misspelled,
+              {"language": lang, "result": "misspelled"})
+    increment("spell_check_words_total", words - misspelled,
+              {"language": lang, "result": "correct"})
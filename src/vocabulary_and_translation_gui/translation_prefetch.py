@@ -0,0 +1,231 @@
+"""
+All functions for reusing translations between the buttons of the GUI.
+
+The translations of the last texts are kept in memory, so adding a text to
+the vocabulary list does not translate it again into the language that was
+just shown. After a text was translated, its translations into the other
+languages are requested speculatively in the background. DeepL counts every
+translated character against the quota of the key, so the speculative
+requests are limited by a budget of characters.
+
+A translation that is still requested in the background is waited for
+instead of being requested a second time. If a speculative request fails,
+the text is translated again with translate_string, which shows the error
+messages. Threads without a window use request_translation, which raises
+the errors instead.
+
+Functions:
+- translate_cached(auth_key, in_text, src_lang, tgt_lang)
+- request_translation(auth_key, in_text, src_lang, tgt_lang)
+- prefetch_translations(auth_key, in_text, src_lang, tgt_langs)
+- clear_translations()
+"""
+
+import collections
+import concurrent.futures
+import deepl
+import threading
+from vocabulary_and_translation_gui.config import PREFETCH_CHARACTER_BUDGET
+from vocabulary_and_translation_gui.metrics import increment, measure_time
+from vocabulary_and_translation_gui.tracing import (
+    propagate,
+    set_attribute,
+    span
+)
+from vocabulary_and_translation_gui.translation_and_spelling import (
+    convert_language_name,
+    translate_string
+)
+
+# Number of translations that are kept
+CACHE_SIZE = 256
+
+# Translations of the last texts as futures, the oldest first, e.g.
+# {("Haus", "Deutsch", "English"): Future of ("house", "DE")}
+_translations = collections.OrderedDict()
+
+# Number of characters requested speculatively
+_prefetched_characters = 0
+
+# Threads for the speculative requests, created on the first request
+_executor = None
+
+# Lock for the translations, they are requested from several threads
+_lock = threading.RLock()
+
+
+def translate_cached(auth_key="", in_text="", src_lang="", tgt_lang=""):
+    """
+    Translate a string and keep the translation.
+
+    A kept or speculatively requested translation is returned without a new
+    request.
+
+    Args:
+    - auth_key (str): Key for the translation functions with DeepL.
+    - in_text (str): String to be translated.
+    - src_lang (str): Source language of the string.
+    - tgt_lang (str): Target language for the translation.
+
+    Returns:
+    - tuple: The translated text and the detected source language, or None
+    if the languages are not strings.
+
+    Raises:
+    - ValueError: If the string can't be translated, see translate_string.
+    """
+    cache_key = (in_text, src_lang, tgt_lang)
+    with _lock:
+        future = _translations.get(cache_key)
+        if future is not None:
+            _translations.move_to_end(cache_key)
+
+    if future is not None:
+        try:
+            output = future.result()
+            increment("translation_cache_total", labels={"result": "hit"})
+            set_attribute("cache_hit", True)
+            return output
+        except Exception:
+            # The speculative request failed, so the text is translated
+            # again and the error is shown to the user
+            with _lock:
+                if _translations.get(cache_key) is future:
+                    del _translations[cache_key]
+
+    increment("translation_cache_total", labels={"result": "miss"})
+    set_attribute("cache_hit", False)
+    output = translate_string(auth_key, in_text, src_lang, tgt_lang)
+    if output is not None:
+        future = concurrent.futures.Future()
+        future.set_result(output)
+        _keep(cache_key, future)
+    return output
+
+
+def request_translation(auth_key="", in_text="", src_lang="",
+                        tgt_lang=""):
+    """
+    Translate a string in a background thread and keep the translation.
+
+    A kept translation is reused and a translation that is requested by
+    another thread is waited for. Unlike translate_cached, no message boxes
+    are shown, so the function can be called outside of the tkinter thread.
+
+    Args:
+    - auth_key (str): Key for the translation functions with DeepL.
+    - in_text (str): String to be translated.
+    - src_lang (str): Source language of the string.
+    - tgt_lang (str): Target language for the translation.
+
+    Returns:
+    - tuple: The translated text and the detected source language.
+
+    Raises:
+    - Exception: The error of the request, e.g. deepl.DeepLException. The
+    failed translation is not kept.
+    """
+    cache_key = (in_text, src_lang, tgt_lang)
+    with _lock:
+        future = _translations.get(cache_key)
+        requested = future is None
+        if requested:
+            future = concurrent.futures.Future()
+            _keep(cache_key, future)
+        else:
+            _translations.move_to_end(cache_key)
+    increment("translation_cache_total",
+              labels={"result": "miss" if requested else "hit"})
+    set_attribute("cache_hit", not requested)
+
+    if requested:
+        try:
+            future.set_result(_request(auth_key, in_text, src_lang,
+                                       tgt_lang))
+        except Exception as error:
+            future.set_exception(error)
+            with _lock:
+                if _translations.get(cache_key) is future:
+                    del _translations[cache_key]
+    return future.result()
+
+
+def prefetch_translations(auth_key="", in_text="", src_lang="",
+                          tgt_langs=[]):
+    """
+    Request translations of a string in the background.
+
+    Translations that are already kept are not requested again. A request is
+    only sent if the characters of the string fit into the rest of the
+    budget for speculative requests.
+
+    Args:
+    - auth_key (str): Key for the translation functions with DeepL.
+    - in_text (str): String to be translated.
+    - src_lang (str): Source language of the string.
+    - tgt_langs (list): Target languages for the translations.
+
+    Returns:
+    - int: The number of requested translations.
+    """
+    global _executor, _prefetched_characters
+
+    requested = 0
+    with _lock:
+        for tgt_lang in tgt_langs:
+            cache_key = (in_text, src_lang, tgt_lang)
+            if len(in_text) <= 0 or cache_key in _translations:
+                continue
+            if (_prefetched_characters + len(in_text)
+                    > PREFETCH_CHARACTER_BUDGET):
+                break
+
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    2, thread_name_prefix="prefetch")
+            _prefetched_characters += len(in_text)
+            _keep(cache_key, _executor.submit(propagate(_request), auth_key,
+                                              in_text, src_lang, tgt_lang))
+            requested += 1
+    return requested
+
+
+def clear_translations():
+    """
+    Remove all kept translations and reset the budget.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    global _prefetched_characters
+
+    with _lock:
+        _translations.clear()
+        _prefetched_characters = 0
+
+
+def _keep(cache_key, future):
+    # Keep a translation and remove the oldest ones
+    with _lock:
+        _translations[cache_key] = future
+        _translations.move_to_end(cache_key)
+        while len(_translations) > CACHE_SIZE:
+            _translations.popitem(last=False)
+
+
+def _request(auth_key, in_text, src_lang, tgt_lang):
+    # Translate without showing messages, the request runs in a thread
+    source = convert_language_name(src_lang, "src")
+    target = convert_language_name(tgt_lang, "tgt")
+    labels = {"source": source or "auto", "target": target,
+              "kind": "background"}
+    increment("deepl_requests_total", labels=labels)
+    increment("deepl_characters_total", len(in_text), labels)
+    with span("deepl request", labels), measure_time(
+            "deepl_request_seconds", {"kind": "background"}):
+        result = deepl.Translator(auth_key).translate_text(
+            in_text, source_lang=source, target_lang=target)
+    return result.text, result.detected_source_lang
@@ -0,0 +1,204 @@
+"""
+The compact type for the entries of the vocabulary list.
+
+A VocabularyEntry keeps the English, German and Turkish words, the time it
+was added as integer microseconds since 1970-01-01 UTC and optionally the
+code of the source language, e.g. "DE". Like the vocabulary list, the entry
+returns the time as local datetime without time zone. The language codes
+are interned, so all entries share one string for each language.
+
+An entry behaves like the list [English, Deutsch, Türkçe, timestamp] of the
+vocabulary list, so it can be passed to all functions that save word lists.
+
+Classes:
+- VocabularyEntry
+
+Functions:
+- to_entries(word_list, source)
+- to_word_list(entries)
+- entries_frame(entries, with_timestamp)
+"""
+
+import datetime
+import numpy as np
+import pandas as pd
+import sys
+
+# Start of the integer timestamps, the timestamps are converted from and to
+# local time like datetime.datetime.now()
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# Microseconds of the time span with the same UTC offset in entries_frame,
+# the offsets change at full quarters of an hour
+QUARTER_HOUR = 15 * 60 * 1000000
+
+
+class VocabularyEntry:
+    """
+    An entry of the vocabulary list.
+
+    Attributes:
+        - english (str): The English word or expression.
+        - deutsch (str): The German word or expression.
+        - turkce (str): The Turkish word or expression.
+        - timestamp (int): Microseconds since 1970-01-01 UTC when the entry
+        was added.
+        - source (str): Code of the source language, e.g. "DE", or None.
+
+    Methods:
+        - from_list: Create an entry from the list shape of the vocabulary
+        list.
+        - to_list: Return the entry in the list shape of the vocabulary list.
+    """
+    __slots__ = ("english", "deutsch", "turkce", "timestamp", "source")
+
+    def __init__(self, english="", deutsch="", turkce="", timestamp=0,
+                 source=None):
+        self.english = english
+        self.deutsch = deutsch
+        self.turkce = turkce
+        self.timestamp = timestamp
+        self.source = None if source is None else sys.intern(source)
+
+    @classmethod
+    def from_list(cls, entry=[], source=None):
+        """
+        Create an entry from the list shape of the vocabulary list.
+
+        Args:
+        - entry (list): The English, German and Turkish words and a
+        timestamp as datetime, ISO 8601 text or integer microseconds.
+        Datetimes without time zone are local time.
+        - source (str): Code of the source language, e.g. "DE", or None.
+
+        Returns:
+        - VocabularyEntry: The entry.
+
+        Raises:
+        - ValueError: If the entry does not have four entries or the
+        timestamp can't be read.
+        """
+        if isinstance(entry, VocabularyEntry):
+            return entry
+        if len(entry) != 4:
+            raise ValueError("An entry has to have exactly four entries.")
+
+        timestamp = entry[3]
+        if isinstance(timestamp, str):
+            timestamp = datetime.datetime.fromisoformat(timestamp)
+        if isinstance(timestamp, datetime.datetime):
+            timestamp = (timestamp.astimezone(datetime.timezone.utc)
+                         - EPOCH) // datetime.timedelta(microseconds=1)
+        return cls(str(entry[0]), str(entry[1]), str(entry[2]),
+                   int(timestamp), source)
+
+    def to_list(self):
+        """
+        Return the entry in the list shape of the vocabulary list.
+
+        Returns:
+        - list: The English, German and Turkish words and the timestamp as
+        datetime.
+        """
+        return [self.english, self.deutsch, self.turkce, self.datetime]
+
+    @property
+    def datetime(self):
+        """The timestamp as local datetime without time zone."""
+        return (EPOCH + datetime.timedelta(microseconds=self.timestamp)
+                ).astimezone().replace(tzinfo=None)
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, index):
+        # The words are returned without creating the datetime
+        if index in (0, 1, 2, -4, -3, -2):
+            return (self.english, self.deutsch, self.turkce)[index % 4]
+        return self.to_list()[index]
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __eq__(self, other):
+        if isinstance(other, VocabularyEntry):
+            return (self.english, self.deutsch, self.turkce,
+                    self.timestamp) == (other.english, other.deutsch,
+                                        other.turkce, other.timestamp)
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __hash__(self):
+        # Equal entries and tuples have the same hash
+        return hash(tuple(self.to_list()))
+
+    def __repr__(self):
+        return (f"VocabularyEntry({self.english!r}, {self.deutsch!r}, "
+                f"{self.turkce!r}, {self.timestamp!r}, {self.source!r})")
+
+
+def to_entries(word_list=[], source=None):
+    """
+    Convert a word list into vocabulary entries.
+
+    Args:
+    - word_list (list): Entries in the list shape of the vocabulary list.
+    - source (str): Code of the source language, e.g. "DE", or None.
+
+    Returns:
+    - list: The VocabularyEntry of each entry.
+    """
+    return [VocabularyEntry.from_list(entry, source) for entry in word_list]
+
+
+def to_word_list(entries=[]):
+    """
+    Convert vocabulary entries into the list shape of the vocabulary list.
+
+    Args:
+    - entries (list): The vocabulary entries.
+
+    Returns:
+    - list: The entries as lists with a datetime timestamp.
+    """
+    return [entry.to_list() for entry in entries]
+
+
+def entries_frame(entries=[], with_timestamp=True):
+    """
+    Create a data frame of vocabulary entries without converting each entry.
+
+    The columns are read attribute by attribute and the integer timestamps
+    are converted into local datetime values at once.
+
+    Args:
+    - entries (list): The vocabulary entries.
+    - with_timestamp (bool): If False, only the columns of the words are
+    created.
+
+    Returns:
+    - pd.DataFrame: The columns Timestamp, English, Deutsch and Türkçe.
+    """
+    columns = {}
+    if with_timestamp:
+        columns["Timestamp"] = _local_times(np.array(
+            [entry.timestamp for entry in entries], dtype=np.int64))
+    columns["English"] = [entry.english for entry in entries]
+    columns["Deutsch"] = [entry.deutsch for entry in entries]
+    columns["Türkçe"] = [entry.turkce for entry in entries]
+    return pd.DataFrame(columns)
+
+
+def _local_times(timestamps):
+    # Convert the integer timestamps into local datetime64 values, the UTC
+    # offset is looked up once for each quarter of an hour
+    quarters, inverse = np.unique(timestamps // QUARTER_HOUR,
+                                  return_inverse=True)
+    offsets = np.array(
+        [(EPOCH + datetime.timedelta(microseconds=int(quarter)
+                                     * QUARTER_HOUR)).astimezone().utcoffset()
+         // datetime.timedelta(microseconds=1) for quarter in quarters],
+        dtype=np.int64)
+    return (timestamps + offsets[inverse.reshape(-1)]).astype(
+        "datetime64[us]")
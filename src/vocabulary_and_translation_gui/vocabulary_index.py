@@ -0,0 +1,552 @@
+"""
+All functions for finding words that are already in the vocabulary list.
+
+Each entry of the vocabulary list is indexed by its normalized words, one
+hash table for each language. Before a word is translated, the index is
+asked for its stored translations, so a word is never translated twice.
+Word lists are deduplicated before they are saved by matching their
+normalized keys with pandas. The keys of a saved Excel file are kept in the
+file_keys folder together with the size and modification time of the file,
+so the file is only read again if it was changed by another program.
+
+For the search box, the normalized words and the single words of longer
+expressions are also kept in a sorted list for prefix searches and in a
+trigram index for fuzzy searches. Both are updated with every indexed or
+removed entry.
+
+The entries have the shape of the vocabulary list, [English, Deutsch,
+Türkçe, timestamp].
+
+Functions:
+- normalize_word(word)
+- index_entries(entries)
+- index_entries_in_background(entries, chunk_size)
+- remove_entries(entries)
+- find_entry(word, lang)
+- clear_index()
+- trigrams(word)
+- search_prefix(text, limit)
+- search_fuzzy(text, limit, threshold)
+- search_entries(text, limit)
+- entry_keys(word_list)
+- read_xlsx_keys(path, sheet_name)
+- remember_xlsx_keys(path, keys, sheet_name)
+- read_file_keys(path)
+- drop_duplicate_entries(word_list, known_keys)
+"""
+
+import bisect
+import collections
+import hashlib
+import json
+import math
+import os
+import pandas as pd
+import threading
+from vocabulary_and_translation_gui.config import FILE_KEYS
+from vocabulary_and_translation_gui.vocabulary_entry import (
+    VocabularyEntry,
+    entries_frame
+)
+
+# Languages of the vocabulary list in the order of the entries
+LANGUAGES = ["English", "Deutsch", "Türkçe"]
+
+# Indexed entries for each language, e.g. {"Deutsch": {"haus": [...]}}
+_index = {lang: {} for lang in LANGUAGES}
+
+# Sorted search keys for the prefix search
+_sorted_keys = []
+
+# Entries of each search key, e.g. {"haus": [...]}. A key without entries
+# was removed
+_key_entries = {}
+
+# Search keys in the order they were added, the trigram index refers to
+# the positions in this list
+_id_keys = []
+
+# Positions of the search keys with a trigram, one index for each number of
+# trigrams of the keys, e.g. _trigrams[5] = {" ha": [0, 7]}
+_trigrams = []
+
+# Lock for the index, words can be added from a thread
+_lock = threading.Lock()
+
+
+def normalize_word(word=""):
+    """
+    Normalize a word or expression for looking it up in the index.
+
+    The text is compared without case and with single spaces.
+
+    Args:
+    - word (str): The word or expression.
+
+    Returns:
+    - str: The normalized word.
+    """
+    return " ".join(str(word).split()).casefold()
+
+
+def index_entries(entries=[]):
+    """
+    Add entries of the vocabulary list to the index.
+
+    An entry which is already indexed for a word is kept.
+
+    Args:
+    - entries (list): Entries containing English, German and Turkish words
+    and a timestamp.
+
+    Returns:
+    - None
+    """
+    with _lock:
+        new_keys = []
+        for entry in entries:
+            for position, lang in enumerate(LANGUAGES):
+                key = normalize_word(entry[position])
+                if len(key) > 0:
+                    _index[lang].setdefault(key, entry)
+                    for search_key in _search_keys(key):
+                        _add_search_key(search_key, entry, new_keys)
+
+        # Many new keys are sorted at once, single keys are inserted
+        if len(new_keys) > 64:
+            _sorted_keys.extend(new_keys)
+            _sorted_keys.sort()
+        else:
+            for key in new_keys:
+                bisect.insort(_sorted_keys, key)
+
+
+def index_entries_in_background(entries=[], chunk_size=10000):
+    """
+    Add entries to the index in a background thread.
+
+    The entries are indexed in chunks, so words can be looked up and added
+    while a large vocabulary is indexed.
+
+    Args:
+    - entries (list): Entries containing English, German and Turkish words
+    and a timestamp.
+    - chunk_size (int): Number of entries indexed at once.
+
+    Returns:
+    - threading.Thread: The started thread.
+    """
+    def index_chunks():
+        for start in range(0, len(entries), chunk_size):
+            index_entries(entries[start:start + chunk_size])
+
+    thread = threading.Thread(target=index_chunks, name="vocabulary-index",
+                              daemon=True)
+    thread.start()
+    return thread
+
+
+def remove_entries(entries=[]):
+    """
+    Remove entries of the vocabulary list from the index.
+
+    Only the words that are indexed for an entry with the same words are
+    removed.
+
+    Args:
+    - entries (list): The indexed entries.
+
+    Returns:
+    - None
+    """
+    with _lock:
+        for entry in entries:
+            for position, lang in enumerate(LANGUAGES):
+                key = normalize_word(entry[position])
+                indexed = _index[lang].get(key)
+                if indexed is not None and _same_words(indexed, entry):
+                    del _index[lang][key]
+
+                for search_key in _search_keys(key):
+                    key_entries = _key_entries.get(search_key, [])
+                    key_entries[:] = [other for other in key_entries
+                                      if not _same_words(other, entry)]
+                    key_position = bisect.bisect_left(_sorted_keys,
+                                                      search_key)
+                    if (len(key_entries) <= 0
+                            and key_position < len(_sorted_keys)
+                            and _sorted_keys[key_position] == search_key):
+                        del _sorted_keys[key_position]
+
+
+def find_entry(word="", lang=""):
+    """
+    Find the indexed entry of a word.
+
+    Args:
+    - word (str): The word or expression to look up.
+    - lang (str): Language of the word. If it is not one of the languages of
+    the vocabulary list, e.g. "Automatic language recognition", the word is
+    looked up in all languages.
+
+    Returns:
+    - list: The entry with the word, or None if the word is not indexed.
+    """
+    key = normalize_word(word)
+    languages = [lang] if lang in LANGUAGES else LANGUAGES
+    with _lock:
+        for language in languages:
+            entry = _index[language].get(key)
+            if entry is not None:
+                return entry
+    return None
+
+
+def clear_index():
+    """
+    Remove all entries from the index.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    with _lock:
+        for words in _index.values():
+            words.clear()
+        _sorted_keys.clear()
+        _key_entries.clear()
+        _id_keys.clear()
+        _trigrams.clear()
+
+
+def trigrams(word=""):
+    """
+    Return the trigrams of a normalized word.
+
+    The word is padded with two spaces in front and one space at the end,
+    so the beginning of a word weighs more than its end.
+
+    Args:
+    - word (str): The normalized word.
+
+    Returns:
+    - set: The trigrams of the word.
+    """
+    padded = "  " + word + " "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def search_prefix(text="", limit=20):
+    """
+    Find the entries with a word that starts with a text.
+
+    Args:
+    - text (str): The beginning of the word.
+    - limit (int): Maximum number of returned entries.
+
+    Returns:
+    - list: The entries in the alphabetical order of the found words.
+    """
+    prefix = normalize_word(text)
+    if len(prefix) <= 0:
+        return []
+
+    keys = []
+    with _lock:
+        position = bisect.bisect_left(_sorted_keys, prefix)
+        while (position < len(_sorted_keys) and len(keys) < limit
+               and _sorted_keys[position].startswith(prefix)):
+            keys.append(_sorted_keys[position])
+            position += 1
+        return _entries_of_keys(keys, limit)
+
+
+def search_fuzzy(text="", limit=20, threshold=0.4):
+    """
+    Find the entries with a word that is similar to a text.
+
+    The similarity of two words is the number of their common trigrams
+    divided by the number of all their trigrams.
+
+    Args:
+    - text (str): The word to search for.
+    - limit (int): Maximum number of returned entries.
+    - threshold (float): Minimum similarity of a found word, greater than
+    0 and at most 1.
+
+    Returns:
+    - list: The entries ordered by the similarity of the found words.
+    """
+    word = normalize_word(text)
+    if len(word) <= 0:
+        return []
+    query = trigrams(word)
+
+    # A key with size trigrams and shared common trigrams has the
+    # similarity shared / (len(query) + size - shared), so only keys with a
+    # similar number of trigrams are compared. The common trigrams are
+    # counted with a Counter for all keys of a size at once
+    scored = []
+    with _lock:
+        smallest = max(1, math.ceil(threshold * len(query)))
+        largest = min(len(_trigrams) - 1,
+                      math.floor(len(query) / threshold))
+        for size in range(smallest, largest + 1):
+            postings = _trigrams[size]
+            counts = collections.Counter()
+            for trigram in query:
+                counts.update(postings.get(trigram, ()))
+
+            needed = math.ceil(threshold * (len(query) + size)
+                               / (1 + threshold) - 1e-9)
+            for key_id, shared in counts.items():
+                if shared >= needed and len(_key_entries[_id_keys[key_id]]):
+                    scored.append((-shared / (len(query) + size - shared),
+                                   _id_keys[key_id]))
+        scored.sort()
+        return _entries_of_keys([key for _, key in scored], limit)
+
+
+def search_entries(text="", limit=20):
+    """
+    Find the entries for the search box.
+
+    The entries with a word that starts with the text are followed by the
+    entries with a similar word.
+
+    Args:
+    - text (str): The searched text.
+    - limit (int): Maximum number of returned entries.
+
+    Returns:
+    - list: The found entries.
+    """
+    results = search_prefix(text, limit)
+    if len(results) < limit:
+        found = {id(entry) for entry in results}
+        for entry in search_fuzzy(text, limit):
+            if id(entry) not in found and len(results) < limit:
+                found.add(id(entry))
+                results.append(entry)
+    return results
+
+
+def _search_keys(key):
+    # The normalized word and the single words of a longer expression
+    if " " not in key:
+        return (key,)
+    return (key,) + tuple(word for word in dict.fromkeys(key.split(" "))
+                          if len(word) > 1)
+
+
+def _add_search_key(key, entry, new_keys):
+    # Add an entry to a search key, new keys are collected for sorting.
+    # The entry is only compared with the last entry of the key, because
+    # all keys of an entry are added one after the other
+    key_entries = _key_entries.get(key)
+    if key_entries is None:
+        key_entries = _key_entries[key] = []
+        key_id = len(_id_keys)
+        _id_keys.append(key)
+        key_trigrams = trigrams(key)
+        while len(_trigrams) <= len(key_trigrams):
+            _trigrams.append({})
+        postings = _trigrams[len(key_trigrams)]
+        for trigram in key_trigrams:
+            postings.setdefault(trigram, []).append(key_id)
+    if len(key_entries) <= 0:
+        new_keys.append(key)
+    if len(key_entries) <= 0 or key_entries[-1] is not entry:
+        key_entries.append(entry)
+
+
+def _entries_of_keys(keys, limit):
+    # Collect the entries of the keys once each, up to the limit
+    results = []
+    found = set()
+    for key in keys:
+        for entry in _key_entries[key]:
+            if id(entry) not in found:
+                found.add(id(entry))
+                results.append(entry)
+                if len(results) >= limit:
+                    return results
+    return results
+
+
+def _same_words(entry, other):
+    # Compare the words of two entries
+    return all(entry[i] == other[i] for i in range(len(LANGUAGES)))
+
+
+def entry_keys(word_list=[]):
+    """
+    Build the normalized keys of the entries of a word list.
+
+    The words are normalized with vectorized string methods of pandas, the
+    key of an entry joins its English, German and Turkish words.
+
+    Args:
+    - word_list (list or pd.DataFrame): Entries containing English, German
+    and Turkish words, optionally followed by a timestamp, or
+    VocabularyEntry objects.
+
+    Returns:
+    - pd.Series: The key of each entry.
+    """
+    if (isinstance(word_list, list) and len(word_list) > 0
+            and all(isinstance(entry, VocabularyEntry)
+                    for entry in word_list)):
+        df = entries_frame(word_list, with_timestamp=False)
+    else:
+        df = pd.DataFrame(word_list)
+    if len(df) <= 0:
+        return pd.Series([], dtype=str)
+
+    keys = None
+    for position in range(len(LANGUAGES)):
+        words = (df.iloc[:, position].astype(str)
+                 .str.replace(r"\s+", " ", regex=True)
+                 .str.strip()
+                 .str.casefold())
+        keys = words if keys is None else keys + "\x1f" + words
+    return keys.reset_index(drop=True)
+
+
+def read_xlsx_keys(path="", sheet_name="Vocabulary"):
+    """
+    Read the normalized keys of the rows of an Excel file.
+
+    The keys that were kept for the file are used if the file was not
+    changed since, otherwise the sheet is read and its keys are kept.
+
+    Args:
+    - path (str): Path of the Excel file.
+    - sheet_name (str): Name of the sheet with the vocabulary list.
+
+    Returns:
+    - set: The keys of the rows, or an empty set if the file does not exist
+    or has no vocabulary list.
+    """
+    if not os.path.exists(path):
+        return set()
+    keys = _read_kept_keys(path, sheet_name)
+    if keys is not None:
+        return keys
+    try:
+        df = pd.read_excel(path, sheet_name=sheet_name, usecols=LANGUAGES,
+                           dtype=str, keep_default_na=False)
+    except ValueError:
+        return set()
+    keys = set(entry_keys(df[LANGUAGES]))
+    remember_xlsx_keys(path, keys, sheet_name)
+    return keys
+
+
+def remember_xlsx_keys(path="", keys=set(), sheet_name="Vocabulary"):
+    """
+    Keep the keys of all rows of an Excel file after it was written.
+
+    Args:
+    - path (str): Path of the Excel file.
+    - keys (set): The keys of all rows of the sheet.
+    - sheet_name (str): Name of the sheet with the vocabulary list.
+
+    Returns:
+    - None
+    """
+    # If the directory for the keys not exist, a new directory get created
+    os.makedirs(FILE_KEYS, exist_ok=True)
+    status = os.stat(path)
+    header = {"path": os.path.abspath(path), "sheet": sheet_name,
+              "mtime_ns": status.st_mtime_ns, "size": status.st_size}
+    kept_path = _kept_keys_path(path, sheet_name)
+    with open(kept_path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(json.dumps(header, ensure_ascii=False) + "\n")
+        for key in keys:
+            f.write(key + "\n")
+    os.replace(kept_path + ".tmp", kept_path)
+
+
+def read_file_keys(path=""):
+    """
+    Read the normalized keys of the rows of a saved vocabulary list.
+
+    Args:
+    - path (str): Path of an Excel (.xlsx), CSV (.csv), Parquet (.parquet)
+    or Feather (.feather) file.
+
+    Returns:
+    - set: The keys of the rows, or an empty set if the file does not exist
+    or has another type.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".xlsx":
+        return read_xlsx_keys(path)
+    if not os.path.exists(path):
+        return set()
+
+    if extension == ".csv":
+        df = pd.read_csv(path, usecols=LANGUAGES, dtype=str,
+                         keep_default_na=False)
+    elif extension == ".parquet":
+        df = pd.read_parquet(path, columns=LANGUAGES)
+    elif extension == ".feather":
+        df = pd.read_feather(path, columns=LANGUAGES)
+    else:
+        return set()
+    return set(entry_keys(df[LANGUAGES]))
+
+
+def drop_duplicate_entries(word_list=[], known_keys=set(), keys=None):
+    """
+    Remove duplicated and already known entries from a word list.
+
+    Args:
+    - word_list (list): Entries containing English, German and Turkish words
+    and a timestamp.
+    - known_keys (set): Keys of entries that are already saved, e.g. from
+    read_xlsx_keys.
+    - keys (list): The keys of the entries, see entry_keys. If given, the
+    keys are not built again and word_list must not contain duplicates,
+    e.g. the entries prepared by export_pipeline.export_all.
+
+    Returns:
+    - list: The first entry of each key that is not known, in the order of
+    word_list.
+    """
+    # Looking up each key in the set only costs time for the new entries,
+    # isin would convert all known keys
+    if keys is not None:
+        return [entry for entry, key in zip(word_list, keys)
+                if key not in known_keys]
+
+    keys = entry_keys(word_list)
+    known = pd.Series([key in known_keys for key in keys], dtype=bool)
+    keep = ~keys.duplicated() & ~known
+    return [entry for entry, is_kept in zip(word_list, keep) if is_kept]
+
+
+def _kept_keys_path(path, sheet_name):
+    # Path of the kept keys of a sheet, named by a hash of the file path
+    name = hashlib.sha1((os.path.abspath(path) + "\n" + sheet_name)
+                        .encode("utf-8")).hexdigest()
+    return os.path.join(FILE_KEYS, name + ".keys")
+
+
+def _read_kept_keys(path, sheet_name):
+    # Return the kept keys of a sheet, or None if the file was changed
+    kept_path = _kept_keys_path(path, sheet_name)
+    if not os.path.exists(kept_path):
+        return None
+    status = os.stat(path)
+    with open(kept_path, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if (header["path"] != os.path.abspath(path)
+                or header["sheet"] != sheet_name
+                or header["mtime_ns"] != status.st_mtime_ns
+                or header["size"] != status.st_size):
+            return None
+        return {line[:-1] for line in f}
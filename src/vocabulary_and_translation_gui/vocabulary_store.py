@@ -0,0 +1,310 @@
+"""
+All functions for the persistent store of the added vocabularies.
+
+Every word added to the vocabulary list is saved right away in a SQLite
+database in WAL mode, so the words are not lost if the application is closed
+or crashes before they are saved to a file. A unique index on the words
+skips duplicates, and an export watermark for each file remembers which
+entries were already written to it.
+
+The entries have the shape of the vocabulary list, [English, Deutsch,
+Türkçe, timestamp]. The timestamps are stored in ISO 8601 format and
+returned as datetime values.
+
+Functions:
+- open_store(path)
+- add_entry(entry, path)
+- add_entries(entries, path)
+- update_entry(old_entry, new_entry, path)
+- delete_entry(entry, path)
+- get_entries(path, after_id)
+- get_unsaved_entries(path)
+- get_unexported_entries(target, path)
+- mark_exported(target, last_id, path)
+- close_stores()
+"""
+
+import datetime
+import os
+import sqlite3
+import threading
+import time
+from vocabulary_and_translation_gui.config import VOCABULARY_STORE
+
+# Tables of the store, the entries and the last exported entry of each file
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    english TEXT NOT NULL,
+    deutsch TEXT NOT NULL,
+    turkce TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_entries_words
+    ON entries (english, deutsch, turkce);
+CREATE TABLE IF NOT EXISTS exports (
+    target TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL,
+    exported_at REAL NOT NULL
+);
+"""
+
+# Open connections, e.g. {"/home/user/vocabulary.sqlite3": sqlite3.Connection}
+_connections = {}
+
+# Lock for the connections, words can be added and exported from a thread
+_lock = threading.RLock()
+
+
+def open_store(path=None):
+    """
+    Return the connection to a store and create the store if needed.
+
+    Args:
+    - path (str): Path of the SQLite database. If None, the path of the
+    configuration is used.
+
+    Returns:
+    - sqlite3.Connection: The connection to the store.
+    """
+    if path is None:
+        path = VOCABULARY_STORE
+    path = os.path.abspath(path)
+
+    with _lock:
+        if path not in _connections:
+            # If the directory for the file not exist, a new directory get
+            # created
+            if not os.path.exists(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+
+            # In WAL mode a commit only appends to the log, so every added
+            # word can be committed on its own
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.executescript(SCHEMA)
+            _connections[path] = connection
+
+        return _connections[path]
+
+
+def add_entry(entry=[], path=None):
+    """
+    Add an entry of the vocabulary list to the store.
+
+    Args:
+    - entry (list): The English, German and Turkish words and a timestamp.
+    - path (str): Path of the SQLite database. If None, the path of the
+    configuration is used.
+
+    Returns:
+    - bool: True if the entry was added, False if the words are already in
+    the store.
+    """
+    with _lock:
+        connection = open_store(path)
+        with connection:
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO entries (english, deutsch, turkce, "
+                "timestamp, created_at) VALUES (?, ?, ?, ?, ?)",
+                (entry[0], entry[1], entry[2], str(entry[3]), time.time()))
+        return cursor.rowcount > 0
+
+
+def add_entries(entries=[], path=None):
+    """
+    Add many entries of the vocabulary list to the store in one transaction.
+
+    Args:
+    - entries (list): Entries containing English, German and Turkish words
+    and a timestamp.
+    - path (str): Path of the SQLite database. If None, the path of the
+    configuration is used.
+
+    Returns:
+    - list: The entries that were added, without the entries whose words
+    are already in the store.
+    """
+    added = []
+    created_at = time.time()
+    with _lock:
+        connection = open_store(path)
+        with connection:
+            for entry in entries:
+                cursor = connection.execute(
+                    "INSERT OR IGNORE INTO entries (english, deutsch, "
+                    "turkce, timestamp, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (entry[0], entry[1], entry[2], str(entry[3]),
+                     created_at))
+                if cursor.rowcount > 0:
+                    added.append(entry)
+    return added
+
+
+def update_entry(old_entry=[], new_entry=[], path=None):
+    """
+    Replace the words of an entry of the store.
+
+    Args:
+    - old_entry (list): The entry with the stored words.
+    - new_entry (list): The entry with the new words.
+    - path (str): Path of the SQLite database. If None, the path of the
+    configuration is used.
+
+    Returns:
+    - bool: True if the entry was changed, False if the old words are not in
+    the store or the new words are already in the store.
+    """
+    with _lock:
+        connection = open_store(path)
+        try:
+            with connection:
+                cursor = connection.execute(
+                    "UPDATE entries SET english = ?, deutsch = ?, "
+                    "turkce = ? WHERE english = ? AND deutsch = ? AND "
+                    "turkce = ?",
+                    (new_entry[0], new_entry[1], new_entry[2],
+                     old_entry[0], old_entry[1], old_entry[2]))
+        except sqlite3.IntegrityError:
+            return False
+        return cursor.rowcount > 0
+
+
+def delete_entry(entry=[], path=None):
+    """
+    Delete an entry from the store.
+
+    Args:
+    - entry (list): The entry with the stored words.
+    - path (str): Path of the SQLite database. If None, the path of the
+    configuration is used.
+
+    Returns:
+    - bool: True if the entry was deleted, False if the words are not in the
+    store.
+    """
+    with _lock:
+        connection = open_store(path)
+        with connection:
+            cursor = connection.execute(
+                "DELETE FROM entries WHERE english = ? AND deutsch = ? AND "
+                "turkce = ?", (entry[0], entry[1], entry[2]))
+        return cursor.rowcount > 0
+
+
+def get_entries(path=None, after_id=0):
+    """
+    Return the entries of the store in the order they were added.
+
+    Args:
+    - path (str): Path of the SQLite database. If None, the path of the
+    configuration is used.
+    - after_id (int): Only entries with a higher ID are returned.
+
+    Returns:
+    - list: The entries in the shape of the vocabulary list.
+    """
+    with _lock:
+        rows = open_store(path).execute(
+            "SELECT english, deutsch, turkce, timestamp FROM entries "
+            "WHERE id > ? ORDER BY id", (after_id,)).fetchall()
+    return [[english, deutsch, turkce, _parse_timestamp(timestamp)]
+            for english, deutsch, turkce, timestamp in rows]
+
+
+def get_unsaved_entries(path=None):
+    """
+    Return the entries that were not yet exported to any file.
+
+    Args:
+    - path (str): Path of the SQLite database. If None, the path of the
+    configuration is used.
+
+    Returns:
+    - list: The entries in the shape of the vocabulary list.
+    """
+    with _lock:
+        last_id, = open_store(path).execute(
+            "SELECT COALESCE(MAX(last_id), 0) FROM exports").fetchone()
+        return get_entries(path, after_id=last_id)
+
+
+def get_unexported_entries(target="", path=None):
+    """
+    Return the entries that were not yet exported to a file.
+
+    Args:
+    - target (str or list): Path of the exported file. For a list of paths,
+    the entries that are missing in at least one of the files are returned.
+    - path (str): Path of the SQLite database. If None, the path of the
+    configuration is used.
+
+    Returns:
+    - tuple: The entries in the shape of the vocabulary list and the ID of
+    the last entry, which is passed to mark_exported after the export.
+    """
+    targets = [target] if isinstance(target, str) else list(target)
+    with _lock:
+        connection = open_store(path)
+        after_id = None
+        for file_path in targets:
+            row = connection.execute(
+                "SELECT last_id FROM exports WHERE target = ?",
+                (os.path.abspath(file_path),)).fetchone()
+            last_id = 0 if row is None else row[0]
+            after_id = last_id if after_id is None else min(after_id,
+                                                            last_id)
+        after_id = after_id or 0
+        last_id, = connection.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM entries").fetchone()
+        return get_entries(path, after_id=after_id), last_id
+
+
+def mark_exported(target="", last_id=0, path=None):
+    """
+    Move the export watermark of a file to the last exported entry.
+
+    Args:
+    - target (str): Path of the exported Anki or Excel file.
+    - last_id (int): The ID returned by get_unexported_entries.
+    - path (str): Path of the SQLite database. If None, the path of the
+    configuration is used.
+
+    Returns:
+    - None
+    """
+    with _lock:
+        connection = open_store(path)
+        with connection:
+            connection.execute(
+                "INSERT INTO exports (target, last_id, exported_at) "
+                "VALUES (?, ?, ?) ON CONFLICT (target) DO UPDATE SET "
+                "last_id = MAX(last_id, excluded.last_id), "
+                "exported_at = excluded.exported_at",
+                (os.path.abspath(target), last_id, time.time()))
+
+
+def close_stores():
+    """
+    Close all open connections to the stores.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    with _lock:
+        for connection in _connections.values():
+            connection.close()
+        _connections.clear()
+
+
+def _parse_timestamp(timestamp):
+    # Timestamps that are not in ISO 8601 format are returned as text
+    try:
+        return datetime.datetime.fromisoformat(timestamp)
+    except ValueError:
+        return timestamp
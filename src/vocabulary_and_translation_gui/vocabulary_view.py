@@ -0,0 +1,223 @@
+"""
+The scrollable view of the vocabulary list.
+
+The view shows the entries of a word list in a table with one column for
+each language. Only the visible rows exist as items of the table: when the
+list is scrolled, the same rows are filled with other entries. Showing a new
+entry therefore takes the same time for the first and the 5,000th word.
+
+A row is edited with a double click and deleted with the Delete key or the
+buttons below the table.
+
+Classes:
+- VocabularyView
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from vocabulary_and_translation_gui.vocabulary_entry import VocabularyEntry
+from vocabulary_and_translation_gui.vocabulary_index import LANGUAGES
+
+
+class VocabularyView(tk.Frame):
+    """
+    A table that shows the visible part of a word list.
+
+    The view does not copy the word list, it shows the list it was created
+    with. Entries that are appended to the list are shown after refresh.
+
+    Attributes:
+        - entries (list): The shown word list.
+        - first (int): Index of the entry in the first visible row.
+        - rows (int): Number of visible rows.
+        - on_edit (function): Function called with the old and the new entry
+        after an entry was edited.
+        - on_delete (function): Function called with an entry after it was
+        deleted.
+
+    Methods:
+        - refresh: Show the entries of the visible rows again.
+        - scroll_to: Show the rows starting with an entry.
+        - selected_indices: Return the indices of the selected entries.
+        - edit_entry: Replace the words of an entry.
+        - delete_entries: Delete entries from the word list.
+    """
+    def __init__(self, parent=None, entries=None, rows=10, on_edit=None,
+                 on_delete=None):
+        super().__init__(parent)
+        self.entries = [] if entries is None else entries
+        self.first = 0
+        self.rows = rows
+        self.on_edit = on_edit
+        self.on_delete = on_delete
+
+        # Create the table with a fixed number of rows and the scroll bar,
+        # which is set from the position in the word list
+        self.table = ttk.Treeview(self, columns=LANGUAGES, show="headings",
+                                  height=rows, selectmode="extended")
+        for lang in LANGUAGES:
+            self.table.heading(lang, text=lang)
+            self.table.column(lang, width=160)
+        self.items = [self.table.insert("", tk.END, values=("", "", ""))
+                      for _ in range(rows)]
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL,
+                                      command=self._scroll)
+        self.table.grid(row=0, column=0, sticky=tk.NSEW)
+        self.scrollbar.grid(row=0, column=1, sticky=tk.NS)
+
+        buttons = tk.Frame(self)
+        buttons.grid(row=1, column=0, columnspan=2)
+        tk.Button(buttons, text="Edit", command=self._edit_selected).pack(
+            side=tk.LEFT, padx=5, pady=2)
+        tk.Button(buttons, text="Delete",
+                  command=self._delete_selected).pack(side=tk.LEFT, padx=5,
+                                                      pady=2)
+
+        self.table.bind("<Double-1>", lambda event: self._edit_selected())
+        self.table.bind("<Delete>", lambda event: self._delete_selected())
+        self.table.bind("<MouseWheel>", lambda event: self._scroll(
+            "scroll", -1 if event.delta > 0 else 1, "units"))
+        self.table.bind("<Button-4>", lambda event: self._scroll(
+            "scroll", -1, "units"))
+        self.table.bind("<Button-5>", lambda event: self._scroll(
+            "scroll", 1, "units"))
+
+        self.refresh()
+
+    def refresh(self, scroll_to_end=False):
+        """
+        Show the entries of the visible rows again.
+
+        Args:
+        - scroll_to_end (bool): If True, the last entries are shown.
+
+        Returns:
+        - None
+        """
+        if scroll_to_end:
+            self.first = len(self.entries) - self.rows
+        self.first = max(0, min(self.first, len(self.entries) - self.rows))
+
+        # Fill the rows with the visible entries and hide the empty rows
+        for position, item in enumerate(self.items):
+            index = self.first + position
+            if index < len(self.entries):
+                entry = self.entries[index]
+                self.table.item(item, values=(entry[0], entry[1], entry[2]))
+                self.table.move(item, "", position)
+            else:
+                self.table.detach(item)
+
+        total = max(len(self.entries), 1)
+        self.scrollbar.set(self.first / total,
+                           min(self.first + self.rows, total) / total)
+
+    def scroll_to(self, index=0):
+        """
+        Show the rows starting with an entry.
+
+        Args:
+        - index (int): Index of the entry in the first visible row.
+
+        Returns:
+        - None
+        """
+        self.table.selection_remove(self.table.selection())
+        self.first = index
+        self.refresh()
+
+    def selected_indices(self):
+        """
+        Return the indices of the selected entries.
+
+        Returns:
+        - list: The indices in the word list.
+        """
+        return [self.first + self.items.index(item)
+                for item in self.table.selection()]
+
+    def edit_entry(self, index=0, words=()):
+        """
+        Replace the words of an entry.
+
+        The time the entry was added and its source language are kept.
+
+        Args:
+        - index (int): Index of the entry in the word list.
+        - words (list): The new English, German and Turkish words.
+
+        Returns:
+        - VocabularyEntry: The new entry.
+        """
+        old_entry = VocabularyEntry.from_list(self.entries[index])
+        new_entry = VocabularyEntry(*words, timestamp=old_entry.timestamp,
+                                    source=old_entry.source)
+        self.entries[index] = new_entry
+        self.refresh()
+        if self.on_edit is not None:
+            self.on_edit(old_entry, new_entry)
+        return new_entry
+
+    def delete_entries(self, indices=()):
+        """
+        Delete entries from the word list.
+
+        Args:
+        - indices (list): Indices of the entries in the word list.
+
+        Returns:
+        - None
+        """
+        self.table.selection_remove(self.table.selection())
+        for index in sorted(set(indices), reverse=True):
+            entry = self.entries.pop(index)
+            if self.on_delete is not None:
+                self.on_delete(entry)
+        self.refresh()
+
+    def _scroll(self, action, amount, unit=None):
+        # Move the visible rows like the scroll bar of a list box
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.entries)))
+        elif unit == "pages":
+            self.scroll_to(self.first + int(amount) * self.rows)
+        else:
+            self.scroll_to(self.first + int(amount))
+
+    def _edit_selected(self):
+        # Open a window with the words of the first selected entry, the
+        # entry is kept instead of its index, because the word list can
+        # change while the window is open
+        indices = self.selected_indices()
+        if len(indices) <= 0:
+            return
+        entry = self.entries[indices[0]]
+
+        window = tk.Toplevel(self)
+        window.title("Edit entry")
+        fields = []
+        for row, lang in enumerate(LANGUAGES):
+            tk.Label(window, text=lang + ":").grid(row=row, column=0,
+                                                   sticky=tk.W, padx=5)
+            field = tk.Entry(window, width=40)
+            field.insert(0, entry[row])
+            field.grid(row=row, column=1, padx=5, pady=2)
+            fields.append(field)
+
+        def save():
+            # Look up the entry again, if it was deleted nothing is saved
+            words = [field.get().strip() for field in fields]
+            window.destroy()
+            index = next((index for index, item in enumerate(self.entries)
+                          if item is entry), None)
+            if any(words) and index is not None:
+                self.edit_entry(index, words)
+
+        tk.Button(window, text="Save", command=save).grid(
+            row=len(LANGUAGES), column=0, pady=5)
+        tk.Button(window, text="Cancel", command=window.destroy).grid(
+            row=len(LANGUAGES), column=1, pady=5)
+
+    def _delete_selected(self):
+        # Delete all selected entries
+        self.delete_entries(self.selected_indices())
@@ -4,12 +4,38 @@ Configuration for pytest.
 The function allows the user to enter a Path to the file where the DeepL
 Authentication Key is stored. This Key will be used in the test
 functions that test translation functionalities.
+
+The tests that use DeepL are marked with "deepl". By default, their
+translations are sent to DeepL with the key, without a key they are skipped.
+With --deepl-mode=record the requests are also written to the cassette in
+the test_files folder. With --deepl-mode=replay the translations of a
+recorded cassette are replayed, so the tests need neither a key nor an
+internet connection and can run in parallel.
 """
 import os
+import pytest
+from vocabulary_and_translation_gui import (
+    metrics,
+    personal_dictionary,
+    rapid_entry,
+    translation_prefetch,
+    vocabulary_index,
+    vocabulary_store
+)
+from vocabulary_and_translation_gui.deepl_cassette import (
+    record_cassette,
+    replay_cassette
+)
+from vocabulary_and_translation_gui.prepare_application import (
+    get_deepl_key
+)
+
+# Key of the replayed translations, any key that DeepL did not reject works
+REPLAY_KEY = "replayed-key"
 
 
 def pytest_addoption(parser):
-    """Get the path of the Deepl Key."""
+    """Get the path of the Deepl Key and how DeepL is used."""
     dirname = os.path.dirname(__file__)
     key_path = os.path.abspath(os.path.join(dirname, "..", "src",
                                             "vocabulary_and_translation_gui",
@@ -17,3 +43,114 @@ def pytest_addoption(parser):
                                             "deepl_key.txt")
                                )
     parser.addoption("--keypath", action="store", default=key_path)
+    parser.addoption("--deepl-mode", action="store", default="live",
+                     choices=["replay", "record", "live"])
+    parser.addoption("--cassette", action="store",
+                     default=os.path.join(dirname, "test_files",
+                                          "deepl_cassette.json"))
+    parser.addoption("--deepl-latency", action="store", default="0",
+                     help="seconds of each replayed translation, or "
+                          "\"recorded\"")
+
+
+def pytest_configure(config):
+    """Register the marker of the tests that use DeepL."""
+    config.addinivalue_line("markers", "deepl: the test translates with DeepL")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the tests that use DeepL without key or recorded cassette."""
+    if config.getoption("deepl_mode") == "replay":
+        path = config.getoption("cassette")
+        reason = "No recorded DeepL cassette found under: " + path
+    else:
+        path = config.getoption("keypath")
+        reason = "No DeepL key found under: " + path
+    if os.path.exists(path):
+        return
+    for item in items:
+        if "deepl" in item.keywords:
+            item.add_marker(pytest.mark.skip(reason=reason))
+
+
+@pytest.fixture(scope="session")
+def deepl_traffic(pytestconfig):
+    """Replay, record or send the translations of DeepL."""
+    mode = pytestconfig.getoption("deepl_mode")
+    path = pytestconfig.getoption("cassette")
+    latency = pytestconfig.getoption("deepl_latency")
+    if mode == "replay":
+        with replay_cassette(path, None if latency == "recorded"
+                             else float(latency)) as cassette:
+            yield cassette
+    elif mode == "record":
+        with record_cassette(path) as cassette:
+            yield cassette
+    else:
+        yield None
+
+
+@pytest.fixture(scope="session")
+def auth_key(pytestconfig, deepl_traffic):
+    """Get the Deepl Key, it is not needed for replayed translations."""
+    if pytestconfig.getoption("deepl_mode") == "replay":
+        return REPLAY_KEY
+    return get_deepl_key(file_path=pytestconfig.getoption("keypath"))
+
+
+@pytest.fixture(autouse=True)
+def personal_dictionaries(tmp_path, monkeypatch):
+    """Keep the personal word lists of the tests out of the user folder."""
+    monkeypatch.setattr(personal_dictionary, "PERSONAL_DICTIONARIES",
+                        tmp_path.joinpath("personal_dictionaries"))
+    personal_dictionary.clear_personal_words()
+    yield
+    personal_dictionary.clear_personal_words()
+
+
+@pytest.fixture(autouse=True)
+def vocabulary_store_path(tmp_path, monkeypatch):
+    """Keep the vocabulary store of the tests out of the user folder."""
+    monkeypatch.setattr(vocabulary_store, "VOCABULARY_STORE",
+                        tmp_path.joinpath("vocabulary.sqlite3"))
+    yield
+    vocabulary_store.close_stores()
+
+
+@pytest.fixture(autouse=True)
+def file_keys(tmp_path, monkeypatch):
+    """Keep the keys of the saved Excel files out of the user folder."""
+    monkeypatch.setattr(vocabulary_index, "FILE_KEYS",
+                        tmp_path.joinpath("file_keys"))
+
+
+@pytest.fixture(autouse=True)
+def vocabulary_index_entries():
+    """Start every test without indexed vocabularies."""
+    vocabulary_index.clear_index()
+    yield
+    vocabulary_index.clear_index()
+
+
+@pytest.fixture(autouse=True)
+def kept_translations():
+    """Start every test without kept translations."""
+    translation_prefetch.clear_translations()
+    yield
+    translation_prefetch.clear_translations()
+
+
+@pytest.fixture(autouse=True)
+def pending_entries():
+    """Start every test without words of the rapid-entry mode."""
+    rapid_entry.clear_pending_entries()
+    yield
+    rapid_entry.clear_pending_entries()
+
+
+@pytest.fixture(autouse=True)
+def recorded_metrics():
+    """Start every test without recorded metrics."""
+    metrics.clear_metrics()
+    yield
+    metrics.clear_metrics()
@@ -0,0 +1,131 @@
+import os
+import time
+from vocabulary_and_translation_gui.benchmark import (
+    compare_results,
+    generate_phrases,
+    generate_word_list,
+    offline_translator,
+    read_results,
+    run_benchmarks,
+    write_results
+)
+from vocabulary_and_translation_gui.deepl_cassette import write_cassette
+from vocabulary_and_translation_gui.translation_and_spelling import (
+    translate_string
+)
+
+
+class TestBenchmark:
+    """
+    Test cases for the "benchmark" module.
+
+    This class defines test methods to ensure the functions of the
+    "benchmark" module generate the same corpora, run offline and find
+    slower benchmarks.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_corpora: Test generating phrases and word lists.
+        - test_offline_translator: Test translating without DeepL.
+        - test_run_benchmarks: Test running and saving the benchmarks.
+        - test_compare_results: Test comparing with a baseline.
+    """
+    def test_corpora(self):
+        """
+        Test generating phrases and word lists.
+
+        The expected output is the same phrases for the same seed and
+        unique entries with four values.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        phrases = generate_phrases("de_DE", 10, 5, seed=3)
+        assert phrases == generate_phrases("de_DE", 10, 5, seed=3)
+        assert all(len(phrase.split(" ")) == 5 for phrase in phrases)
+
+        word_list = generate_word_list(1000)
+        assert len(word_list) == 1000
+        assert all(len(entry) == 4 for entry in word_list)
+        assert len({tuple(entry[:3]) for entry in word_list}) == 1000
+
+    def test_offline_translator(self, tmp_path):
+        """
+        Test translating without DeepL.
+
+        The expected output is the text followed by the target language,
+        after the recorded time of a request if a cassette is given.
+
+        Args:
+        - tmp_path (pathlib.Path): temporary directory
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        with offline_translator():
+            assert translate_string("", "Haus", "Deutsch", "English") == (
+                "Haus (EN-GB)", "DE")
+
+        path = os.path.join(tmp_path, "cassette.json")
+        write_cassette({"version": 1, "rejected_keys": [], "interactions": [
+            {"request": {"text": "Baum", "source_lang": "DE",
+                         "target_lang": "EN-GB"},
+             "response": {"text": "Tree", "detected_source_lang": "DE"},
+             "seconds": 0.05}]}, path)
+        with offline_translator(cassette=path):
+            start = time.perf_counter()
+            assert translate_string("", "Haus", "Deutsch", "English") == (
+                "Haus (EN-GB)", "DE")
+            assert time.perf_counter() - start >= 0.05
+
+    def test_run_benchmarks(self, tmp_path):
+        """
+        Test running and saving the benchmarks.
+
+        The expected output is a result for each benchmark, also after the
+        results were written and read again.
+
+        Args:
+        - tmp_path (pathlib.Path): temporary directory
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        results = run_benchmarks(sizes=[10], repeat=1, directory=tmp_path)
+        benchmarks = results["benchmarks"]
+        assert benchmarks["save_list_as_xlsx/10"]["items"] == 10
+        assert benchmarks["save_list_as_apkg/10"]["seconds"] > 0
+        assert "check_spelling/20_words_misspelled" in benchmarks
+        assert "correct_spelling_mistakes/miss" in benchmarks
+        assert "handle_add_to_list" in benchmarks
+
+        path = os.path.join(tmp_path, "results", "results.json")
+        write_results(results, path)
+        assert read_results(path) == results
+
+    def test_compare_results(self):
+        """
+        Test comparing with a baseline.
+
+        The expected output is a regression only for the benchmark that is
+        more than 20 % slower, benchmarks of one run only are ignored.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        baseline = {"benchmarks": {"a": {"seconds": 1.0},
+                                   "b": {"seconds": 1.0},
+                                   "c": {"seconds": 1.0}}}
+        results = {"benchmarks": {"a": {"seconds": 1.1},
+                                  "b": {"seconds": 1.5},
+                                  "d": {"seconds": 1.0}}}
+        comparison = compare_results(results, baseline)
+        assert [row["name"] for row in comparison] == ["a", "b"]
+        assert [row["regression"] for row in comparison] == [False, True]
+        assert comparison[1]["ratio"] == 1.5
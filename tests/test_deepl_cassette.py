@@ -0,0 +1,184 @@
+import deepl
+import json
+import os
+import pytest
+import time
+from unittest.mock import patch
+from vocabulary_and_translation_gui.deepl_cassette import (
+    read_cassette,
+    record_cassette,
+    recorded_latencies,
+    replay_cassette,
+    write_cassette
+)
+from vocabulary_and_translation_gui.translation_and_spelling import (
+    translate_string
+)
+
+
+class FakeDeepL:
+    """Translator that answers like DeepL without internet connection."""
+    def __init__(self, auth_key="", **kwargs):
+        self.auth_key = auth_key
+
+    def translate_text(self, text, *, source_lang=None, target_lang=None,
+                       **kwargs):
+        if self.auth_key == "wrong":
+            raise deepl.exceptions.AuthorizationException(
+                "Authorization failure, check auth_key")
+        if text == "offline":
+            raise deepl.exceptions.ConnectionException("Connection failed")
+        if len(text) == 0:
+            raise ValueError("text must not be empty")
+        if not target_lang:
+            raise deepl.exceptions.DeepLException("Bad request")
+        return deepl.TextResult(text.upper(), source_lang or "DE", len(text))
+
+
+@pytest.fixture()
+def cassette_path(tmp_path):
+    """Record some translations of the fake DeepL to a cassette."""
+    path = os.path.join(tmp_path, "cassettes", "deepl.json")
+    with patch.object(deepl, "Translator", FakeDeepL):
+        with record_cassette(path):
+            with patch("tkinter.messagebox.showerror", return_value=True):
+                translate_string("key", "Baum", "Deutsch", "English")
+                translate_string("key", "Tree", "", "Deutsch")
+                with pytest.raises(ValueError):
+                    translate_string("key", "", "Deutsch", "English")
+                with pytest.raises(ValueError):
+                    translate_string("key", "Tree", "English", "abc")
+                with pytest.raises(ValueError):
+                    translate_string("wrong", "Haus", "Deutsch", "English")
+                with pytest.raises(ValueError):
+                    translate_string("key", "offline", "English", "Deutsch")
+    return path
+
+
+class TestDeepLCassette:
+    """
+    Test cases for the "deepl_cassette" module.
+
+    This class defines test methods to ensure the functions of the
+    "deepl_cassette" module record the translations and replay them without
+    DeepL.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_record: Test recording translations to a cassette.
+        - test_replay: Test replaying the recorded translations.
+        - test_latency: Test the time of the replayed translations.
+        - test_unknown_version: Test reading a cassette of another version.
+    """
+    def test_record(self, cassette_path):
+        """
+        Test recording translations to a cassette.
+
+        The expected output is a cassette with the responses and errors of
+        the requests, the hash of the rejected key and no valid key. A second
+        recording keeps the requests of the first one.
+
+        Args:
+        - cassette_path (str): path of the recorded cassette
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        cassette = read_cassette(cassette_path)
+        requests = {item["request"]["text"]: item
+                    for item in cassette["interactions"]}
+        assert set(requests) == {"Baum", "Tree", ""}
+        assert requests["Baum"]["request"] == {
+            "text": "Baum", "source_lang": "DE", "target_lang": "EN-GB"}
+        assert requests["Baum"]["response"] == {
+            "text": "BAUM", "detected_source_lang": "DE"}
+        assert requests[""]["response"]["error"] == "ValueError"
+        assert len(cassette["rejected_keys"]) == 1
+        with open(cassette_path, encoding="utf-8") as f:
+            text = f.read()
+        assert '"key"' not in text and "wrong" not in text
+
+        with patch.object(deepl, "Translator", FakeDeepL):
+            with record_cassette(cassette_path):
+                translate_string("key", "Haus", "Deutsch", "Türkçe")
+        assert len(read_cassette(cassette_path)["interactions"]) == 5
+
+    def test_replay(self, cassette_path):
+        """
+        Test replaying the recorded translations.
+
+        The expected output is the recorded translation, the recorded errors
+        as ValueError of translate_string and a LookupError for a request
+        that was not recorded.
+
+        Args:
+        - cassette_path (str): path of the recorded cassette
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        with replay_cassette(cassette_path, latency=0):
+            assert translate_string("other", "Baum", "Deutsch",
+                                    "English") == ("BAUM", "DE")
+            assert translate_string("other", "Tree", "", "Deutsch") == (
+                "TREE", "DE")
+            with patch("tkinter.messagebox.showerror", return_value=True):
+                with pytest.raises(ValueError, match="No text"):
+                    translate_string("other", "", "Deutsch", "English")
+                with pytest.raises(ValueError, match="Target Language"):
+                    translate_string("other", "Tree", "English", "abc")
+                with pytest.raises(ValueError, match="authentication key"):
+                    translate_string("wrong", "Baum", "Deutsch", "English")
+            with pytest.raises(LookupError):
+                translate_string("other", "Auto", "Deutsch", "English")
+
+    def test_latency(self, tmp_path):
+        """
+        Test the time of the replayed translations.
+
+        The expected output is a translation that takes the recorded time,
+        or the given latency.
+
+        Args:
+        - tmp_path (pathlib.Path): temporary directory
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, "deepl.json")
+        write_cassette({"version": 1, "rejected_keys": [], "interactions": [
+            {"request": {"text": "Baum", "source_lang": "DE",
+                         "target_lang": "EN-GB"},
+             "response": {"text": "Tree", "detected_source_lang": "DE"},
+             "seconds": 0.1}]}, path)
+        assert recorded_latencies(path) == [0.1]
+
+        for latency, expected in ((None, 0.1), (0.2, 0.2)):
+            with replay_cassette(path, latency):
+                start = time.perf_counter()
+                translate_string("key", "Baum", "Deutsch", "English")
+                assert time.perf_counter() - start >= expected
+
+    def test_unknown_version(self, tmp_path):
+        """
+        Test reading a cassette of another version.
+
+        The expected output is a raised ValueError.
+
+        Args:
+        - tmp_path (pathlib.Path): temporary directory
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, "deepl.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": 0, "interactions": []}, f)
+        with pytest.raises(ValueError, match="Unknown version"):
+            read_cassette(path)
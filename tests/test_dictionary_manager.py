@@ -0,0 +1,298 @@
+import enchant
+import pytest
+import time
+from vocabulary_and_translation_gui import dictionary_manager
+from vocabulary_and_translation_gui.config import DICTIONARY_DEFAULT_SIZE
+from vocabulary_and_translation_gui.dictionary_manager import (
+    clear_dictionaries,
+    dictionary_lock,
+    estimate_dictionary_size,
+    evict_dictionaries,
+    get_dictionary,
+    get_resident_sizes,
+    get_suggestion_dictionary,
+    get_word_groups,
+    schedule_eviction
+)
+
+
+class FakeWindow:
+    """A window that runs its scheduled callbacks when the test asks."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        """Schedule a callback."""
+        self.callbacks.append((ms, callback))
+
+    def run(self):
+        """Run the scheduled callbacks once."""
+        callbacks, self.callbacks = self.callbacks, []
+        for _, callback in callbacks:
+            callback()
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and end every test without loaded dictionaries."""
+    clear_dictionaries()
+    yield
+    clear_dictionaries()
+
+
+class TestGetDictionary:
+    """
+    Test cases for the "get_dictionary" function.
+
+    This class defines test methods to ensure the "get_dictionary"
+    function in the "dictionary_manager" module loads dictionaries on demand
+    and releases them again.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_lazy_loading: Test that a dictionary is loaded once on first
+        use.
+        - test_memory_budget: Test that the least recently used dictionary gets
+        released if the budget is exceeded.
+        - test_unknown_dictionary: Test the "get_dictionary" function with an
+        unknown dictionary.
+        - test_dictionary_lock: Test the lock of each dictionary.
+    """
+    def test_lazy_loading(self):
+        """
+        Test that a dictionary is loaded once on first use.
+
+        The expected output is no loaded dictionary before the first call and
+        the same dictionary object for each following call.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert get_resident_sizes() == {}
+        dictionary = get_dictionary("en_GB")
+        assert list(get_resident_sizes()) == ["en_GB"]
+        assert get_dictionary("en_GB") is dictionary
+
+    def test_memory_budget(self):
+        """
+        Test that the least recently used dictionary gets released.
+
+        The expected output is that only the requested dictionary stays
+        loaded if the budget is too small for both dictionaries.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        get_dictionary("en_GB")
+        get_dictionary("de_DE", memory_budget=1)
+        assert list(get_resident_sizes()) == ["de_DE"]
+
+    def test_unknown_dictionary(self):
+        """
+        Test the "get_dictionary" function with an unknown dictionary.
+
+        The expected output is a raised DictNotFoundError and no loaded
+        dictionary.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        with pytest.raises(enchant.errors.DictNotFoundError):
+            get_dictionary("xx_XX")
+        assert get_resident_sizes() == {}
+
+    def test_dictionary_lock(self):
+        """
+        Test the lock of each dictionary.
+
+        The expected output is the same lock for the same dictionary and
+        another lock for another dictionary.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        english = get_dictionary("en_GB")
+        german = get_dictionary("de_DE")
+        assert dictionary_lock(english) is dictionary_lock(english)
+        assert dictionary_lock(english) is not dictionary_lock(german)
+
+
+class TestEvictDictionaries:
+    """
+    Test cases for the "evict_dictionaries" function.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_idle_dictionaries: Test that idle dictionaries get released.
+        - test_keep_dictionary: Test that the kept dictionary is never
+        released.
+        - test_schedule_eviction: Test releasing idle dictionaries with a
+        timer.
+        - test_word_groups: Test that the grouped words are released with
+        their dictionary.
+        - test_word_groups_in_background: Test grouping the words in a
+        background thread.
+        - test_suggestion_dictionary: Test the second dictionary for the
+        suggestions.
+    """
+    def test_idle_dictionaries(self):
+        """
+        Test that idle dictionaries get released.
+
+        The expected output is that no dictionary stays loaded.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        get_dictionary("en_GB")
+        get_dictionary("de_DE")
+        released = evict_dictionaries(idle_timeout=-1)
+        assert sorted(released) == ["de_DE", "en_GB"]
+        assert get_resident_sizes() == {}
+
+    def test_keep_dictionary(self):
+        """
+        Test that the kept dictionary is never released.
+
+        The expected output is that only the kept dictionary stays loaded.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        get_dictionary("en_GB")
+        get_dictionary("de_DE")
+        evict_dictionaries(idle_timeout=-1, memory_budget=0, keep="en_GB")
+        assert list(get_resident_sizes()) == ["en_GB"]
+
+    def test_schedule_eviction(self, monkeypatch):
+        """
+        Test releasing idle dictionaries with a timer.
+
+        The expected output is a released dictionary after the timer ran,
+        without another call of get_dictionary, and a new timer.
+
+        Args:
+        - monkeypatch (pytest.MonkeyPatch): shortens the idle timeout
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        get_dictionary("en_GB")
+        window = FakeWindow()
+        schedule_eviction(window, interval=30)
+        assert [ms for ms, _ in window.callbacks] == [30000]
+        window.run()
+        assert list(get_resident_sizes()) == ["en_GB"]
+
+        monkeypatch.setattr(dictionary_manager, "DICTIONARY_IDLE_TIMEOUT",
+                            -1)
+        window.run()
+        assert get_resident_sizes() == {}
+        assert len(window.callbacks) == 1
+
+    def test_word_groups(self):
+        """
+        Test that the grouped words are released with their dictionary.
+
+        The expected output is the same groups while the dictionary is
+        loaded and new groups after it was released.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        get_dictionary("en_GB")
+        groups = get_word_groups("en_GB")
+        assert "house" in groups["h"]
+        assert get_word_groups("en_GB") is groups
+        evict_dictionaries(idle_timeout=-1)
+        assert get_word_groups("en_GB") is not groups
+        assert get_word_groups("tr_TR") == {}
+
+    def test_word_groups_in_background(self):
+        """
+        Test grouping the words in a background thread.
+
+        The expected output is an empty dictionary at once and the groups
+        once the background thread is done.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        get_dictionary("en_GB")
+        assert get_word_groups("en_GB", wait=False) == {}
+        for _ in range(500):
+            groups = get_word_groups("en_GB", wait=False)
+            if groups:
+                break
+            time.sleep(0.01)
+        assert "house" in groups["h"]
+
+    def test_suggestion_dictionary(self):
+        """
+        Test the second dictionary for the suggestions.
+
+        The expected output is another dictionary than the one of the
+        spelling check, which is kept and released with it.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        dictionary = get_dictionary("en_GB")
+        suggestion_dictionary = get_suggestion_dictionary("en_GB")
+        assert suggestion_dictionary is not dictionary
+        assert get_suggestion_dictionary("en_GB") is suggestion_dictionary
+        assert get_resident_sizes()["en_GB"] == 2 * estimate_dictionary_size(
+            "en_GB")
+        evict_dictionaries(idle_timeout=-1)
+        assert get_suggestion_dictionary("en_GB") is not suggestion_dictionary
+
+
+class TestEstimateDictionarySize:
+    """
+    Test cases for the "estimate_dictionary_size" function.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_sizes: Test the estimated size of known and unknown
+        dictionaries.
+    """
+    @pytest.mark.parametrize("dictionary_language, is_known", [
+        ("en_GB", True),
+        ("de_DE", True),
+        ("xx_XX", False),
+    ])
+    def test_sizes(self, dictionary_language, is_known):
+        """
+        Test the estimated size of known and unknown dictionaries.
+
+        The expected output is the size of the files for shipped dictionaries
+        and the default size for all other ones.
+
+        Args:
+        - dictionary_language (str): the abbreviation of the dictionary
+        - is_known (bool): if the dictionary is shipped with the application
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        size = estimate_dictionary_size(dictionary_language)
+        assert (size != DICTIONARY_DEFAULT_SIZE) is is_known
+        assert size > 0
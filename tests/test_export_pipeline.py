@@ -0,0 +1,142 @@
+import datetime
+import os
+import pandas as pd
+import pytest
+from vocabulary_and_translation_gui import save_list, vocabulary_index
+from vocabulary_and_translation_gui.export_pipeline import (
+    describe_export_report,
+    export_all
+)
+from vocabulary_and_translation_gui.metrics import get_metrics
+
+
+class TestExportAll:
+    """
+    Test cases for the "export_all" function.
+
+    This class defines test methods to ensure the "export_all" function in
+    the "export_pipeline" module saves a word list to several files in one
+    pass.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_export_all: Test saving to all formats at once.
+        - test_prepared_once: Test that the writers get the prepared word
+        list.
+        - test_failed_file: Test the report of a file that can't be saved.
+        - test_wrong_list: Test word lists that can't be saved.
+    """
+    word_list = [['apple', 'Apfel', 'elma', datetime.datetime(2023, 3, 1)],
+                 ['apple', 'Apfel', 'elma', datetime.datetime(2023, 3, 2)],
+                 ['book', 'Buch', 'kitap', datetime.datetime(2023, 3, 3)]]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_export_all(self, tmp_path, max_workers):
+        """
+        Test saving to all formats at once.
+
+        The expected output is each distinct word once in every file, and
+        one "saving" and one "saved" event for each file, in a thread and in
+        parallel processes.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the files
+        - max_workers (int): the number of files written at the same time
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        paths = [os.path.join(tmp_path, 'test' + extension) for extension
+                 in ['.apkg', '.xlsx', '.csv', '.parquet', '.feather']]
+        events = []
+        report = export_all(self.word_list, paths + paths[:1],
+                            on_event=events.append, max_workers=max_workers)
+
+        assert report["saved"] == {path: 2 for path in paths}
+        assert report["failed"] == {}
+        assert sorted(event["state"] for event in events) == (
+            ["saved"] * 5 + ["saving"] * 5)
+        assert list(pd.read_excel(paths[1])['English']) == ['apple', 'book']
+        assert list(pd.read_parquet(paths[3])['English']) == ['apple',
+                                                               'book']
+        assert describe_export_report(report).count("2 new word(s)") == 5
+
+    def test_prepared_once(self, tmp_path, monkeypatch):
+        """
+        Test that the writers get the prepared word list.
+
+        The expected output is no key built by the writers and the metrics
+        of each writer, which run in threads of this process.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the files
+        - monkeypatch (pytest.MonkeyPatch): counts the built keys
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        calls = []
+        entry_keys = vocabulary_index.entry_keys
+
+        def counted_keys(word_list=[]):
+            calls.append(len(word_list))
+            return entry_keys(word_list)
+
+        monkeypatch.setattr(save_list, "entry_keys", counted_keys)
+        monkeypatch.setattr(vocabulary_index, "entry_keys", counted_keys)
+        paths = [os.path.join(tmp_path, 'test' + extension) for extension
+                 in ['.xlsx', '.csv', '.parquet']]
+        report = export_all(self.word_list, paths, max_workers=3)
+
+        assert report["saved"] == {path: 2 for path in paths}
+        assert calls == []
+        assert sorted(value["labels"]["format"] for value
+                      in get_metrics()["histograms"]["save_seconds"]) == [
+            "csv", "table", "xlsx"]
+
+    def test_failed_file(self, tmp_path):
+        """
+        Test the report of a file that can't be saved.
+
+        The expected output is the error of the unsupported file and the
+        other file saved.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the files
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        paths = [os.path.join(tmp_path, 'test.csv'),
+                 os.path.join(tmp_path, 'test.txt')]
+        report = export_all(self.word_list, paths)
+        assert report["saved"] == {paths[0]: 2}
+        assert "Unsupported file type" in report["failed"][paths[1]]
+
+    @pytest.mark.parametrize("word_list", [
+        ([]),
+        ([['apple', 'Apfel', datetime.datetime.now()]]),
+    ])
+    def test_wrong_list(self, tmp_path, word_list):
+        """
+        Test word lists that can't be saved.
+
+        The expected output is a ValueError and no file.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the files
+        - word_list (list): the input list
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'test.csv')
+        with pytest.raises(ValueError):
+            export_all(word_list, [path])
+        assert not os.path.exists(path)
@@ -0,0 +1,48 @@
+import datetime
+import os
+import pandas as pd
+from vocabulary_and_translation_gui.export_vocabulary import main
+from vocabulary_and_translation_gui.vocabulary_store import add_entry
+
+
+class TestMain:
+    """
+    Test cases for the "main" function.
+
+    This class defines test methods to ensure the "main" function in the
+    "export_vocabulary" module exports the vocabulary store without a window.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_export: Test exporting the store to several formats.
+    """
+    def test_export(self, tmp_path, capsys):
+        """
+        Test exporting the store to several formats.
+
+        The expected output are the files with the words of the store and no
+        new words on the second export.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the files
+        - capsys (pytest.CaptureFixture): the fixture to read the output
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        store_path = os.path.join(tmp_path, "vocabulary.sqlite3")
+        paths = [os.path.join(tmp_path, name) for name
+                 in ["test.parquet", "test.csv", "test.apkg"]]
+        add_entry(["house", "Haus", "ev", datetime.datetime(2023, 3, 1)],
+                  store_path)
+
+        main(paths + ["--store", store_path])
+        assert capsys.readouterr().out.count("1 new word(s)") == 3
+        main(paths + ["--store", store_path])
+        assert capsys.readouterr().out.count("0 new word(s)") == 3
+
+        df = pd.read_parquet(paths[0])
+        assert list(df['English']) == ['house']
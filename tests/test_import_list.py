@@ -0,0 +1,153 @@
+import datetime
+import os
+import pandas as pd
+import pytest
+from vocabulary_and_translation_gui.import_list import (
+    import_list,
+    read_entries
+)
+from vocabulary_and_translation_gui.save_list import (
+    write_apkg_stream,
+    write_xlsx_stream
+)
+from vocabulary_and_translation_gui.vocabulary_entry import VocabularyEntry
+from vocabulary_and_translation_gui.vocabulary_index import find_entry
+from vocabulary_and_translation_gui.vocabulary_store import (
+    add_entry,
+    get_entries
+)
+
+# Entries of the vocabulary list with real timestamps
+HOUSE = ["house", "Haus", "ev", datetime.datetime(2023, 3, 1)]
+BOOK = ["book", "Buch", "kitap", datetime.datetime(2023, 3, 2, 10, 30)]
+
+
+class TestReadEntries:
+    """
+    Test cases for the "read_entries" function.
+
+    This class defines test methods to ensure the "read_entries" function in
+    the "import_list" module reads the saved vocabulary lists.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_read_xlsx: Test reading Excel files of both writers.
+        - test_read_apkg: Test reading the notes of an Anki file.
+        - test_wrong_file: Test that other files are rejected.
+    """
+    def test_read_xlsx(self, tmp_path):
+        """
+        Test reading Excel files of both writers.
+
+        The expected output is the entries with normalized white space and
+        their timestamps, for text and date cells.
+
+        Args:
+        - tmp_path (pathlib.Path): temporary directory
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, "stream.xlsx")
+        write_xlsx_stream([HOUSE, [" the  book ", "Buch", "kitap", BOOK[3]]],
+                          path)
+        entries = list(read_entries(path))
+        assert all(isinstance(entry, VocabularyEntry) for entry in entries)
+        assert entries == [HOUSE, ["the book", "Buch", "kitap", BOOK[3]]]
+
+        path = os.path.join(tmp_path, "pandas.xlsx")
+        pd.DataFrame([BOOK], columns=["English", "Deutsch", "Türkçe",
+                                      "Timestamp"]).to_excel(
+            path, sheet_name="Vocabulary", index=False)
+        assert list(read_entries(path)) == [BOOK]
+
+    def test_read_apkg(self, tmp_path):
+        """
+        Test reading the notes of an Anki file.
+
+        The expected output is the words of each note.
+
+        Args:
+        - tmp_path (pathlib.Path): temporary directory
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, "list.apkg")
+        write_apkg_stream([HOUSE, BOOK], path)
+        entries = list(read_entries(path))
+        assert [entry[:3] for entry in entries] == [HOUSE[:3], BOOK[:3]]
+
+    def test_wrong_file(self, tmp_path):
+        """
+        Test that other files are rejected.
+
+        The expected output is a ValueError for another file type and for an
+        Excel file without vocabulary list.
+
+        Args:
+        - tmp_path (pathlib.Path): temporary directory
+
+        Raises:
+        - AssertionError: if no ValueError is raised
+        """
+        with pytest.raises(ValueError):
+            read_entries(os.path.join(tmp_path, "list.txt"))
+
+        path = os.path.join(tmp_path, "other.xlsx")
+        pd.DataFrame({"Word": ["Haus"]}).to_excel(path, index=False)
+        with pytest.raises(ValueError):
+            list(read_entries(path))
+
+
+class TestImportList:
+    """
+    Test cases for the "import_list" function.
+
+    This class defines test methods to ensure the "import_list" function in
+    the "import_list" module adds only new words to the list, the index and
+    the store.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_import_list: Test importing new and known words.
+    """
+    @pytest.mark.parametrize("extension", [".xlsx", ".apkg"])
+    def test_import_list(self, tmp_path, extension):
+        """
+        Test importing new and known words.
+
+        The expected output is only the new words in the vocabulary list,
+        the index and the store, also if the file is imported twice.
+
+        Args:
+        - tmp_path (pathlib.Path): temporary directory
+        - extension (str): the type of the imported file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, "list" + extension)
+        if extension == ".xlsx":
+            write_xlsx_stream([HOUSE, BOOK, ["Book", "buch", "kitap",
+                                             BOOK[3]]], path)
+        else:
+            write_apkg_stream([HOUSE, BOOK], path)
+
+        add_entry(HOUSE)
+        word_list = []
+        assert import_list(path, word_list) == 1
+        assert [entry[:3] for entry in word_list] == [BOOK[:3]]
+        assert find_entry("Buch", "Deutsch") is word_list[0]
+        assert [entry[:3] for entry in get_entries()] == [HOUSE[:3],
+                                                          BOOK[:3]]
+
+        assert import_list(path, word_list) == 0
+        assert len(word_list) == 1
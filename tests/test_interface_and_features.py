@@ -1,5 +1,6 @@
 import datetime
 import os
+import pandas as pd
 import pytest
 import tkinter as tk
 from vocabulary_and_translation_gui.interface_and_features import (
@@ -8,19 +9,15 @@ from vocabulary_and_translation_gui.interface_and_features import (
     handle_translate,
     vocabulary_interface
 )
-from vocabulary_and_translation_gui.prepare_application import (
-    get_deepl_key
+from vocabulary_and_translation_gui.vocabulary_index import index_entries
+from vocabulary_and_translation_gui.vocabulary_store import (
+    add_entry,
+    close_stores
 )
+from vocabulary_and_translation_gui.vocabulary_view import VocabularyView
 from unittest.mock import patch
 
 
-@pytest.fixture(scope="session")
-def auth_key(pytestconfig):
-    """Get the path of the Deepl Key."""
-    path = pytestconfig.getoption("keypath")
-    return get_deepl_key(file_path=path)
-
-
 class TestHandleAddToList:
     """
     Test cases for the "handle_add_to_list" function.
@@ -37,7 +34,10 @@ class TestHandleAddToList:
         inputs.
         - test_invalid_inputs: Test the "handle_add_to_list" function with
         invalid inputs.
+        - test_known_word: Test the "handle_add_to_list" function with a word
+        that is already in the vocabulary list.
     """
+    @pytest.mark.deepl
     @pytest.mark.parametrize(("in_text, src_lang, expected, expected_len,"
                               + "trans_list"), [
         ("der Baum ist groß", "Deutsch", "the tree is big", 1, []),
@@ -70,13 +70,15 @@ class TestHandleAddToList:
         output = handle_add_to_list(key=auth_key, in_text=in_text,
                                     src_lang=src_lang, enter_field=tk.Entry(),
                                     translation_field=tk.Label(),
-                                    trans_list_field=tk.Label(),
+                                    trans_list_field=VocabularyView(
+                                        entries=trans_list),
                                     trans_list=trans_list)
         assert len(output) == expected_len
         for word_list in output:
             assert len(word_list) == 4
         assert output[expected_len-1][0] == expected
 
+    @pytest.mark.deepl
     @pytest.mark.parametrize(("in_text, src_lang, enter_field,"
                               + "translation_field, trans_list"), [
         (123, "Deutsch", tk.Entry(), tk.Label(), []),
@@ -109,10 +111,37 @@ class TestHandleAddToList:
                                       src_lang=src_lang,
                                       enter_field=enter_field,
                                       translation_field=translation_field,
-                                      trans_list_field=tk.Label(),
+                                      trans_list_field=VocabularyView(),
                                       trans_list=trans_list) is None
 
 
+    def test_known_word(self):
+        """
+        Test the "handle_add_to_list" function with a known word.
+
+        The expected output is the unchanged trans_list without translating
+        the word again.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        trans_list = [["house", "Haus", "ev", "2023-03-01"]]
+        index_entries(trans_list)
+        translation_field = tk.Label()
+        with patch("vocabulary_and_translation_gui.interface_and_features."
+                   "translate_cached") as translate:
+            output = handle_add_to_list(key="", in_text=" haus",
+                                        src_lang="Deutsch",
+                                        enter_field=tk.Entry(),
+                                        translation_field=translation_field,
+                                        trans_list_field=VocabularyView(),
+                                        trans_list=trans_list, check=False)
+            translate.assert_not_called()
+        assert output == [["house", "Haus", "ev", "2023-03-01"]]
+        assert "already" in translation_field.cget("text")
+
+
 class TestHandleSave:
     """
     Test cases for the "handle_save" function.
@@ -131,6 +160,8 @@ class TestHandleSave:
         selected.
         - test_save_file: Test the "handle_save" function to the safe the list
         as file.
+        - test_save_from_store: Test that only new entries of the vocabulary
+        store are saved.
     """
     def test_empty_list(self):
         """
@@ -205,6 +236,41 @@ class TestHandleSave:
                                                    'test.apkg')) is True
 
 
+    def test_save_from_store(self, tmp_path):
+        """
+        Test that only new entries of the vocabulary store are saved.
+
+        The expected output is a file with each entry once after saving
+        twice, and an info message if no entry is new.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        store_path = os.path.join(tmp_path, 'vocabulary.sqlite3')
+        path = os.path.join(tmp_path, 'test.xlsx')
+        try:
+            add_entry(['house', 'Haus', 'ev', '2023-03-01'], store_path)
+            with patch("tkinter.messagebox.showinfo",
+                       return_value=True) as info:
+                with patch("tkinter.filedialog.asksaveasfilename",
+                           return_value=path):
+                    handle_save([], use_store=True, store_path=store_path)
+                    handle_save([], use_store=True, store_path=store_path)
+                    assert info.call_args.kwargs["title"] == "Nothing to save"
+                    add_entry(['book', 'Buch', 'kitap', '2023-03-02'],
+                              store_path)
+                    handle_save([], use_store=True, store_path=store_path)
+        finally:
+            close_stores()
+
+        df = pd.read_excel(path, sheet_name='Vocabulary')
+        assert list(df['English']) == ['house', 'book']
+
+
 class TestHandleTranslate:
     """
     Test cases for the "handle_translate" function.
@@ -226,6 +292,7 @@ class TestHandleTranslate:
         - test_wrong_text: Test the "handle_translate" function with incorrect
         written text.
     """
+    @pytest.mark.deepl
     @pytest.mark.parametrize("in_text, src_lang, tgt_lang, expected", [
         ("Baum", "Deutsch", "English", "Source language: DE\nEnglish: Tree"),
         ("Fernseher", "Deutsch", "Türkçe",
@@ -262,6 +329,7 @@ class TestHandleTranslate:
                          translation_field=translation_field)
         assert translation_field.cget("text") == expected
 
+    @pytest.mark.deepl
     @pytest.mark.parametrize("in_text, src_lang, tgt_lang, entry_filed", [
         ("Baum", "Deutsch", "abc", tk.Entry()),
         ("Fernseher", "Deutsch", "TR", "abc"),
@@ -291,6 +359,7 @@ class TestHandleTranslate:
                              translation_field=translation_field)
             assert translation_field.cget("text") == ""
 
+    @pytest.mark.deepl
     def test_empty_text(self, auth_key):
         """
         Test the "handle_translate" function with an empty text.
@@ -312,6 +381,7 @@ class TestHandleTranslate:
             assert translation_field.cget("text") == ("No word entered. Please"
                                                       + " try again.")
 
+    @pytest.mark.deepl
     @pytest.mark.parametrize(("in_text, src_lang, tgt_lang, expected_trans,"
                               + "expected_entry"), [
         ("thiz is a test", "English", "Türkçe",
@@ -352,7 +422,8 @@ class TestHandleTranslate:
                              translation_field=translation_field)
             assert translation_field.cget("text") == expected_trans
             assert enter_field.get() == expected_entry
-        with patch("tkinter.messagebox.askyesnocancel", return_value=False):
+        with patch("tkinter.messagebox.askyesnocancel", return_value=False), \
+                patch("tkinter.messagebox.askyesno", return_value=False):
             translation_field = tk.Label()
             enter_field = tk.Entry()
             handle_translate(key=auth_key, in_text=in_text, src_lang=src_lang,
@@ -0,0 +1,186 @@
+import os
+import pytest
+import time
+from vocabulary_and_translation_gui.latency_monitor import (
+    LAG,
+    clear_measurements,
+    describe_latency,
+    get_percentiles,
+    instrument,
+    measure,
+    record_duration,
+    start_monitor,
+    stop_monitor
+)
+from vocabulary_and_translation_gui.translation_and_spelling import (
+    find_spelling_mistakes
+)
+
+
+class FakeWindow:
+    """
+    A window that runs the scheduled callbacks when the test asks for it.
+
+    Attributes:
+        - callbacks (list): The scheduled callbacks.
+
+    Methods:
+        - after: Schedule a callback.
+        - after_cancel: Cancel a scheduled callback.
+        - run: Run the scheduled callbacks once.
+    """
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, callback):
+        self.callbacks.append(callback)
+        return len(self.callbacks)
+
+    def after_cancel(self, after_id):
+        self.callbacks.clear()
+
+    def run(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+@pytest.fixture()
+def window(tmp_path):
+    """Start a monitor for a fake window and stop it after the test."""
+    clear_measurements()
+    window = FakeWindow()
+    window.log_path = os.path.join(tmp_path, "logs", "latency.log")
+    start_monitor(window, interval=10, stall_threshold=0.1,
+                  log_path=window.log_path)
+    yield window
+    stop_monitor()
+    clear_measurements()
+
+
+def freeze_event_loop():
+    """Block the thread like a slow callback."""
+    time.sleep(0.4)
+
+
+class TestLatencyMonitor:
+    """
+    Test cases for the "latency_monitor" module.
+
+    This class defines test methods to ensure the functions of the
+    "latency_monitor" module time callbacks and find stalls.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_not_started: Test that nothing is measured without monitor.
+        - test_percentiles: Test the percentiles of the durations.
+        - test_instrument: Test timing callbacks and their phases.
+        - test_spell_check: Test timing the spelling check outside of the
+        callbacks.
+        - test_stall: Test logging the stack of a blocked event loop.
+    """
+    def test_not_started(self):
+        """
+        Test that nothing is measured without monitor.
+
+        The expected output is the unchanged callback and no durations.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        clear_measurements()
+        assert instrument("Translate", print) is print
+        with measure("translation"):
+            pass
+        assert get_percentiles("translation") is None
+
+    def test_percentiles(self):
+        """
+        Test the percentiles of the durations.
+
+        The expected output is the median and the 95th percentile of 100
+        durations.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        clear_measurements()
+        for ms in range(1, 101):
+            record_duration("translation", ms / 1000)
+        assert get_percentiles("translation") == (0.05, 0.095)
+        assert describe_latency() == "translation p50 50 ms, p95 95 ms"
+        clear_measurements()
+
+    def test_instrument(self, window):
+        """
+        Test timing callbacks and their phases.
+
+        The expected output is one duration for the callback and its phase
+        and the event loop lag of the heartbeat.
+
+        Args:
+        - window (FakeWindow): the monitored window
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        def translate():
+            with measure("translation"):
+                time.sleep(0.02)
+            return "house"
+
+        assert instrument("Translate", translate)() == "house"
+        assert get_percentiles("Translate")[0] >= 0.02
+        assert get_percentiles("translation")[0] >= 0.02
+
+        window.run()
+        assert get_percentiles(LAG) is not None
+        assert describe_latency().startswith(LAG)
+
+    def test_spell_check(self, window):
+        """
+        Test timing the spelling check outside of the callbacks.
+
+        The expected output is a duration of the spell-check phase for a
+        check in the background, which finds the mistakes.
+
+        Args:
+        - window (FakeWindow): the monitored window
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        mistakes = find_spelling_mistakes("the houze is smalll", "English")
+        assert [mistake["word"] for mistake in mistakes] == ["houze",
+                                                             "smalll"]
+        assert get_percentiles("spell-check")[0] > 0
+
+    def test_stall(self, window):
+        """
+        Test logging the stack of a blocked event loop.
+
+        The expected output is a log entry with the function that blocked
+        the event loop.
+
+        Args:
+        - window (FakeWindow): the monitored window
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        freeze_event_loop()
+        window.run()
+        time.sleep(0.2)
+        stop_monitor()
+        assert get_percentiles(LAG)[1] >= 0.3
+        with open(window.log_path, encoding="utf-8") as f:
+            log = f.read()
+        assert "Event loop blocked" in log
+        assert "freeze_event_loop" in log
@@ -0,0 +1,235 @@
+import json
+import os
+import pytest
+from vocabulary_and_translation_gui.benchmark import offline_translator
+from vocabulary_and_translation_gui.dictionary_manager import (
+    clear_dictionaries,
+    get_dictionary
+)
+from vocabulary_and_translation_gui.metrics import (
+    format_prometheus,
+    get_metrics,
+    increment,
+    measure_time,
+    observe,
+    timed,
+    write_metrics
+)
+from vocabulary_and_translation_gui.save_list import export_file
+from vocabulary_and_translation_gui.translation_and_spelling import (
+    find_spelling_mistakes,
+    translate_string
+)
+from vocabulary_and_translation_gui.translation_prefetch import (
+    request_translation,
+    translate_cached
+)
+
+
+def counter(name, **labels):
+    """Return the value of a counter with the labels, or 0."""
+    for value in get_metrics()["counters"].get(name, []):
+        if value["labels"] == labels:
+            return value["value"]
+    return 0
+
+
+class TestMetrics:
+    """
+    Test cases for the "metrics" module.
+
+    This class defines test methods to ensure the functions of the "metrics"
+    module count and export the metrics.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_counters_and_histograms: Test recording metrics.
+        - test_errors: Test counting the errors of a measured block.
+        - test_export: Test writing the Prometheus and the JSON file.
+    """
+    def test_counters_and_histograms(self):
+        """
+        Test recording metrics.
+
+        The expected output is the sum of the counters for each label and
+        cumulative buckets of the histogram.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        increment("deepl_requests_total", labels={"target": "DE"})
+        increment("deepl_requests_total", 2, {"target": "DE"})
+        increment("deepl_requests_total", labels={"target": "TR"})
+        assert counter("deepl_requests_total", target="DE") == 3
+        assert counter("deepl_requests_total", target="TR") == 1
+
+        observe("save_seconds", 0.02)
+        observe("save_seconds", 0.3)
+        observe("save_seconds", 100)
+        histogram = get_metrics()["histograms"]["save_seconds"][0]
+        assert histogram["count"] == 3
+        assert histogram["buckets"]["0.025"] == 1
+        assert histogram["buckets"]["0.5"] == 2
+        assert histogram["buckets"]["60.0"] == 2
+        assert histogram["buckets"]["+Inf"] == 3
+
+    def test_errors(self):
+        """
+        Test counting the errors of a measured block.
+
+        The expected output is the error, its count and the duration.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        @timed("save_seconds", {"format": "xlsx"}, count="saved_words_total")
+        def save(count):
+            if count < 0:
+                raise PermissionError("The file is being used")
+            return count
+
+        assert save(3) == 3
+        with pytest.raises(PermissionError):
+            save(-1)
+        with pytest.raises(ValueError):
+            with measure_time("deepl_request_seconds"):
+                raise ValueError("Quota exceeded")
+
+        assert counter("saved_words_total", format="xlsx") == 3
+        assert counter("errors_total", operation="save_seconds",
+                       type="PermissionError") == 1
+        assert counter("errors_total", operation="deepl_request_seconds",
+                       type="ValueError") == 1
+        histogram = get_metrics()["histograms"]["save_seconds"][0]
+        assert histogram["labels"] == {"format": "xlsx"}
+        assert histogram["count"] == 2
+
+    def test_export(self, tmp_path):
+        """
+        Test writing the Prometheus and the JSON file.
+
+        The expected output is a line for each value in the Prometheus file
+        and the same values in the JSON file.
+
+        Args:
+        - tmp_path (pathlib.Path): the metrics folder
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        increment("deepl_characters_total", 4, {"source": "DE",
+                                                "target": "EN-GB"})
+        observe("save_seconds", 0.3, {"format": "apkg"})
+        text = format_prometheus()
+        assert "# TYPE deepl_characters_total counter" in text
+        assert ('deepl_characters_total{source="DE",target="EN-GB"} 4'
+                in text.splitlines())
+        assert 'save_seconds_bucket{format="apkg",le="0.25"} 0' in text
+        assert 'save_seconds_bucket{format="apkg",le="+Inf"} 1' in text
+        assert 'save_seconds_count{format="apkg"} 1' in text
+
+        directory = os.path.join(tmp_path, "metrics")
+        write_metrics(directory)
+        with open(os.path.join(directory, "metrics.prom"),
+                  encoding="utf-8") as f:
+            assert f.read() == text
+        with open(os.path.join(directory, "metrics.json"),
+                  encoding="utf-8") as f:
+            snapshot = json.load(f)
+        assert snapshot["counters"] == get_metrics()["counters"]
+        assert sorted(os.listdir(directory)) == ["metrics.json",
+                                                 "metrics.prom"]
+
+
+class TestInstrumentation:
+    """
+    Test cases for the metrics of the translations, the spelling checks and
+    the savers.
+
+    This class defines test methods to ensure the instrumented functions
+    record their metrics.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_translations: Test counting requests, characters and cache
+        lookups.
+        - test_spelling: Test counting checked words and dictionary loads.
+        - test_savers: Test counting saved words.
+    """
+    def test_translations(self):
+        """
+        Test counting requests, characters and cache lookups.
+
+        The expected output is one request for each new translation and a
+        cache hit for a kept translation.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        with offline_translator():
+            translate_string("", "Haus", "Deutsch", "English")
+            translate_cached("", "Baum", "Deutsch", "Türkçe")
+            translate_cached("", "Baum", "Deutsch", "Türkçe")
+            request_translation("", "Buch", "English", "Deutsch")
+
+        assert counter("deepl_requests_total", source="DE", target="EN-GB",
+                       kind="translate") == 1
+        assert counter("deepl_characters_total", source="DE", target="TR",
+                       kind="translate") == 4
+        assert counter("deepl_requests_total", source="EN", target="DE",
+                       kind="background") == 1
+        assert counter("translation_cache_total", result="miss") == 2
+        assert counter("translation_cache_total", result="hit") == 1
+        latencies = get_metrics()["histograms"]["deepl_request_seconds"]
+        assert sum(value["count"] for value in latencies) == 3
+
+    def test_spelling(self):
+        """
+        Test counting checked words and dictionary loads.
+
+        The expected output is four checked words and one loaded dictionary.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        clear_dictionaries()
+        get_dictionary("de_DE")
+        get_dictionary("de_DE")
+        assert counter("dictionary_loads_total", language="de_DE") == 1
+
+        find_spelling_mistakes("Das Haus ist klein.", "Deutsch")
+        assert (counter("spell_check_words_total", language="Deutsch",
+                        result="correct")
+                + counter("spell_check_words_total", language="Deutsch",
+                          result="misspelled")) == 4
+        assert "spell_check_seconds" in get_metrics()["histograms"]
+
+    def test_savers(self, tmp_path):
+        """
+        Test counting saved words.
+
+        The expected output is the number of new words for each format.
+
+        Args:
+        - tmp_path (pathlib.Path): the folder of the files
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        word_list = [["house", "Haus", "ev", "2023-03-01"],
+                     ["book", "Buch", "kitap", "2023-03-02"]]
+        export_file(word_list, os.path.join(tmp_path, "list.csv"))
+        export_file(word_list, os.path.join(tmp_path, "list.csv"))
+        export_file(word_list, os.path.join(tmp_path, "list.apkg"))
+        assert counter("saved_words_total", format="csv") == 2
+        assert counter("saved_words_total", format="apkg") == 2
@@ -0,0 +1,80 @@
+import os
+from vocabulary_and_translation_gui.personal_dictionary import (
+    add_personal_word,
+    clear_personal_words,
+    get_personal_words,
+    is_personal_word
+)
+
+
+class TestAddPersonalWord:
+    """
+    Test cases for the "add_personal_word" function.
+
+    This class defines test methods to ensure the "add_personal_word"
+    function in the "personal_dictionary" module stores words in memory and
+    on disk.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_add_word: Test adding a new word.
+        - test_invalid_words: Test adding empty and duplicated words.
+        - test_reload_words: Test that added words are loaded from the file.
+    """
+    def test_add_word(self, tmp_path):
+        """
+        Test adding a new word.
+
+        The expected output is the word in the set and in the word list file.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the word lists
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert add_personal_word("pytask", "en_GB", tmp_path) is True
+        assert is_personal_word("pytask", "en_GB", tmp_path) is True
+        assert is_personal_word("pytask", "de_DE", tmp_path) is False
+        with open(os.path.join(tmp_path, "en_GB.txt"), encoding="utf-8") as f:
+            assert f.read() == "pytask\n"
+
+    def test_invalid_words(self, tmp_path):
+        """
+        Test adding empty and duplicated words.
+
+        The expected output is False and a word list with a single word.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the word lists
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert add_personal_word(" ", "en_GB", tmp_path) is False
+        assert add_personal_word("Bonn", "", tmp_path) is False
+        assert add_personal_word("Bonn", "en_GB", tmp_path) is True
+        assert add_personal_word("Bonn", "en_GB", tmp_path) is False
+        assert get_personal_words("en_GB", tmp_path) == {"Bonn"}
+
+    def test_reload_words(self, tmp_path):
+        """
+        Test that added words are loaded from the file.
+
+        The expected output is the word in the set after the loaded words
+        were cleared.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the word lists
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        add_personal_word("Yılmaz", "tr_TR", tmp_path)
+        clear_personal_words()
+        assert get_personal_words("tr_TR", tmp_path) == {"Yılmaz"}
@@ -0,0 +1,181 @@
+import os
+import pstats
+import pytest
+import tracemalloc
+from vocabulary_and_translation_gui import profiling
+from vocabulary_and_translation_gui.profiling import (
+    profile_call,
+    profiled,
+    rotate_diagnostics
+)
+
+
+def build_words(count):
+    """Allocate a list of words."""
+    return [f"word {i}" for i in range(count)]
+
+
+def fail():
+    """Raise an error like a failing save."""
+    raise PermissionError("The file is being used")
+
+
+def list_files(directory, extension):
+    """Return the names of the files with an extension."""
+    return sorted(name for name in os.listdir(directory)
+                  if name.endswith(extension))
+
+
+class TestProfiling:
+    """
+    Test cases for the "profiling" module.
+
+    This class defines test methods to ensure the functions of the
+    "profiling" module write a profile and a report for each call and keep
+    only the last ones.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_not_configured: Test that the functions stay unchanged.
+        - test_profile_call: Test writing the profile and the report.
+        - test_error: Test writing the files of a failed call.
+        - test_without_reset_peak: Test profiling without
+        tracemalloc.reset_peak like on Python 3.8.
+        - test_profiled: Test profiling the calls of a decorated function.
+        - test_rotation: Test keeping the files of the last calls.
+    """
+    def test_not_configured(self, monkeypatch):
+        """
+        Test that the functions stay unchanged.
+
+        The expected output is the function itself.
+
+        Args:
+        - monkeypatch (pytest.MonkeyPatch): switches profiling off
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        monkeypatch.setattr(profiling, "PROFILING", False)
+        assert profiled(build_words) is build_words
+
+    def test_profile_call(self, tmp_path):
+        """
+        Test writing the profile and the report.
+
+        The expected output is the return value of the function, a profile
+        with the function and a report with its allocations.
+
+        Args:
+        - tmp_path (pathlib.Path): the diagnostics folder
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        words = profile_call(build_words, (10000,), directory=tmp_path)
+        assert len(words) == 10000
+
+        profiles = list_files(tmp_path, ".prof")
+        assert len(profiles) == 1
+        assert profiles[0].endswith("_build_words.prof")
+        stats = pstats.Stats(os.path.join(tmp_path, profiles[0]))
+        assert any(function[2] == "build_words" for function in stats.stats)
+
+        with open(os.path.join(tmp_path, profiles[0][:-5] + ".txt"),
+                  encoding="utf-8") as f:
+            report = f.read()
+        assert report.startswith("build_words: ")
+        assert "test_profiling.py" in report.split("functions by")[0]
+
+    def test_error(self, tmp_path):
+        """
+        Test writing the files of a failed call.
+
+        The expected output is the error of the function and both files.
+
+        Args:
+        - tmp_path (pathlib.Path): the diagnostics folder
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        with pytest.raises(PermissionError):
+            profile_call(fail, directory=tmp_path)
+        assert len(list_files(tmp_path, ".prof")) == 1
+        assert len(list_files(tmp_path, ".txt")) == 1
+
+    def test_without_reset_peak(self, tmp_path, monkeypatch):
+        """
+        Test profiling without tracemalloc.reset_peak like on Python 3.8.
+
+        The expected output is the return value of the function and the
+        profile.
+
+        Args:
+        - tmp_path (pathlib.Path): the diagnostics folder
+        - monkeypatch (pytest.MonkeyPatch): removes tracemalloc.reset_peak
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        monkeypatch.delattr(tracemalloc, "reset_peak", raising=False)
+        assert len(profile_call(build_words, (100,), directory=tmp_path)) == (
+            100)
+        assert len(list_files(tmp_path, ".prof")) == 1
+
+    def test_profiled(self, tmp_path, monkeypatch):
+        """
+        Test profiling the calls of a decorated function.
+
+        The expected output is one profile for each call, a call inside a
+        profiled call is part of the outer profile.
+
+        Args:
+        - tmp_path (pathlib.Path): the diagnostics folder
+        - monkeypatch (pytest.MonkeyPatch): switches profiling on
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        monkeypatch.setattr(profiling, "PROFILING", True)
+        monkeypatch.setattr(profiling, "DIAGNOSTICS", tmp_path)
+        profiled_words = profiled(build_words)
+        assert profiled_words is not build_words
+        assert profiled_words.__name__ == "build_words"
+
+        def save(count):
+            return len(profiled_words(count))
+
+        assert profiled(save)(5) == 5
+        assert len(list_files(tmp_path, ".prof")) == 1
+        assert profiled_words(5) == build_words(5)
+        assert len(list_files(tmp_path, ".prof")) == 2
+
+    def test_rotation(self, tmp_path, monkeypatch):
+        """
+        Test keeping the files of the last calls.
+
+        The expected output is the files of the last three calls.
+
+        Args:
+        - tmp_path (pathlib.Path): the diagnostics folder
+        - monkeypatch (pytest.MonkeyPatch): keeps three calls
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        monkeypatch.setattr(profiling, "PROFILE_KEEP", 3)
+        for count in range(5):
+            profile_call(build_words, (count,), directory=tmp_path)
+        assert len(list_files(tmp_path, ".prof")) == 3
+        assert len(list_files(tmp_path, ".txt")) == 3
+        assert rotate_diagnostics(tmp_path, keep=1) == 2
+        assert len(os.listdir(tmp_path)) == 2
@@ -0,0 +1,144 @@
+import pytest
+import threading
+from vocabulary_and_translation_gui import rapid_entry, translation_prefetch
+from vocabulary_and_translation_gui.rapid_entry import (
+    collect_entries,
+    count_pending_entries,
+    submit_entry
+)
+from vocabulary_and_translation_gui.vocabulary_store import get_entries
+
+
+@pytest.fixture()
+def released(monkeypatch):
+    """
+    Replace the DeepL requests and the spelling check.
+
+    The translation of "slow" waits until the returned event is set, "Hasu"
+    is misspelled and "error" can't be translated. The synonyms "Bank" and
+    "Sitzbank" have the same English translation. A word keeps its text in
+    its own language.
+    """
+    released = threading.Event()
+
+    def fake_request(auth_key, in_text, src_lang, tgt_lang):
+        if in_text == "slow":
+            released.wait(timeout=10)
+        if in_text == "error":
+            raise ValueError("Quota exceeded")
+        if in_text in ["Bank", "Sitzbank"] and tgt_lang == "English":
+            return "bench", "DE"
+        if tgt_lang == src_lang:
+            return in_text, "DE"
+        return in_text + " in " + tgt_lang, "DE"
+
+    def fake_mistakes(in_text, lang):
+        if in_text == "Hasu":
+            return [{"index": 0, "word": "Hasu", "suggestions": ["Haus"]}]
+        return []
+
+    monkeypatch.setattr(translation_prefetch, "_request", fake_request)
+    monkeypatch.setattr(rapid_entry, "find_spelling_mistakes", fake_mistakes)
+    yield released
+    released.set()
+
+
+def collect_all(word_list):
+    """Collect the submitted words until all are finished."""
+    results = []
+    while count_pending_entries() > 0:
+        results += collect_entries(word_list)
+    return results
+
+
+class TestRapidEntry:
+    """
+    Test cases for the "submit_entry" and "collect_entries" functions.
+
+    This class defines test methods to ensure the functions in the
+    "rapid_entry" module add the submitted words in the order they were
+    typed and collect the failed words.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_order: Test adding the words in the order they were typed.
+        - test_failures: Test collecting the words that are not added.
+        - test_synonyms: Test adding words with the same translation.
+    """
+    def test_order(self, released):
+        """
+        Test adding the words in the order they were typed.
+
+        The expected output is no added word while the first translation
+        is running and all words in the typed order afterwards.
+
+        Args:
+        - released (threading.Event): releases the slow translation
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        word_list = []
+        assert submit_entry("key", "slow", "Deutsch") == 1
+        assert submit_entry("key", " Haus ", "Deutsch") == 2
+        assert submit_entry("key", "", "Deutsch") == 0
+        assert collect_entries(word_list) == []
+
+        released.set()
+        results = collect_all(word_list)
+        assert [result["text"] for result in results] == ["slow", "Haus"]
+        assert [entry[0] for entry in word_list] == ["slow in English",
+                                                     "Haus in English"]
+        assert word_list[0][3] <= word_list[1][3]
+        assert [entry[0] for entry in get_entries()] == ["slow in English",
+                                                         "Haus in English"]
+
+    def test_failures(self, released):
+        """
+        Test collecting the words that are not added.
+
+        The expected output is a failed result for a misspelled word, a
+        failed translation and a word that was typed twice.
+
+        Args:
+        - released (threading.Event): releases the slow translation
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        word_list = []
+        for word in ["Hasu", "error", "Buch", "Buch"]:
+            submit_entry("key", word, "Deutsch")
+        results = collect_all(word_list)
+        assert [result["state"] for result in results] == [
+            "failed", "failed", "added", "failed"]
+        assert results[0]["error"] == ("Misspelled word 'Hasu', "
+                                       "suggestions: Haus")
+        assert results[1]["error"] == "Quota exceeded"
+        assert results[3]["error"].startswith("Already in the vocabulary")
+        assert len(word_list) == 1
+
+    def test_synonyms(self, released):
+        """
+        Test adding words with the same translation.
+
+        The expected output is that both words are added, because only the
+        typed word is looked up in the vocabulary list.
+
+        Args:
+        - released (threading.Event): releases the slow translation
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        word_list = []
+        for word in ["Bank", "Sitzbank"]:
+            submit_entry("key", word, "Deutsch")
+        results = collect_all(word_list)
+        assert [result["state"] for result in results] == ["added", "added"]
+        assert [entry[0] for entry in word_list] == ["bench", "bench"]
@@ -1,10 +1,20 @@
 import datetime
+import openpyxl
 import os
 import pandas as pd
 import pytest
+import sqlite3
+import zipfile
 from vocabulary_and_translation_gui.save_list import (
+    anki_id_for,
+    append_rows_to_xlsx,
+    export_csv,
+    export_table,
     save_list_as_apkg,
-    save_list_as_xlsx
+    save_list_as_xlsx,
+    vocabulary_frame,
+    write_apkg_stream,
+    write_xlsx_stream
     )
 from unittest.mock import patch
 
@@ -80,6 +90,147 @@ class TestSaveListAsApkg:
             assert os.path.exists(path=path)
 
 
+class TestIncrementalApkg:
+    """
+    Test cases for the incremental mode of the "save_list_as_apkg" function.
+
+    This class defines test methods to ensure that saving a deck again
+    only adds new notes and keeps the model and deck IDs.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_stable_ids: Test that the IDs are derived from the names.
+        - test_incremental: Test saving a deck again with new words.
+    """
+    def read_collection(self, tmp_path, path):
+        """Return the note GUIDs and the deck IDs of the cards of a file."""
+        db_path = os.path.join(tmp_path, 'collection.anki2')
+        with zipfile.ZipFile(path) as f:
+            with open(db_path, 'wb') as db_file:
+                db_file.write(f.read('collection.anki2'))
+        connection = sqlite3.connect(db_path)
+        guids = [guid for guid, in connection.execute(
+            'SELECT guid FROM notes')]
+        deck_ids = {deck_id for deck_id, in connection.execute(
+            'SELECT did FROM cards')}
+        connection.close()
+        return guids, deck_ids
+
+    def test_stable_ids(self):
+        """
+        Test that the IDs are derived from the names.
+
+        The expected output is the same ID for the same name and an ID in the
+        range used by genanki.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert anki_id_for('German Vocabulary') == anki_id_for(
+            'German Vocabulary')
+        assert anki_id_for('German Vocabulary') != anki_id_for('New Words')
+        assert (1 << 30) <= anki_id_for('German Vocabulary') < (1 << 31)
+
+    def test_incremental(self, tmp_path):
+        """
+        Test saving a deck again with new words.
+
+        The expected output is a single note for each distinct word and the
+        cards in the deck with the ID of the deck name.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'test.apkg')
+        word_list = [['apple', 'Apfel', 'elma', datetime.datetime.now()],
+                     ['apple', 'Apfel', 'elma', datetime.datetime.now()]]
+        with patch("tkinter.messagebox.showinfo", return_value=True) as info:
+            save_list_as_apkg(word_list=word_list, path=path,
+                              incremental=True)
+            save_list_as_apkg(word_list=word_list + [
+                ['book', 'Buch', 'kitap', datetime.datetime.now()]
+            ], path=path, incremental=True)
+            assert info.call_args.kwargs["message"].startswith("1 new")
+
+        guids, deck_ids = self.read_collection(tmp_path, path)
+        assert len(guids) == len(set(guids)) == 2
+        assert deck_ids == {anki_id_for('German Vocabulary')}
+
+
+class TestWriteApkgStream:
+    """
+    Test cases for the "write_apkg_stream" function.
+
+    This class defines test methods to ensure the "write_apkg_stream"
+    function in the "save_list" module writes the notes of
+    "save_list_as_apkg".
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_iterator: Test writing the entries of an iterator.
+        - test_append: Test adding new words to a written file.
+    """
+    def test_iterator(self, tmp_path):
+        """
+        Test writing the entries of an iterator.
+
+        The expected output is a note and a card for each distinct entry.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'test.apkg')
+        entries = ([f'word{i % 1000}', f'Wort{i % 1000}', f'kelime{i % 1000}',
+                    datetime.datetime.now()] for i in range(1500))
+        assert write_apkg_stream(entries=entries, path=path) == 1000
+
+        with zipfile.ZipFile(path) as f:
+            assert sorted(f.namelist()) == ['collection.anki2', 'media']
+        guids, deck_ids = TestIncrementalApkg().read_collection(tmp_path,
+                                                                path)
+        assert len(guids) == len(set(guids)) == 1000
+        assert deck_ids == {anki_id_for('German Vocabulary')}
+
+    def test_append(self, tmp_path):
+        """
+        Test adding new words to a written file.
+
+        The expected output is only the new word added by the incremental
+        mode of "save_list_as_apkg".
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'test.apkg')
+        word_list = [['apple', 'Apfel', 'elma', datetime.datetime.now()]]
+        write_apkg_stream(entries=word_list, path=path)
+        with patch("tkinter.messagebox.showinfo", return_value=True) as info:
+            save_list_as_apkg(word_list=word_list + [
+                ['book', 'Buch', 'kitap', datetime.datetime.now()]
+            ], path=path, incremental=True)
+            assert info.call_args.kwargs["message"].startswith("1 new")
+
+        guids, _ = TestIncrementalApkg().read_collection(tmp_path, path)
+        assert len(guids) == 2
+
+
 class TestSaveListAsXlsx:
     """
     Test cases for the "save_list_as_xlsx" function.
@@ -98,6 +249,10 @@ class TestSaveListAsXlsx:
         inputs to create a file.
         - test_appending_file: Test the "save_list_as_xlsx" function with
         valid inputs to append a file.
+        - test_skip_existing: Test the "save_list_as_xlsx" function with
+        known words.
+        - test_kept_keys: Test the "save_list_as_xlsx" function without
+        reading the file.
     """
 
     @pytest.mark.parametrize("word_list", [
@@ -183,3 +338,327 @@ class TestSaveListAsXlsx:
             save_list_as_xlsx(word_list=word_list, path=path)
             df = pd.read_excel(path, sheet_name='Vocabulary')
             assert len(df) == expected_len
+
+
+    def test_skip_existing(self, tmp_path):
+        """
+        Test the "save_list_as_xlsx" function with known words.
+
+        The expected output is a file with each word once and a return value
+        of zero if all words are already in the file.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'test.xlsx')
+        word_list = [['apple', 'Apfel', 'elma', '2023-03-01'],
+                     ['Apple ', 'apfel', 'Elma', '2023-03-02']]
+        with patch("tkinter.messagebox.showinfo", return_value=True):
+            assert save_list_as_xlsx(word_list=word_list, path=path) == 1
+            assert save_list_as_xlsx(word_list=word_list + [
+                ['book', 'Buch', 'kitap', '2023-03-03']
+            ], path=path, skip_existing=True) == 1
+            assert save_list_as_xlsx(word_list=word_list, path=path,
+                                     skip_existing=True) == 0
+        df = pd.read_excel(path, sheet_name='Vocabulary')
+        assert list(df['English']) == ['apple', 'book']
+
+    def test_kept_keys(self, tmp_path):
+        """
+        Test the "save_list_as_xlsx" function without reading the file.
+
+        The expected output is no read of the sheet for the known words of a
+        file written by the application, and one read after the file was
+        changed by another program.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'test.xlsx')
+        word_list = [[f'word {i}', f'Wort {i}', f'kelime {i}', '2023-03-01']
+                     for i in range(1000)]
+        with patch("tkinter.messagebox.showinfo", return_value=True), \
+                patch.object(pd, "read_excel",
+                             wraps=pd.read_excel) as read_excel:
+            assert save_list_as_xlsx(word_list=word_list, path=path,
+                                     skip_existing=True) == 1000
+            for i in range(3):
+                assert save_list_as_xlsx(word_list=word_list + [
+                    [f'book {i}', 'Buch', 'kitap', '2023-03-02']
+                ], path=path, skip_existing=True) == 1
+            assert read_excel.call_count == 0
+
+            # A row added by another program is found by reading the file
+            workbook = openpyxl.load_workbook(path)
+            workbook['Vocabulary'].append(['2023-03-03', 'tree', 'Baum',
+                                           'ağaç'])
+            workbook.save(path)
+            assert save_list_as_xlsx(word_list=[
+                ['tree', 'Baum', 'ağaç', '2023-03-03'],
+                ['car', 'Auto', 'araba', '2023-03-03']
+            ], path=path, skip_existing=True) == 1
+            assert read_excel.call_count == 1
+
+
+class TestAppendRowsToXlsx:
+    """
+    Test cases for the "append_rows_to_xlsx" function.
+
+    This class defines test methods to ensure the "append_rows_to_xlsx"
+    function in the "save_list" module appends rows in the layout of
+    "save_list_as_xlsx".
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_append_rows: Test appending rows to a vocabulary file.
+        - test_other_layout: Test a file without a 'Vocabulary' sheet.
+        - test_file_in_use: Test appending to a file that can't be replaced.
+    """
+    def test_append_rows(self, tmp_path):
+        """
+        Test appending rows to a vocabulary file.
+
+        The expected output is the file with the old and the new rows and an
+        updated sheet dimension.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'test.xlsx')
+        with patch("tkinter.messagebox.showinfo", return_value=True):
+            save_list_as_xlsx(word_list=[['apple', 'Apfel', 'elma',
+                                          '2023-03-01 10:00:00']], path=path)
+        assert append_rows_to_xlsx(
+            word_list=[['book', 'Buch', 'kitap', '2023-03-02 10:00:00'],
+                       ['Q&A', '<Frage>', 'soru', '2023-03-03 10:00:00']],
+            path=path) is True
+
+        df = pd.read_excel(path, sheet_name='Vocabulary')
+        assert list(df.columns) == ['Timestamp', 'English', 'Deutsch',
+                                    'Türkçe']
+        assert list(df['English']) == ['apple', 'book', 'Q&A']
+        assert list(df['Deutsch']) == ['Apfel', 'Buch', '<Frage>']
+        assert openpyxl.load_workbook(path)['Vocabulary'].max_row == 4
+
+    def test_other_layout(self, tmp_path):
+        """
+        Test a file without a 'Vocabulary' sheet.
+
+        The expected output is False and an unchanged file.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'test.xlsx')
+        pd.DataFrame([['apple']]).to_excel(path, sheet_name='Other')
+        with open(path, 'rb') as f:
+            content = f.read()
+        assert append_rows_to_xlsx(
+            word_list=[['book', 'Buch', 'kitap', '2023-03-02 10:00:00']],
+            path=path) is False
+        with open(path, 'rb') as f:
+            assert f.read() == content
+        assert os.listdir(tmp_path) == ['test.xlsx']
+
+    def test_file_in_use(self, tmp_path):
+        """
+        Test appending to a file that can't be replaced.
+
+        The expected output is a raised PermissionError, an unchanged file
+        and no copy left next to it.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'test.xlsx')
+        with patch("tkinter.messagebox.showinfo", return_value=True):
+            save_list_as_xlsx(word_list=[['apple', 'Apfel', 'elma',
+                                          '2023-03-01 10:00:00']], path=path)
+        with patch("os.replace", side_effect=PermissionError(path)):
+            with pytest.raises(PermissionError):
+                append_rows_to_xlsx(
+                    word_list=[['book', 'Buch', 'kitap',
+                                '2023-03-02 10:00:00']], path=path)
+        assert [name for name in os.listdir(tmp_path)
+                if name.endswith('.xlsx')] == ['test.xlsx']
+        assert list(pd.read_excel(path, sheet_name='Vocabulary')[
+            'English']) == ['apple']
+
+
+class TestWriteXlsxStream:
+    """
+    Test cases for the "write_xlsx_stream" function.
+
+    This class defines test methods to ensure the "write_xlsx_stream"
+    function in the "save_list" module writes files in the layout of
+    "save_list_as_xlsx".
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_iterator: Test writing the entries of an iterator.
+        - test_list_and_append: Test writing a list and appending to the file.
+    """
+    def test_iterator(self, tmp_path):
+        """
+        Test writing the entries of an iterator.
+
+        The expected output is a file with a row for each entry.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'new', 'test.xlsx')
+        entries = ([f'word{i}', f'Wort{i}', f'kelime{i}',
+                    f'2023-03-01 10:00:{i:02d}'] for i in range(1500))
+        assert write_xlsx_stream(entries=entries, path=path) == 1500
+
+        df = pd.read_excel(path, sheet_name='Vocabulary')
+        assert list(df.columns) == ['Timestamp', 'English', 'Deutsch',
+                                    'Türkçe']
+        assert len(df) == 1500
+        assert list(df.iloc[-1]) == ['2023-03-01 10:00:1499', 'word1499',
+                                     'Wort1499', 'kelime1499']
+
+    def test_list_and_append(self, tmp_path):
+        """
+        Test writing a list and appending to the file.
+
+        The expected output is a file with the dimension of the list and the
+        appended rows.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'test.xlsx')
+        write_xlsx_stream(entries=[['apple', 'Apfel', 'elma',
+                                    '2023-03-01 10:00:00']], path=path)
+        assert openpyxl.load_workbook(
+            path, read_only=True)['Vocabulary'].max_row == 2
+
+        assert append_rows_to_xlsx(
+            word_list=[['book', 'Buch', 'kitap', '2023-03-02 10:00:00']],
+            path=path) is True
+        df = pd.read_excel(path, sheet_name='Vocabulary')
+        assert list(df['Türkçe']) == ['elma', 'kitap']
+
+
+class TestExportTable:
+    """
+    Test cases for the "export_table" function.
+
+    This class defines test methods to ensure the "export_table" function in
+    the "save_list" module writes Parquet and Feather files with real
+    timestamps.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_export_table: Test writing and extending a columnar file.
+    """
+    @pytest.mark.parametrize("file_name, read", [
+        ('test.parquet', pd.read_parquet),
+        ('test.feather', pd.read_feather),
+    ])
+    def test_export_table(self, tmp_path, file_name, read):
+        """
+        Test writing and extending a columnar file.
+
+        The expected output is a file with each word once and a datetime
+        column for the timestamps.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+        - file_name (str): the name of the file
+        - read (function): the function to read the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'new', file_name)
+        word_list = [['apple', 'Apfel', 'elma',
+                      datetime.datetime(2023, 3, 1, 10)],
+                     ['apple', 'Apfel', 'elma', '2023-03-02 10:00:00']]
+        assert export_table(word_list=word_list, path=path) == 1
+        assert export_table(word_list=word_list + [
+            ['book', 'Buch', 'kitap', '2023-03-03 10:00:00.123456']
+        ], path=path) == 1
+
+        df = read(path)
+        assert list(df.columns) == ['Timestamp', 'English', 'Deutsch',
+                                    'Türkçe']
+        assert list(df['English']) == ['apple', 'book']
+        assert pd.api.types.is_datetime64_any_dtype(df['Timestamp'])
+        assert df['Timestamp'][0] == pd.Timestamp(2023, 3, 1, 10)
+
+
+class TestExportCsv:
+    """
+    Test cases for the "export_csv" function.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_export_csv: Test writing and appending a CSV file.
+    """
+    def test_export_csv(self, tmp_path):
+        """
+        Test writing and appending a CSV file.
+
+        The expected output is a file with a header, each word once and
+        timestamps that are read as datetime values.
+
+        Args:
+        - tmp_path (pathlib.WindowsPath): the temporary path to save the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, 'test.csv')
+        word_list = [['apple', 'Apfel', 'elma',
+                      datetime.datetime(2023, 3, 1, 10)]]
+        assert export_csv(word_list=word_list, path=path) == 1
+        assert export_csv(word_list=word_list + [
+            ['Çiçek, "güzel"', 'Blume', 'çiçek',
+             datetime.datetime(2023, 3, 2)]
+        ], path=path, skip_existing=True) == 1
+
+        df = pd.read_csv(path, parse_dates=['Timestamp'])
+        assert list(df['English']) == ['apple', 'Çiçek, "güzel"']
+        assert df['Timestamp'][0] == pd.Timestamp(2023, 3, 1, 10)
+        assert list(vocabulary_frame(word_list).columns) == list(df.columns)
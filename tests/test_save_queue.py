@@ -0,0 +1,150 @@
+import os
+import pandas as pd
+import threading
+from vocabulary_and_translation_gui import save_queue
+from vocabulary_and_translation_gui.save_queue import (
+    describe_save_event,
+    submit_save,
+    wait_for_saves
+)
+
+
+class TestSubmitSave:
+    """
+    Test cases for the "submit_save" function.
+
+    This class defines test methods to ensure the "submit_save" function in
+    the "save_queue" module writes the files in the background.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_save: Test saving a word list in the background.
+        - test_merge: Test merging requests for the same file.
+        - test_retry: Test saving a file again that is being used.
+        - test_failing_callback: Test saving after a callback that raised an
+        error.
+    """
+    def test_save(self, tmp_path):
+        """
+        Test saving a word list in the background.
+
+        The expected output is the file and the events of the request.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, "test.xlsx")
+        events, counts = [], []
+        assert submit_save([["house", "Haus", "ev", "2023-03-01"]], path,
+                           events.append, counts.append) is True
+        assert wait_for_saves(timeout=10) is True
+        assert [event["state"] for event in events] == ["queued", "saving",
+                                                        "saved"]
+        assert counts == [1]
+        assert describe_save_event(events[-1]) == ("1 new word(s) saved to "
+                                                   "test.xlsx.")
+
+    def test_merge(self, tmp_path):
+        """
+        Test merging requests for the same file.
+
+        The expected output is a single write of both word lists while the
+        writer is busy with another file.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the files
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        released = threading.Event()
+
+        def block(event):
+            if event["state"] == "saving":
+                released.wait(timeout=10)
+
+        path = os.path.join(tmp_path, "test.xlsx")
+        events = []
+        submit_save([["tree", "Baum", "ağaç", "2023-03-01"]],
+                    os.path.join(tmp_path, "other.xlsx"), block)
+        try:
+            assert submit_save([["house", "Haus", "ev", "2023-03-01"]], path,
+                               events.append) is True
+            assert submit_save([["house", "Haus", "ev", "2023-03-01"],
+                                ["book", "Buch", "kitap", "2023-03-02"]],
+                               path, events.append) is False
+        finally:
+            released.set()
+        assert wait_for_saves(timeout=10) is True
+
+        assert [event["state"] for event in events].count("saving") == 2
+        assert events[-1]["count"] == 2
+        df = pd.read_excel(path, sheet_name="Vocabulary")
+        assert list(df["English"]) == ["house", "book"]
+
+    def test_retry(self, tmp_path, monkeypatch):
+        """
+        Test saving a file again that is being used.
+
+        The expected output is a retry after each PermissionError and a
+        failed request once all delays are used.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the file
+        - monkeypatch (pytest.MonkeyPatch): the fixture to replace the
+        delays and the export
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        def export_file(word_list, path):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(save_queue, "SAVE_RETRY_DELAYS", (0.01, 0.02))
+        monkeypatch.setattr(save_queue, "export_file", export_file)
+        events = []
+        submit_save([["house", "Haus", "ev", "2023-03-01"]],
+                    os.path.join(tmp_path, "test.xlsx"), events.append)
+        assert wait_for_saves(timeout=10) is True
+        assert [event["state"] for event in events] == [
+            "queued", "saving", "retrying", "saving", "retrying", "saving",
+            "failed"
+        ]
+        assert [event["delay"] for event in events
+                if event["state"] == "retrying"] == [0.01, 0.02]
+
+    def test_failing_callback(self, tmp_path):
+        """
+        Test saving after a callback that raised an error.
+
+        The expected output is a saved file for every request, also after
+        the callback and a listener of the first request failed.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the files
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        def fail(argument):
+            raise RuntimeError("The window was closed")
+
+        submit_save([["house", "Haus", "ev", "2023-03-01"]],
+                    os.path.join(tmp_path, "first.xlsx"), fail, fail)
+        assert wait_for_saves(timeout=10) is True
+        counts = []
+        submit_save([["book", "Buch", "kitap", "2023-03-02"]],
+                    os.path.join(tmp_path, "second.xlsx"),
+                    on_done=counts.append)
+        assert wait_for_saves(timeout=10) is True
+        assert counts == [1]
+        assert save_queue._writer["thread"].is_alive()
@@ -0,0 +1,216 @@
+import enchant
+import pytest
+import time
+import tkinter as tk
+from unittest.mock import patch
+from vocabulary_and_translation_gui import spelling_review
+from vocabulary_and_translation_gui.personal_dictionary import (
+    is_personal_word
+)
+from vocabulary_and_translation_gui.spelling_review import (
+    create_review_panel,
+    review_spelling
+)
+
+
+@pytest.fixture()
+def root():
+    """Create a hidden tkinter window for the review panels."""
+    window = tk.Tk()
+    window.withdraw()
+    yield window
+    window.destroy()
+
+
+def find_button(panel, text):
+    """Return the button of the review panel with the given text."""
+    for frame in panel.winfo_children():
+        for widget in frame.winfo_children():
+            if isinstance(widget, tk.Button) and widget.cget("text") == text:
+                return widget
+
+
+class TestCreateReviewPanel:
+    """
+    Test cases for the "create_review_panel" function.
+
+    This class defines test methods to ensure the "create_review_panel"
+    function in the "spelling_review" module returns the accepted text.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_buttons: Test the buttons of the review panel.
+        - test_always_accept: Test the "Always accept" check box.
+    """
+    mistakes = [
+        {"index": 2, "word": "houze", "suggestions": ["house", "hose"]},
+        {"index": 6, "word": "smalll", "suggestions": ["small"]},
+    ]
+
+    @pytest.mark.parametrize("button, expected, cancelled", [
+        ("Use corrections", ["the house is small"], 0),
+        ("Keep original", ["the houze is smalll"], 0),
+        ("Cancel", [], 1),
+    ])
+    def test_buttons(self, root, button, expected, cancelled):
+        """
+        Test the buttons of the review panel.
+
+        The expected output is the corrected text, the original text or no
+        text at all and a call of on_cancel if the review is cancelled.
+
+        Args:
+        - root (tk.Tk): the parent window
+        - button (str): the text of the pressed button
+        - expected (list): the texts passed to on_done
+        - cancelled (int): the number of calls of on_cancel
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        accepted = []
+        cancels = []
+        panel = create_review_panel(root, "the houze is smalll", "English",
+                                    self.mistakes, accepted.append,
+                                    lambda: cancels.append(True))
+        find_button(panel, button).invoke()
+        assert accepted == expected
+        assert len(cancels) == cancelled
+        assert panel.winfo_exists() == 0
+
+    def test_always_accept(self, root):
+        """
+        Test the "Always accept" check box.
+
+        The expected output is the original word in the text and in the
+        personal dictionary.
+
+        Args:
+        - root (tk.Tk): the parent window
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        accepted = []
+        panel = create_review_panel(root, "the houze is smalll", "English",
+                                    self.mistakes, accepted.append)
+        checkbuttons = [widget for widget in panel.winfo_children()
+                        if isinstance(widget, tk.Checkbutton)]
+        checkbuttons[0].invoke()
+        find_button(panel, "Use corrections").invoke()
+        assert accepted == ["the houze is small"]
+        assert is_personal_word("houze", "en_GB")
+
+
+class TestReviewSpelling:
+    """
+    Test cases for the "review_spelling" function.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_correct_expression: Test the "review_spelling" function with a
+        correct expression.
+        - test_enchant_error: Test the "review_spelling" function if enchant
+        fails.
+        - test_other_error: Test the "review_spelling" function with an
+        unexpected error.
+    """
+    def test_correct_expression(self, root):
+        """
+        Test the "review_spelling" function with a correct expression.
+
+        The expected output is the unchanged text without a review panel.
+
+        Args:
+        - root (tk.Tk): the parent window
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        accepted = []
+        review_spelling(root, "the house is small", "English",
+                        accepted.append, poll_interval=1)
+        for _ in range(500):
+            if accepted:
+                break
+            root.update()
+            time.sleep(0.01)
+        assert accepted == ["the house is small"]
+        assert not any(isinstance(widget, tk.Toplevel)
+                       for widget in root.winfo_children())
+
+    def test_enchant_error(self, root, monkeypatch):
+        """
+        Test the "review_spelling" function if enchant fails.
+
+        The expected output is an error message and the unchanged text.
+
+        Args:
+        - root (tk.Tk): the parent window
+        - monkeypatch (pytest.MonkeyPatch): makes the spelling check fail
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        def fail(in_text, lang):
+            raise enchant.errors.Error("Dictionary is broken")
+
+        monkeypatch.setattr(spelling_review, "find_spelling_mistakes", fail)
+        accepted = []
+        with patch("tkinter.messagebox.showerror") as mock_error:
+            review_spelling(root, "the houze is small", "English",
+                            accepted.append, poll_interval=1)
+            for _ in range(500):
+                if accepted:
+                    break
+                root.update()
+                time.sleep(0.01)
+            assert "Dictionary is broken" in mock_error.call_args[1][
+                "message"]
+        assert accepted == ["the houze is small"]
+
+    def test_other_error(self, root, monkeypatch):
+        """
+        Test the "review_spelling" function with an unexpected error.
+
+        The expected output is an error message, a call of on_cancel and no
+        accepted text.
+
+        Args:
+        - root (tk.Tk): the parent window
+        - monkeypatch (pytest.MonkeyPatch): makes the spelling check fail
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        def fail(in_text, lang):
+            raise RuntimeError("Unexpected")
+
+        monkeypatch.setattr(spelling_review, "find_spelling_mistakes", fail)
+        errors = []
+        monkeypatch.setattr(root, "report_callback_exception",
+                            lambda *args: errors.append(args[1]))
+        accepted = []
+        cancels = []
+        with patch("tkinter.messagebox.showerror") as mock_error:
+            review_spelling(root, "the houze is small", "English",
+                            accepted.append, poll_interval=1,
+                            on_cancel=lambda: cancels.append(True))
+            for _ in range(500):
+                if cancels:
+                    break
+                root.update()
+                time.sleep(0.01)
+            assert "Unexpected" in mock_error.call_args[1]["message"]
+        assert cancels == [True]
+        assert accepted == []
+        assert errors == []
@@ -0,0 +1,203 @@
+import concurrent.futures
+import pytest
+import threading
+from vocabulary_and_translation_gui import suggestions
+from vocabulary_and_translation_gui.dictionary_manager import (
+    clear_dictionaries,
+    dictionary_lock,
+    get_dictionary,
+    get_word_groups
+)
+from vocabulary_and_translation_gui.suggestions import (
+    edit_distance_suggestions,
+    get_suggestion_statistics,
+    reset_suggestion_statistics,
+    suggest_with_deadline
+)
+
+
+class SlowChecker:
+    """A dictionary whose suggestions are blocked until it is released."""
+
+    def __init__(self):
+        self.released = threading.Event()
+
+    def suggest(self, word):
+        """Return a suggestion once the checker is released."""
+        self.released.wait(timeout=5)
+        return ["slow"]
+
+
+class FastChecker:
+    """A dictionary that returns its suggestions immediately."""
+
+    def suggest(self, word):
+        """Return a suggestion immediately."""
+        return ["fast"]
+
+
+@pytest.fixture(autouse=True)
+def statistics():
+    """
+    Start every test with empty suggestion statistics and without running
+    suggestion calls.
+    """
+    reset_suggestion_statistics()
+    yield
+    concurrent.futures.wait(list(suggestions._running.values()), timeout=5)
+    reset_suggestion_statistics()
+    clear_dictionaries()
+
+
+class TestSuggestWithDeadline:
+    """
+    Test cases for the "suggest_with_deadline" function.
+
+    This class defines test methods to ensure the "suggest_with_deadline"
+    function in the "suggestions" module returns in time.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_in_time: Test suggestions that are ready before the deadline.
+        - test_deadline_hit: Test suggestions that take longer than the
+        deadline.
+        - test_dictionary_in_use: Test suggestions for a dictionary that is
+        used by another thread.
+        - test_not_shipped: Test suggestions for a dictionary without words
+        for the edit distance suggestions.
+    """
+    def test_in_time(self):
+        """
+        Test suggestions that are ready before the deadline.
+
+        The expected output are the suggestions of the dictionary.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert suggest_with_deadline(FastChecker(), "houze", "en_GB",
+                                     deadline=5) == ["fast"]
+        assert get_suggestion_statistics() == {"calls": 1,
+                                               "deadline_hits": 0,
+                                               "busy": 0}
+
+    def test_deadline_hit(self):
+        """
+        Test suggestions that take longer than the deadline.
+
+        The expected output are the edit distance suggestions, also for a
+        second call while the first one is still running. The second call is
+        counted as busy, not as deadline hit.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        get_dictionary("en_GB")
+        get_word_groups("en_GB")
+        checker = SlowChecker()
+        try:
+            for _ in range(2):
+                result = suggest_with_deadline(checker, "houze", "en_GB",
+                                               deadline=0.01)
+                assert "house" in result
+        finally:
+            checker.released.set()
+        assert get_suggestion_statistics() == {"calls": 2,
+                                               "deadline_hits": 1,
+                                               "busy": 1}
+
+    def test_dictionary_in_use(self):
+        """
+        Test suggestions while the dictionary of the spelling check is used
+        by another thread.
+
+        The expected output are the suggestions of the dictionary, because
+        the suggestions do not wait for the lock of the spelling check.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        checker = FastChecker()
+        with dictionary_lock(checker):
+            assert suggest_with_deadline(checker, "houze", "en_GB",
+                                         deadline=5) == ["fast"]
+
+    def test_not_shipped(self):
+        """
+        Test suggestions for a dictionary without words for the edit distance
+        suggestions.
+
+        The expected output is an empty list after the deadline.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        checker = SlowChecker()
+        try:
+            assert suggest_with_deadline(checker, "evv", "tr_TR",
+                                         deadline=0.01) == []
+        finally:
+            checker.released.set()
+        assert get_suggestion_statistics() == {"calls": 1,
+                                               "deadline_hits": 1,
+                                               "busy": 0}
+
+
+class TestEditDistanceSuggestions:
+    """
+    Test cases for the "edit_distance_suggestions" function.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_suggestions: Test the suggestions for misspelled words.
+        - test_no_suggestions: Test unknown dictionaries and empty words.
+    """
+    @pytest.mark.parametrize("word, dictionary_language, expected", [
+        ("houze", "en_GB", "house"),
+        ("Hauss", "de_DE", "Haus"),
+    ])
+    def test_suggestions(self, word, dictionary_language, expected):
+        """
+        Test the suggestions for misspelled words.
+
+        The expected output contains the correct word.
+
+        Args:
+        - word (str): the misspelled word
+        - dictionary_language (str): the abbreviation of the dictionary
+        - expected (str): the correct word
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert expected in edit_distance_suggestions(word,
+                                                     dictionary_language)
+
+    @pytest.mark.parametrize("word, dictionary_language", [
+        ("houze", "xx_XX"),
+        ("", "en_GB"),
+    ])
+    def test_no_suggestions(self, word, dictionary_language):
+        """
+        Test unknown dictionaries and empty words.
+
+        The expected output is an empty list.
+
+        Args:
+        - word (str): the misspelled word
+        - dictionary_language (str): the abbreviation of the dictionary
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert edit_distance_suggestions(word, dictionary_language) == []
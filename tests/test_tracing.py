@@ -0,0 +1,238 @@
+import concurrent.futures
+import json
+import os
+import pytest
+import threading
+from vocabulary_and_translation_gui import rapid_entry, translation_prefetch
+from vocabulary_and_translation_gui.rapid_entry import (
+    collect_entries,
+    count_pending_entries,
+    submit_entry
+)
+from vocabulary_and_translation_gui.tracing import (
+    propagate,
+    set_attribute,
+    span,
+    start_tracing,
+    stop_tracing,
+    traced
+)
+
+
+@pytest.fixture()
+def trace_file(tmp_path):
+    """Trace to a file and stop tracing after the test."""
+    path = os.path.join(tmp_path, "traces", "traces.jsonl")
+    start_tracing("file", path)
+    yield path
+    stop_tracing()
+
+
+def read_traces(path):
+    """Return the spans of each trace of a file by name."""
+    traces = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            scope = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]
+            traces.append({item["name"]: item for item in scope["spans"]})
+    return traces
+
+
+def read_spans(path):
+    """Return the spans of all traces of a file by name."""
+    spans = {}
+    for trace in read_traces(path):
+        spans.update(trace)
+    return spans
+
+
+def attributes(item):
+    """Return the attributes of an OTLP span as dictionary."""
+    return {attribute["key"]: list(attribute["value"].values())[0]
+            for attribute in item["attributes"]}
+
+
+class TestTracing:
+    """
+    Test cases for the "tracing" module.
+
+    This class defines test methods to ensure the functions of the
+    "tracing" module nest the spans, propagate them into threads and write
+    the traces.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_not_started: Test that nothing is traced without tracing.
+        - test_nested_spans: Test writing nested spans to a file.
+        - test_threads: Test spans of a worker thread.
+        - test_concurrent_traces: Test traces that end at the same time.
+        - test_console: Test printing a waterfall.
+        - test_rapid_entry: Test tracing the stages of the rapid-entry mode.
+    """
+    def test_not_started(self):
+        """
+        Test that nothing is traced without tracing.
+
+        The expected output is a context manager that does nothing and the
+        unchanged function.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        with span("add") as item:
+            set_attribute("cache_hit", True)
+        assert item is None
+        assert propagate(print) is print
+
+    def test_nested_spans(self, trace_file):
+        """
+        Test writing nested spans to a file.
+
+        The expected output is one trace with the child span, its
+        attributes and the error status of a failed span.
+
+        Args:
+        - trace_file (str): the file for the traces
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        @traced("add")
+        def add():
+            set_attribute("language", "Deutsch")
+            with span("translate", {"chars": 4}):
+                set_attribute("cache_hit", True)
+            with pytest.raises(ValueError):
+                with span("spell-check"):
+                    raise ValueError("Expression not found")
+
+        add()
+        with open(trace_file, encoding="utf-8") as f:
+            assert len(f.readlines()) == 1
+        spans = read_spans(trace_file)
+        assert spans["add"]["parentSpanId"] == ""
+        assert spans["translate"]["parentSpanId"] == spans["add"]["spanId"]
+        assert spans["translate"]["traceId"] == spans["add"]["traceId"]
+        assert attributes(spans["add"]) == {"language": "Deutsch"}
+        assert attributes(spans["translate"]) == {"chars": "4",
+                                                  "cache_hit": True}
+        assert spans["translate"]["status"] == {"code": 1}
+        assert spans["spell-check"]["status"]["code"] == 2
+        assert (int(spans["add"]["endTimeUnixNano"])
+                >= int(spans["translate"]["endTimeUnixNano"]))
+
+    def test_threads(self, trace_file):
+        """
+        Test spans of a worker thread.
+
+        The expected output is the span of the thread as child of the span
+        that submitted the work.
+
+        Args:
+        - trace_file (str): the file for the traces
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        def work():
+            with span("request"):
+                return 1
+
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            with span("add"):
+                assert executor.submit(propagate(work)).result() == 1
+            # Without a span the work starts a new trace
+            executor.submit(propagate(work)).result()
+
+        traces = read_traces(trace_file)
+        assert len(traces) == 2
+        assert (traces[0]["request"]["parentSpanId"]
+                == traces[0]["add"]["spanId"])
+        assert traces[1]["request"]["parentSpanId"] == ""
+
+    def test_concurrent_traces(self, trace_file):
+        """
+        Test traces that end at the same time.
+
+        The expected output is one trace for each thread in the file, whose
+        folder is created by the first finished trace.
+
+        Args:
+        - trace_file (str): the file for the traces
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        barrier = threading.Barrier(8)
+
+        def work():
+            with span("add"):
+                barrier.wait()
+
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            for future in [executor.submit(work) for _ in range(8)]:
+                future.result()
+        assert len(read_traces(trace_file)) == 8
+
+    def test_console(self, capsys):
+        """
+        Test printing a waterfall.
+
+        The expected output is a line for each span, indented by its depth.
+
+        Args:
+        - capsys (pytest.CaptureFixture): the captured output
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        start_tracing("console")
+        try:
+            with span("add", {"language": "Deutsch"}):
+                with span("translate"):
+                    pass
+        finally:
+            stop_tracing()
+        lines = capsys.readouterr().err.splitlines()
+        assert lines[0].startswith("Trace ")
+        assert lines[1].endswith("  add language=Deutsch")
+        assert lines[2].endswith("    translate")
+        with pytest.raises(ValueError):
+            start_tracing("jaeger")
+
+    def test_rapid_entry(self, trace_file, monkeypatch):
+        """
+        Test tracing the stages of the rapid-entry mode.
+
+        The expected output is the spelling check and the translations of
+        the worker thread in the trace of the submitted word.
+
+        Args:
+        - trace_file (str): the file for the traces
+        - monkeypatch (pytest.MonkeyPatch): replaces the DeepL requests
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        monkeypatch.setattr(translation_prefetch, "_request",
+                            lambda *args: (args[1] + " in " + args[3], "DE"))
+        monkeypatch.setattr(rapid_entry, "find_spelling_mistakes",
+                            lambda in_text, lang: [])
+        with span("rapid entry"):
+            submit_entry("key", "Haus", "Deutsch")
+        while count_pending_entries() > 0:
+            collect_entries([])
+
+        spans = read_spans(trace_file)
+        root = spans["rapid entry"]
+        assert spans["spell-check"]["traceId"] == root["traceId"]
+        assert spans["spell-check"]["parentSpanId"] == root["spanId"]
+        assert attributes(spans["translate"])["cache_hit"] is False
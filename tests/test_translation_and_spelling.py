@@ -1,21 +1,24 @@
+import concurrent.futures
 import pytest
+import threading
+import time
 from unittest.mock import patch
+from vocabulary_and_translation_gui import suggestions
+from vocabulary_and_translation_gui.dictionary_manager import (
+    dictionary_lock,
+    get_dictionary
+)
+from vocabulary_and_translation_gui.personal_dictionary import (
+    is_personal_word
+)
 from vocabulary_and_translation_gui.translation_and_spelling import (
+    apply_corrections,
     convert_language_name,
     check_spelling,
     correct_spelling_mistakes,
+    find_spelling_mistakes,
     translate_string
 )
-from vocabulary_and_translation_gui.prepare_application import (
-    get_deepl_key
-)
-
-
-@pytest.fixture(scope="session")
-def auth_key(pytestconfig):
-    """Get the path of the Deepl Key."""
-    path = pytestconfig.getoption("keypath")
-    return get_deepl_key(file_path=path)
 
 
 class TestConvertLanguageName:
@@ -42,7 +45,7 @@ class TestConvertLanguageName:
         ("English", "tgt", "EN-GB"),
         ("Türkçe", "src", "TR"),
     ])
-    def test_valid_input(self, abbr, style, expected, auth_key):
+    def test_valid_input(self, abbr, style, expected):
         """
         Test the "convert_language_name" function with valid inputs.
 
@@ -127,6 +130,8 @@ class TestCorrectSpellingMistakes:
         with unknown source language.
         - test_unknown_words: Test the correct_spelling_mistakes function with
         too many or unknown inputs.
+        - test_always_accept: Test the correct_spelling_mistakes function with
+        words added to the personal dictionary.
     """
     @pytest.mark.parametrize("in_text, dic_lang", [
         ("house", "English"),
@@ -207,7 +212,8 @@ class TestCorrectSpellingMistakes:
         Test the "correct_spelling_mistakes" function with wrong inputs.
 
         The expected outcome is the input word if "yes" is selected in the
-        messagebox and an ValueError if "no" is selected.
+        messagebox and an ValueError if "no" is selected. The word is not
+        added to the personal dictionary.
 
         Args:
         - in_text (str): the word to check and correct
@@ -217,7 +223,7 @@ class TestCorrectSpellingMistakes:
         - AssertionError: if the output of the function does not match the
         expected value
         """
-        with patch("tkinter.messagebox.askyesno", return_value=True):
+        with patch("tkinter.messagebox.askyesno", side_effect=[True, False]):
             assert correct_spelling_mistakes(in_text=in_text,
                                              dic_lang=dic_lang) == in_text
 
@@ -225,6 +231,34 @@ class TestCorrectSpellingMistakes:
             with pytest.raises(ValueError, match="Expression not found"):
                 correct_spelling_mistakes(in_text=in_text, dic_lang=dic_lang)
 
+    @pytest.mark.parametrize("in_text, dic_lang", [
+        ("askjsjjksajk", "English"),
+        ("gfcvhjhsdkjs", "Deutsch"),
+    ])
+    def test_always_accept(self, in_text, dic_lang):
+        """
+        Test the "correct_spelling_mistakes" function with "always accept".
+
+        The expected outcome is the input word without any messagebox once
+        the word was added to the personal dictionary.
+
+        Args:
+        - in_text (str): the word to check and correct
+        - dic_lang (str): the language of the word
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        with patch("tkinter.messagebox.askyesno", return_value=True):
+            assert correct_spelling_mistakes(in_text=in_text,
+                                             dic_lang=dic_lang) == in_text
+
+        with patch("tkinter.messagebox.askyesno") as mock_ask:
+            assert correct_spelling_mistakes(in_text=in_text,
+                                             dic_lang=dic_lang) == in_text
+            mock_ask.assert_not_called()
+
 
 class TestCheckSpelling:
     """
@@ -242,6 +276,10 @@ class TestCheckSpelling:
         correct written expressions.
         - test_incorrect_expression: Test the "check_spelling" function with
         incorrect written expressions.
+        - test_keep_once: Test the "check_spelling" function keeps the
+        personal dictionary unchanged if "no" is selected.
+        - test_always_accept: Test the "check_spelling" function with
+        "always accept".
         - test_unknown_expression: Test the "check_spelling function with
         unknown inputs.
         - test_unknown_language: Test the "check_spelling" function with
@@ -293,13 +331,82 @@ class TestCheckSpelling:
         with patch("tkinter.messagebox.askyesnocancel", return_value=True):
             assert check_spelling(in_text=in_text, lang=lang) == expected
 
-        with patch("tkinter.messagebox.askyesnocancel", return_value=False):
+        with patch("tkinter.messagebox.askyesnocancel", return_value=False), \
+                patch("tkinter.messagebox.askyesno", return_value=False):
             assert check_spelling(in_text=in_text, lang=lang) == in_text
 
         with patch("tkinter.messagebox.askyesnocancel", return_value=None):
             with pytest.raises(ValueError, match="Expression not found"):
                 check_spelling(in_text="Armuti çok lezetli", lang="Türkçe")
 
+    @pytest.mark.parametrize("in_text, lang, dic_lang, misspelled", [
+        ("the houze is smalll", "English", "en_GB", ["houze", "smalll"]),
+        ("der Baumm ist klain", "Deutsch", "de_DE", ["Baumm", "klain"]),
+    ])
+    def test_keep_once(self, in_text, lang, dic_lang, misspelled):
+        """
+        Test the "check_spelling" function with "no" selected.
+
+        The expected output is the input expression, and the misspelled words
+        are not added to the personal dictionary, so they are flagged again
+        on the next check.
+
+        Args:
+        - in_text (str): the word to check and correct
+        - lang (str): the language of the word
+        - dic_lang (str): the dictionary language of the word
+        - misspelled (list): the misspelled words of the expression
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value or a word was added to the personal dictionary
+        """
+        with patch("tkinter.messagebox.askyesnocancel", return_value=False), \
+                patch("tkinter.messagebox.askyesno", return_value=False):
+            assert check_spelling(in_text=in_text, lang=lang) == in_text
+
+        for word in misspelled:
+            assert not is_personal_word(word, dic_lang)
+
+        with patch("tkinter.messagebox.askyesnocancel",
+                   return_value=False) as mock_ask, \
+                patch("tkinter.messagebox.askyesno", return_value=False):
+            assert check_spelling(in_text=in_text, lang=lang) == in_text
+            mock_ask.assert_called_once()
+
+    @pytest.mark.parametrize("in_text, lang, dic_lang, misspelled", [
+        ("the houze is smalll", "English", "en_GB", ["houze", "smalll"]),
+        ("der Baumm ist klain", "Deutsch", "de_DE", ["Baumm", "klain"]),
+    ])
+    def test_always_accept(self, in_text, lang, dic_lang, misspelled):
+        """
+        Test the "check_spelling" function with "always accept".
+
+        The expected output is the input expression, and the misspelled words
+        are added to the personal dictionary, so the next check does not show
+        any messagebox.
+
+        Args:
+        - in_text (str): the word to check and correct
+        - lang (str): the language of the word
+        - dic_lang (str): the dictionary language of the word
+        - misspelled (list): the misspelled words of the expression
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value or a word was not added to the personal dictionary
+        """
+        with patch("tkinter.messagebox.askyesnocancel", return_value=False), \
+                patch("tkinter.messagebox.askyesno", return_value=True):
+            assert check_spelling(in_text=in_text, lang=lang) == in_text
+
+        for word in misspelled:
+            assert is_personal_word(word, dic_lang)
+
+        with patch("tkinter.messagebox.askyesnocancel") as mock_ask:
+            assert check_spelling(in_text=in_text, lang=lang) == in_text
+            mock_ask.assert_not_called()
+
     @pytest.mark.parametrize("in_text, lang", [
         ("askjsjjksajk", "English"),
         ("gfcvhjhsdkjs", "Deutsch"),
@@ -319,7 +426,7 @@ class TestCheckSpelling:
         - AssertionError: if the output of the function does not match the
         expected value
         """
-        with patch("tkinter.messagebox.askyesno", return_value=True):
+        with patch("tkinter.messagebox.askyesno", side_effect=[True, False]):
             assert check_spelling(in_text=in_text, lang=lang) == in_text
 
         with patch("tkinter.messagebox.askyesno", return_value=False):
@@ -348,6 +455,172 @@ class TestCheckSpelling:
         assert check_spelling(in_text=in_text, lang=lang) == in_text
 
 
+class TestFindSpellingMistakes:
+    """
+    Test cases for the "find_spelling_mistakes" function.
+
+    This class defines test methods to ensure the "find_spelling_mistakes"
+    function in the "translation_and_spelling" module finds all mistakes
+    without asking the user.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_mistakes: Test the "find_spelling_mistakes" function with
+        incorrect written expressions.
+        - test_no_mistakes: Test the "find_spelling_mistakes" function with
+        correct expressions and unknown languages.
+        - test_dictionary_in_use: Test the "find_spelling_mistakes" function
+        while another thread uses the dictionary.
+        - test_slow_suggestions: Test the "find_spelling_mistakes" function
+        with suggestions that take longer than the deadline.
+    """
+    @pytest.mark.parametrize("in_text, lang, expected", [
+        ("the houze is smalll", "English", [(2, "houze", "house"),
+                                            (6, "smalll", "small")]),
+        ("der Baumm ist klain", "Deutsch", [(2, "Baumm", "Baum"),
+                                            (6, "klain", "klein")]),
+    ])
+    def test_mistakes(self, in_text, lang, expected):
+        """
+        Test the "find_spelling_mistakes" function with mistakes.
+
+        The expected output is every misspelled word with its position and
+        the best suggestion, without any messagebox.
+
+        Args:
+        - in_text (str): the expression to check
+        - lang (str): the language of the expression
+        - expected (list): the expected index, word and first suggestion
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        with patch("tkinter.messagebox.askyesno") as mock_ask:
+            mistakes = find_spelling_mistakes(in_text=in_text, lang=lang)
+            mock_ask.assert_not_called()
+        assert [(mistake["index"], mistake["word"], mistake["suggestions"][0])
+                for mistake in mistakes] == expected
+
+    @pytest.mark.parametrize("in_text, lang", [
+        ("the house is small", "English"),
+        ("das Hauss ist klain", "xyz"),
+        ("gfcvhjhsdkjs", "Automatic language recognition"),
+    ])
+    def test_no_mistakes(self, in_text, lang):
+        """
+        Test the "find_spelling_mistakes" function without mistakes.
+
+        The expected output is an empty list.
+
+        Args:
+        - in_text (str): the expression to check
+        - lang (str): the language of the expression
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert find_spelling_mistakes(in_text=in_text, lang=lang) == []
+
+    def test_dictionary_in_use(self):
+        """
+        Test the "find_spelling_mistakes" function while another thread uses
+        the dictionary.
+
+        The expected output is a check that waits until the other thread
+        releases the dictionary.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        results = []
+        thread = threading.Thread(target=lambda: results.append(
+            find_spelling_mistakes(in_text="the house", lang="English")))
+        with dictionary_lock(get_dictionary("en_GB")):
+            thread.start()
+            thread.join(timeout=0.1)
+            assert thread.is_alive()
+        thread.join(timeout=5)
+        assert results == [[]]
+
+    def test_slow_suggestions(self, monkeypatch):
+        """
+        Test the "find_spelling_mistakes" function with suggestions that take
+        longer than the deadline.
+
+        The expected output is every mistake after about one deadline,
+        because the spelling checks do not wait for the slow suggestions.
+
+        Args:
+        - monkeypatch (pytest.MonkeyPatch): makes the suggestions slow
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        released = threading.Event()
+
+        class SlowDictionary:
+            def suggest(self, word):
+                released.wait(timeout=5)
+                return []
+
+        monkeypatch.setattr(suggestions, "SUGGESTION_DEADLINE", 0.2)
+        monkeypatch.setattr(suggestions, "get_suggestion_dictionary",
+                            lambda dictionary_language: SlowDictionary())
+        start = time.perf_counter()
+        try:
+            mistakes = find_spelling_mistakes(in_text="the houze is smalll",
+                                              lang="English")
+            seconds = time.perf_counter() - start
+        finally:
+            released.set()
+            concurrent.futures.wait(list(suggestions._running.values()),
+                                    timeout=5)
+        assert [mistake["word"] for mistake in mistakes] == ["houze",
+                                                             "smalll"]
+        assert seconds < 0.6
+
+
+class TestApplyCorrections:
+    """
+    Test cases for the "apply_corrections" function.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_corrections: Test the "apply_corrections" function with and
+        without corrections.
+    """
+    @pytest.mark.parametrize("in_text, corrections, expected", [
+        ("the houze is smalll", {2: "house", 6: "small"},
+         "the house is small"),
+        ("the houze is smalll", {2: "house"}, "the house is smalll"),
+        ("well-known houze", {}, "well-known houze"),
+    ])
+    def test_corrections(self, in_text, corrections, expected):
+        """
+        Test the "apply_corrections" function.
+
+        The expected output is the text with the replaced words.
+
+        Args:
+        - in_text (str): the original expression
+        - corrections (dict): the replacement for each word index
+        - expected (str): the expected output for the given input
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert apply_corrections(in_text, corrections) == expected
+
+
 class TestTranslateString:
     """
     Test cases for the "translate_string" function.
@@ -367,6 +640,7 @@ class TestTranslateString:
         - test_invalid_key: Test the "test_invalid_inputs" function with wrong
         DeepL Key.
     """
+    @pytest.mark.deepl
     @pytest.mark.parametrize("in_text, src_lang, tgt_lang, expected", [
         ("Baum", "Deutsch", "English", ("Tree", "DE")),
         ("Fernseher", "Deutsch", "Türkçe", ("Televizyon", "DE")),
@@ -401,6 +675,7 @@ class TestTranslateString:
         assert translate_string(auth_key=auth_key, in_text=in_text,
                                 src_lang="", tgt_lang=tgt_lang) == expected
 
+    @pytest.mark.deepl
     @pytest.mark.parametrize("in_text, src_lang, tgt_lang, error_msg", [
         ("", "Deutsch", "English", "No text to translate were found."),
         ("Tree", "English", "abc", "Target Language is unknown."),
@@ -429,6 +704,7 @@ class TestTranslateString:
                 translate_string(auth_key=auth_key, in_text=in_text,
                                  src_lang=src_lang, tgt_lang=tgt_lang)
 
+    @pytest.mark.deepl
     def test_invalid_key(self):
         """
         Test the "test_invalid_inputs" function with wrong DeepL Key.
@@ -0,0 +1,160 @@
+import pytest
+from vocabulary_and_translation_gui import translation_prefetch
+from vocabulary_and_translation_gui.translation_prefetch import (
+    prefetch_translations,
+    request_translation,
+    translate_cached
+)
+
+
+@pytest.fixture()
+def requests(monkeypatch):
+    """Replace the DeepL requests and return the list of sent requests."""
+    sent = []
+
+    def fake_translate(auth_key, in_text, src_lang, tgt_lang):
+        sent.append(("translate_string", in_text, tgt_lang))
+        return in_text + " in " + tgt_lang, "DE"
+
+    def fake_request(auth_key, in_text, src_lang, tgt_lang):
+        sent.append(("prefetch", in_text, tgt_lang))
+        if in_text == "error":
+            raise ValueError("Quota exceeded")
+        return in_text + " in " + tgt_lang, "DE"
+
+    monkeypatch.setattr(translation_prefetch, "translate_string",
+                        fake_translate)
+    monkeypatch.setattr(translation_prefetch, "_request", fake_request)
+    return sent
+
+
+class TestTranslateCached:
+    """
+    Test cases for the "translate_cached" and "prefetch_translations"
+    functions.
+
+    This class defines test methods to ensure the functions in the
+    "translation_prefetch" module send each request only once and stay in
+    the budget.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_reuse: Test that a kept translation is not requested again.
+        - test_prefetch: Test using the translations requested in the
+        background.
+        - test_budget: Test that the speculative requests stay in the budget.
+        - test_failed_prefetch: Test translating again after a failed
+        speculative request.
+        - test_request_translation: Test translating in a background thread.
+    """
+    def test_reuse(self, requests):
+        """
+        Test that a kept translation is not requested again.
+
+        The expected output is one request for two translations of the same
+        text.
+
+        Args:
+        - requests (list): the sent requests
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert translate_cached("", "Haus", "Deutsch", "English") == (
+            "Haus in English", "DE")
+        assert translate_cached("", "Haus", "Deutsch", "English") == (
+            "Haus in English", "DE")
+        assert len(requests) == 1
+
+    def test_prefetch(self, requests):
+        """
+        Test using the translations requested in the background.
+
+        The expected output is the prefetched translations without a
+        request of translate_string.
+
+        Args:
+        - requests (list): the sent requests
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        translate_cached("", "Haus", "Deutsch", "English")
+        assert prefetch_translations("", "Haus", "Deutsch",
+                                     ["English", "Deutsch", "Türkçe"]) == 2
+        for lang in ["English", "Deutsch", "Türkçe"]:
+            assert translate_cached("", "Haus", "Deutsch", lang)[0] == (
+                "Haus in " + lang)
+        assert sorted(requests) == [("prefetch", "Haus", "Deutsch"),
+                                    ("prefetch", "Haus", "Türkçe"),
+                                    ("translate_string", "Haus", "English")]
+
+    def test_budget(self, requests, monkeypatch):
+        """
+        Test that the speculative requests stay in the budget.
+
+        The expected output is only the requests that fit into the budget.
+
+        Args:
+        - requests (list): the sent requests
+        - monkeypatch (pytest.MonkeyPatch): fixture to change the budget
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        monkeypatch.setattr(translation_prefetch,
+                            "PREFETCH_CHARACTER_BUDGET", 10)
+        assert prefetch_translations("", "Haus", "Deutsch",
+                                     ["English", "Türkçe"]) == 2
+        assert prefetch_translations("", "Buch", "Deutsch",
+                                     ["English", "Türkçe"]) == 0
+
+    def test_failed_prefetch(self, requests):
+        """
+        Test translating again after a failed speculative request.
+
+        The expected output is the translation of translate_string.
+
+        Args:
+        - requests (list): the sent requests
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        prefetch_translations("", "error", "Deutsch", ["English"])
+        assert translate_cached("", "error", "Deutsch", "English") == (
+            "error in English", "DE")
+        assert requests == [("prefetch", "error", "English"),
+                            ("translate_string", "error", "English")]
+
+    def test_request_translation(self, requests):
+        """
+        Test translating in a background thread.
+
+        The expected output is a kept translation for translate_cached and
+        the error of a failed request, which is not kept.
+
+        Args:
+        - requests (list): the sent requests
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert request_translation("", "Haus", "Deutsch", "English") == (
+            "Haus in English", "DE")
+        assert translate_cached("", "Haus", "Deutsch", "English") == (
+            "Haus in English", "DE")
+        with pytest.raises(ValueError):
+            request_translation("", "error", "Deutsch", "English")
+        with pytest.raises(ValueError):
+            request_translation("", "error", "Deutsch", "English")
+        assert requests == [("prefetch", "Haus", "English"),
+                            ("prefetch", "error", "English"),
+                            ("prefetch", "error", "English")]
@@ -0,0 +1,244 @@
+import datetime
+import os
+import pytest
+import time
+from vocabulary_and_translation_gui.save_list import (
+    vocabulary_frame,
+    write_apkg_stream,
+    write_xlsx_stream
+)
+from vocabulary_and_translation_gui.vocabulary_entry import (
+    VocabularyEntry,
+    entries_frame,
+    to_entries,
+    to_word_list
+)
+from vocabulary_and_translation_gui.vocabulary_index import (
+    drop_duplicate_entries,
+    read_xlsx_keys
+)
+
+# Time of the test entries
+ADDED = datetime.datetime(2023, 3, 1, 12, 30, 15, 250)
+
+
+@pytest.fixture()
+def berlin_time(monkeypatch):
+    """Use the time zone of Berlin with daylight saving time as local time."""
+    monkeypatch.setenv("TZ", "Europe/Berlin")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+class TestVocabularyEntry:
+    """
+    Test cases for the "VocabularyEntry" class.
+
+    This class defines test methods to ensure an entry of the
+    "vocabulary_entry" module behaves like the list shape of the vocabulary
+    list.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_from_list: Test creating entries from different timestamps.
+        - test_list_shape: Test indexing, length and comparison of an entry.
+        - test_hash: Test that equal entries have the same hash.
+        - test_utc_timestamp: Test that the timestamps count from 1970-01-01
+        UTC.
+        - test_source: Test that the source languages are shared.
+        - test_wrong_length: Test that entries without four entries are
+        rejected.
+    """
+    @pytest.mark.parametrize("timestamp", [
+        ADDED,
+        ADDED.isoformat(),
+        ADDED.astimezone(datetime.timezone(datetime.timedelta(hours=5))),
+        int((ADDED.astimezone(datetime.timezone.utc)
+             - datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc))
+            / datetime.timedelta(microseconds=1)),
+    ])
+    def test_from_list(self, timestamp):
+        """
+        Test creating entries from different timestamps.
+
+        The expected output is the same entry for a local datetime, a
+        datetime with time zone, an ISO 8601 text and integer microseconds.
+
+        Args:
+        - timestamp (datetime.datetime, str or int): the timestamp
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        entry = VocabularyEntry.from_list(["the house", "Haus", "ev",
+                                           timestamp])
+        assert entry.to_list() == ["the house", "Haus", "ev", ADDED]
+        assert entry.datetime == ADDED
+        assert VocabularyEntry.from_list(entry) is entry
+
+    def test_list_shape(self):
+        """
+        Test indexing, length and comparison of an entry.
+
+        The expected output is the behaviour of the list
+        ["the house", "Haus", "ev", ADDED].
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        entry = VocabularyEntry.from_list(["the house", "Haus", "ev", ADDED])
+        assert len(entry) == 4
+        assert entry[0] == "the house"
+        assert entry[-2] == "ev"
+        assert entry[3] == ADDED
+        assert entry[:2] == ["the house", "Haus"]
+        assert list(entry) == ["the house", "Haus", "ev", ADDED]
+        assert entry == ["the house", "Haus", "ev", ADDED]
+        assert not hasattr(entry, "__dict__")
+
+    def test_hash(self):
+        """
+        Test that equal entries have the same hash.
+
+        The expected output is one entry in a set of equal entries and the
+        hash of the equal tuple.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        entry = VocabularyEntry.from_list(["the house", "Haus", "ev", ADDED])
+        same = VocabularyEntry.from_list(["the house", "Haus", "ev",
+                                          ADDED.isoformat()], source="DE")
+        other = VocabularyEntry.from_list(["the book", "Buch", "kitap",
+                                           ADDED])
+        assert len({entry, same, other}) == 2
+        assert hash(entry) == hash(("the house", "Haus", "ev", ADDED))
+        assert {entry: "house"}[same] == "house"
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"),
+                        reason="the time zone can't be changed")
+    def test_utc_timestamp(self, berlin_time):
+        """
+        Test that the timestamps count from 1970-01-01 UTC.
+
+        The expected output is the local time minus the UTC offset of winter
+        and summer time, and the same local times in the data frame.
+
+        Args:
+        - berlin_time (None): uses the time zone of Berlin
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        winter = datetime.datetime(2023, 1, 15, 12, 0)
+        summer = datetime.datetime(2023, 7, 15, 12, 0)
+        entries = to_entries([["the house", "Haus", "ev", winter],
+                              ["the book", "Buch", "kitap", summer]])
+        assert entries[0].timestamp == 1673780400000000
+        assert entries[1].timestamp == 1689415200000000
+        assert [entry.datetime for entry in entries] == [winter, summer]
+        assert list(entries_frame(entries)["Timestamp"]) == [winter, summer]
+
+    def test_source(self):
+        """
+        Test that the source languages are shared.
+
+        The expected output is one string object for the source language of
+        all entries.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        entries = to_entries([["the house", "Haus", "ev", ADDED],
+                              ["the book", "Buch", "kitap", ADDED]],
+                             source="".join(["D", "E"]))
+        assert entries[0].source == "DE"
+        assert entries[0].source is entries[1].source
+        assert to_word_list(entries)[1] == ["the book", "Buch", "kitap",
+                                            ADDED]
+
+    def test_wrong_length(self):
+        """
+        Test that entries without four entries are rejected.
+
+        The expected output is a ValueError.
+
+        Raises:
+        - AssertionError: if no ValueError is raised
+        """
+        with pytest.raises(ValueError):
+            VocabularyEntry.from_list(["the house", "Haus", "ev"])
+
+
+class TestEntriesFrame:
+    """
+    Test cases for the "entries_frame" function.
+
+    This class defines test methods to ensure the "entries_frame" function
+    in the "vocabulary_entry" module and the savers accept entries.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_entries_frame: Test the columns of the data frame.
+        - test_save_entries: Test saving entries to Excel and Anki files.
+    """
+    def test_entries_frame(self):
+        """
+        Test the columns of the data frame.
+
+        The expected output is the same data frame as for the list shape of
+        the entries.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        word_list = [["the house", "Haus", "ev", ADDED],
+                     ["the book", "Buch", "kitap", ADDED]]
+        df = entries_frame(to_entries(word_list))
+        assert list(df.columns) == ["Timestamp", "English", "Deutsch",
+                                    "Türkçe"]
+        assert str(df["Timestamp"].dtype) == "datetime64[us]"
+        assert df["Timestamp"][0] == ADDED
+        assert df.equals(vocabulary_frame(to_entries(word_list)))
+        assert list(entries_frame(to_entries(word_list),
+                                  with_timestamp=False).columns) == [
+            "English", "Deutsch", "Türkçe"]
+
+    def test_save_entries(self, tmpdir):
+        """
+        Test saving entries to Excel and Anki files.
+
+        The expected output is the files with the entries, and no entry is
+        saved twice.
+
+        Args:
+        - tmpdir (py.path.local): temporary directory
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        entries = to_entries([["the house", "Haus", "ev", ADDED],
+                              ["the house", "Haus", "ev", ADDED],
+                              ["the book", "Buch", "kitap", ADDED]])
+        entries = drop_duplicate_entries(entries)
+        assert len(entries) == 2
+
+        xlsx_path = os.path.join(str(tmpdir), "list.xlsx")
+        write_xlsx_stream(entries, xlsx_path)
+        assert len(read_xlsx_keys(xlsx_path)) == 2
+
+        apkg_path = os.path.join(str(tmpdir), "list.apkg")
+        assert write_apkg_stream(entries, apkg_path) == 2
@@ -0,0 +1,238 @@
+import os
+import pytest
+from vocabulary_and_translation_gui.save_list import write_xlsx_stream
+from vocabulary_and_translation_gui.vocabulary_index import (
+    drop_duplicate_entries,
+    entry_keys,
+    find_entry,
+    index_entries,
+    index_entries_in_background,
+    normalize_word,
+    read_xlsx_keys,
+    remove_entries,
+    search_entries,
+    search_fuzzy,
+    search_prefix
+)
+
+
+class TestFindEntry:
+    """
+    Test cases for the "find_entry" function.
+
+    This class defines test methods to ensure the "find_entry" function in
+    the "vocabulary_index" module finds the indexed translations.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_find_entry: Test looking up indexed and unknown words.
+        - test_remove_entries: Test removing edited or deleted entries.
+    """
+    @pytest.mark.parametrize("word, lang, found", [
+        ("Haus", "Deutsch", True),
+        ("  the   HOUSE ", "English", True),
+        ("ev", "Automatic language recognition", True),
+        ("ev", "Deutsch", False),
+        ("Buch", "Deutsch", False),
+    ])
+    def test_find_entry(self, word, lang, found):
+        """
+        Test looking up indexed and unknown words.
+
+        The expected output is the indexed entry for a known word in the
+        language and None otherwise.
+
+        Args:
+        - word (str): the word to look up
+        - lang (str): the language of the word
+        - found (bool): True if the entry should be found
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        entry = ["the house", "Haus", "ev", "2023-03-01"]
+        index_entries([entry])
+        assert (find_entry(word, lang) is entry) is found
+        assert normalize_word(" Das  Haus ") == "das haus"
+
+    def test_remove_entries(self):
+        """
+        Test removing edited or deleted entries.
+
+        The expected output is None for the words of a removed entry and the
+        entry of another word with the same translation.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        house = ["house", "Haus", "ev", "2023-03-01"]
+        home = ["home", "Zuhause", "ev", "2023-03-02"]
+        index_entries([house, home])
+        remove_entries([list(home)])
+        assert find_entry("Zuhause", "Deutsch") is None
+        assert find_entry("ev", "Türkçe") is house
+
+
+class TestSearchEntries:
+    """
+    Test cases for the search functions.
+
+    This class defines test methods to ensure the "search_prefix",
+    "search_fuzzy" and "search_entries" functions in the "vocabulary_index"
+    module find the indexed entries.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_search_prefix: Test finding words by their beginning.
+        - test_search_fuzzy: Test finding similar words.
+        - test_update_search: Test that the search follows the index.
+        - test_remove_several: Test the search after removing several
+        entries.
+    """
+    def test_search_prefix(self):
+        """
+        Test finding words by their beginning.
+
+        The expected output is the entries in alphabetical order of the
+        found words, also for single words of an expression.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        house = ["the house", "Haus", "ev", "2023-03-01"]
+        home = ["home", "Zuhause", "ev", "2023-03-02"]
+        book = ["book", "Buch", "kitap", "2023-03-03"]
+        index_entries([house, home, book])
+        assert search_prefix("HO") == [home, house]
+        assert search_prefix("ev") == [house, home]
+        assert search_prefix("ho", limit=1) == [home]
+        assert search_prefix("x") == []
+        assert search_prefix(" ") == []
+
+    def test_search_fuzzy(self):
+        """
+        Test finding similar words.
+
+        The expected output is the entries with similar words, the most
+        similar first, and no entries below the threshold.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        house = ["house", "Haus", "ev", "2023-03-01"]
+        mouse = ["mouse", "Maus", "fare", "2023-03-02"]
+        index_entries([mouse, house])
+        assert search_fuzzy("housse") == [house]
+        assert search_fuzzy("housse", threshold=0.1) == [house, mouse]
+        assert search_fuzzy("kitap") == []
+        assert search_entries("mo") == [mouse]
+        assert search_entries("hause") == [house]
+
+    def test_update_search(self):
+        """
+        Test that the search follows the index.
+
+        The expected output is no result for removed entries and the
+        entries indexed in the background.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        house = ["house", "Haus", "ev", "2023-03-01"]
+        index_entries([house])
+        remove_entries([list(house)])
+        assert search_entries("house") == []
+
+        entries = [[f"word {i}", f"Wort {i}", f"kelime {i}", "2023-03-01"]
+                   for i in range(250)]
+        index_entries_in_background(entries, chunk_size=100).join()
+        assert len(search_prefix("wort", limit=1000)) == 250
+        assert search_prefix("wort 42") == [entries[42]]
+        index_entries([house])
+        assert search_entries("house") == [house]
+
+    def test_remove_several(self):
+        """
+        Test the search after removing several entries.
+
+        The expected output is only the kept entries for the words of every
+        language, found by their beginning and by similar words.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        house = ["house", "Haus", "ev", "2023-03-01"]
+        mouse = ["mouse", "Maus", "fare", "2023-03-02"]
+        horse = ["horse", "Pferd", "at", "2023-03-03"]
+        home = ["home", "Zuhause", "ev", "2023-03-04"]
+        index_entries([house, mouse, horse, home])
+        remove_entries([list(house), list(horse)])
+        assert search_prefix("ho") == [home]
+        assert search_prefix("ha") == []
+        assert search_prefix("pf") == []
+        assert search_prefix("ev") == [home]
+        assert search_fuzzy("housse", threshold=0.1) == [home, mouse]
+        assert search_fuzzy("Maus") == [mouse]
+        assert find_entry("Zuhause", "Deutsch") == home
+        assert find_entry("Haus", "Deutsch") is None
+
+
+class TestDropDuplicateEntries:
+    """
+    Test cases for the "drop_duplicate_entries" function.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_duplicates: Test removing duplicated entries of a list.
+        - test_known_keys: Test removing entries that are in an Excel file.
+    """
+    def test_duplicates(self):
+        """
+        Test removing duplicated entries of a list.
+
+        The expected output is the first entry of each normalized key.
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        word_list = [["house", "Haus", "ev", "2023-03-01"],
+                     ["book", "Buch", "kitap", "2023-03-02"],
+                     ["House", "haus ", "EV", "2023-03-03"]]
+        assert drop_duplicate_entries(word_list) == word_list[:2]
+        assert len(entry_keys([])) == 0
+        assert drop_duplicate_entries([]) == []
+
+    def test_known_keys(self, tmp_path):
+        """
+        Test removing entries that are in an Excel file.
+
+        The expected output are only the entries which are not in the file.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the file
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        path = os.path.join(tmp_path, "test.xlsx")
+        write_xlsx_stream([["house", "Haus", "ev", "2023-03-01"]], path)
+        known_keys = read_xlsx_keys(path)
+        assert read_xlsx_keys(os.path.join(tmp_path, "other.xlsx")) == set()
+        assert drop_duplicate_entries(
+            [["HOUSE", "Haus", "ev", "2023-03-02"],
+             ["book", "Buch", "kitap", "2023-03-02"]], known_keys
+        ) == [["book", "Buch", "kitap", "2023-03-02"]]
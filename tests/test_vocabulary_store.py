@@ -0,0 +1,222 @@
+import datetime
+import os
+import pytest
+import sqlite3
+from vocabulary_and_translation_gui.vocabulary_store import (
+    add_entries,
+    add_entry,
+    close_stores,
+    delete_entry,
+    get_entries,
+    get_unexported_entries,
+    get_unsaved_entries,
+    mark_exported,
+    open_store,
+    update_entry
+)
+
+# Entries of the vocabulary list with real timestamps
+HOUSE = ["house", "Haus", "ev", datetime.datetime(2023, 3, 1)]
+BOOK = ["book", "Buch", "kitap", datetime.datetime(2023, 3, 2, 10, 30)]
+
+
+@pytest.fixture()
+def store_path(tmp_path):
+    """Return the path of a new store and close it after the test."""
+    yield os.path.join(tmp_path, "store", "vocabulary.sqlite3")
+    close_stores()
+
+
+class TestAddEntry:
+    """
+    Test cases for the "add_entry" function.
+
+    This class defines test methods to ensure the "add_entry" function in
+    the "vocabulary_store" module stores each entry once and durably.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_add_entry: Test adding new and duplicated entries.
+        - test_add_entries: Test adding many entries at once.
+        - test_reopen_store: Test that the entries are kept after closing the
+        store.
+    """
+    def test_add_entry(self, store_path):
+        """
+        Test adding new and duplicated entries.
+
+        The expected output is True for new words, False for duplicates and
+        the entries with their timestamps in the order they were added.
+
+        Args:
+        - store_path (str): the path of the store
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        assert add_entry(HOUSE, store_path) is True
+        assert add_entry(BOOK, store_path) is True
+        assert add_entry(HOUSE[:3] + [datetime.datetime(2023, 3, 3)],
+                         store_path) is False
+        assert get_entries(store_path) == [HOUSE, BOOK]
+
+    def test_add_entries(self, store_path):
+        """
+        Test adding many entries at once.
+
+        The expected output is the list of the entries that were not yet in
+        the store.
+
+        Args:
+        - store_path (str): the path of the store
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        add_entry(HOUSE, store_path)
+        assert add_entries([HOUSE, BOOK, BOOK], store_path) == [BOOK]
+        assert get_entries(store_path) == [HOUSE, BOOK]
+
+    def test_reopen_store(self, store_path):
+        """
+        Test that the entries are kept after closing the store.
+
+        The expected output is the entry in a store in WAL mode.
+
+        Args:
+        - store_path (str): the path of the store
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        add_entry(HOUSE, store_path)
+        close_stores()
+        connection = sqlite3.connect(store_path)
+        assert connection.execute(
+            "SELECT english FROM entries").fetchall() == [("house",)]
+        connection.close()
+        assert open_store(store_path).execute(
+            "PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+class TestChangeEntry:
+    """
+    Test cases for the "update_entry" and "delete_entry" functions.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_update_entry: Test replacing the words of an entry.
+        - test_delete_entry: Test deleting an entry.
+    """
+    def test_update_entry(self, store_path):
+        """
+        Test replacing the words of an entry.
+
+        The expected output is the entry with the new words and the old
+        timestamp, and False if the new words are already stored.
+
+        Args:
+        - store_path (str): the path of the store
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        add_entry(HOUSE, store_path)
+        add_entry(BOOK, store_path)
+        new_house = ["the house", "Haus", "ev", HOUSE[3]]
+        assert update_entry(HOUSE, new_house, store_path) is True
+        assert update_entry(new_house, BOOK, store_path) is False
+        assert update_entry(HOUSE, new_house, store_path) is False
+        assert get_entries(store_path) == [new_house, BOOK]
+
+    def test_delete_entry(self, store_path):
+        """
+        Test deleting an entry.
+
+        The expected output is True for a stored entry and False otherwise.
+
+        Args:
+        - store_path (str): the path of the store
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        add_entry(HOUSE, store_path)
+        add_entry(BOOK, store_path)
+        assert delete_entry(HOUSE, store_path) is True
+        assert delete_entry(HOUSE, store_path) is False
+        assert get_entries(store_path) == [BOOK]
+
+
+class TestExportWatermark:
+    """
+    Test cases for the export watermarks of the vocabulary store.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_unexported_entries: Test that only new entries are exported to
+        a file.
+        - test_unsaved_entries: Test the entries that are not in any file.
+    """
+    def test_unexported_entries(self, tmp_path, store_path):
+        """
+        Test that only new entries are exported to a file.
+
+        The expected output are all entries for a new file and only the
+        entries added after the last export otherwise.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the files
+        - store_path (str): the path of the store
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        target = os.path.join(tmp_path, "test.xlsx")
+        add_entry(HOUSE, store_path)
+        entries, last_id = get_unexported_entries(target, store_path)
+        assert len(entries) == 1
+        mark_exported(target, last_id, store_path)
+
+        add_entry(BOOK, store_path)
+        assert get_unexported_entries(target, store_path) == ([BOOK], 2)
+        entries, _ = get_unexported_entries(
+            os.path.join(tmp_path, "test.apkg"), store_path)
+        assert len(entries) == 2
+
+    def test_unsaved_entries(self, tmp_path, store_path):
+        """
+        Test the entries that are not in any file.
+
+        The expected output are the entries after the last export and an
+        unchanged watermark for an older export.
+
+        Args:
+        - tmp_path (pathlib.Path): the temporary folder for the files
+        - store_path (str): the path of the store
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        target = os.path.join(tmp_path, "test.xlsx")
+        add_entry(HOUSE, store_path)
+        add_entry(BOOK, store_path)
+        mark_exported(target, 1, store_path)
+        assert get_unsaved_entries(store_path) == [BOOK]
+
+        mark_exported(target, 2, store_path)
+        mark_exported(target, 1, store_path)
+        assert get_unsaved_entries(store_path) == []
@@ -0,0 +1,166 @@
+import datetime
+import pytest
+import tkinter as tk
+from vocabulary_and_translation_gui.vocabulary_entry import to_entries
+from vocabulary_and_translation_gui.vocabulary_view import VocabularyView
+
+
+@pytest.fixture()
+def word_list():
+    """Return a word list with more entries than visible rows."""
+    return to_entries([[f"word {i}", f"Wort {i}", f"kelime {i}",
+                        datetime.datetime(2023, 3, 1)] for i in range(25)])
+
+
+class TestVocabularyView:
+    """
+    Test cases for the "VocabularyView" class.
+
+    This class defines test methods to ensure the "VocabularyView" class in
+    the "vocabulary_view" module shows only the visible rows and edits and
+    deletes entries.
+
+    Attributes:
+        - None
+
+    Methods:
+        - test_visible_rows: Test that only the visible entries are shown.
+        - test_edit_entry: Test editing an entry.
+        - test_edit_window: Test editing an entry in the window while the
+        word list changes.
+        - test_delete_entries: Test deleting entries.
+    """
+    def test_visible_rows(self, word_list):
+        """
+        Test that only the visible entries are shown.
+
+        The expected output is one table row for each visible entry, also
+        after new entries were appended.
+
+        Args:
+        - word_list (list): the shown word list
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        view = VocabularyView(entries=word_list, rows=10)
+        rows = view.table.get_children()
+        assert len(rows) == 10
+        assert view.table.item(rows[0], "values")[0] == "word 0"
+
+        word_list.extend(to_entries([["new", "neu", "yeni",
+                                      datetime.datetime(2023, 3, 2)]]))
+        view.refresh(scroll_to_end=True)
+        rows = view.table.get_children()
+        assert len(rows) == 10
+        assert view.first == 16
+        assert view.table.item(rows[-1], "values")[0] == "new"
+
+        view.scroll_to(100)
+        assert view.first == 16
+        view.destroy()
+
+    def test_edit_entry(self, word_list):
+        """
+        Test editing an entry.
+
+        The expected output is the new words with the old timestamp and a
+        call of on_edit with the old and the new entry.
+
+        Args:
+        - word_list (list): the shown word list
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        edits = []
+        view = VocabularyView(entries=word_list, rows=10,
+                              on_edit=lambda old, new: edits.append(
+                                  (old, new)))
+        view.edit_entry(1, ["house", "Haus", "ev"])
+        assert word_list[1] == ["house", "Haus", "ev",
+                                datetime.datetime(2023, 3, 1)]
+        assert edits[0][0][0] == "word 1"
+        assert edits[0][1] is word_list[1]
+        assert view.table.item(view.table.get_children()[1],
+                               "values")[0] == "house"
+        view.destroy()
+
+    def test_edit_window(self, word_list):
+        """
+        Test editing an entry in the window while the word list changes.
+
+        The expected output is the new words in the entry that was opened,
+        also if earlier entries were deleted before saving, and no change if
+        the opened entry was deleted.
+
+        Args:
+        - word_list (list): the shown word list
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        def open_window():
+            # Open the window of the selected entry and return its fields
+            # and the save button
+            view._edit_selected()
+            window = view.winfo_children()[-1]
+            fields = [child for child in window.winfo_children()
+                      if isinstance(child, tk.Entry)]
+            buttons = [child for child in window.winfo_children()
+                       if isinstance(child, tk.Button)]
+            return fields, buttons[0]
+
+        edits = []
+        view = VocabularyView(entries=word_list, rows=10,
+                              on_edit=lambda old, new: edits.append(
+                                  (old, new)))
+        view.table.selection_set(view.table.get_children()[5])
+        fields, save = open_window()
+        assert fields[0].get() == "word 5"
+        view.delete_entries([0, 1])
+        fields[0].delete(0, tk.END)
+        fields[0].insert(0, "house")
+        save.invoke()
+        assert word_list[3][0] == "house"
+        assert word_list[5][0] == "word 7"
+        assert edits[0][0][0] == "word 5"
+
+        view.table.selection_set(view.table.get_children()[3])
+        fields, save = open_window()
+        view.delete_entries([3])
+        fields[0].delete(0, tk.END)
+        fields[0].insert(0, "tree")
+        save.invoke()
+        assert "tree" not in [entry[0] for entry in word_list]
+        assert len(edits) == 1
+        view.destroy()
+
+    def test_delete_entries(self, word_list):
+        """
+        Test deleting entries.
+
+        The expected output is the word list without the deleted entries and
+        a call of on_delete for each entry.
+
+        Args:
+        - word_list (list): the shown word list
+
+        Raises:
+        - AssertionError: if the output of the function does not match the
+        expected value
+        """
+        deleted = []
+        view = VocabularyView(entries=word_list, rows=10,
+                              on_delete=deleted.append)
+        view.table.selection_set(view.table.get_children()[2:4])
+        assert view.selected_indices() == [2, 3]
+        view.delete_entries(view.selected_indices())
+        assert len(word_list) == 23
+        assert [entry[0] for entry in deleted] == ["word 3", "word 2"]
+        assert view.table.item(view.table.get_children()[2],
+                               "values")[0] == "word 4"
+        view.destroy()